@@ -1,9 +1,9 @@
 from pathlib import Path
 
 import cv2
-import pickle
 import numpy as np
-import os
+
+from faceGallery import load_gallery
 
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data"
@@ -39,24 +39,7 @@ cv2.destroyAllWindows()
 facesList= np.asarray(facesList) 
 facesList= facesList.reshape(100,-1)
 
-if "listNames.pkl" not in os.listdir(DATA_DIR):
-    names= [name]*100
-    with open(DATA_DIR / "listNames.pkl", 'wb') as f: 
-        pickle.dump(names, f)
-else:
-    with open(DATA_DIR / "listNames.pkl", 'rb') as f: 
-        names= pickle.load(f)
-    names= names+[name]*100
-    with open(DATA_DIR / "listNames.pkl", 'wb') as f: 
-        pickle.dump(names, f)
-    
-
-if "listFaces.pkl" not in os.listdir(DATA_DIR):
-    with open(DATA_DIR / "listFaces.pkl", 'wb') as f: 
-        pickle.dump(facesList, f)
-else:
-    with open(DATA_DIR / "listFaces.pkl", 'rb') as f: 
-        faces= pickle.load(f)
-    faces= np.append(faces, facesList, axis=0)
-    with open(DATA_DIR / "listFaces.pkl", 'wb') as f: 
-        pickle.dump(faces, f)
+# Enrol as a new gallery segment (see faceGallery.py); a running recognizer picks it up live
+gallery = load_gallery(DATA_DIR, create=True)
+segment = gallery.enrol(name, facesList)
+print(f"Enrolled {name} as {segment.name}")
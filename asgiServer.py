@@ -0,0 +1,233 @@
+# asgiServer.py
+"""
+Async (ASGI) variant of server.py for many concurrent kiosks and dashboards.
+
+    python asgiServer.py                      # uvicorn on port 5006, same API as server.py
+    python asgiServer.py --port 5007 --keep-alive 120
+    uvicorn asgiServer:app --port 5006       # or any other ASGI server (one worker: SQLite has one writer)
+
+Same contract as server.py: POST /attendance and /attendance/bulk, GET
+/attendance, /attendance/range, /attendance/summary, /attendance/stats and the
+/attendance/stream Server-Sent Events feed, with the same JSON bodies, status
+codes, ETags and headers.
+
+One event loop holds every connection, so thousands of idle keep-alive
+kiosks and open dashboard streams cost a socket each, not a thread each.
+Writes go to a GroupCommitWriter thread (F1_INGEST=flush by default, or
+enqueue; F1_FLUSH_EVENTS / F1_FLUSH_MS as in server.py) and are awaited
+without blocking the loop. Reads run on a small pool of threads, each with
+its own WAL connection (F1_READ_THREADS, default 4).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from attendanceFeed import HEARTBEAT, AsyncAttendanceFeed, format_event
+from attendanceStore import AttendanceStore, last_id, select_checkins, summarize
+from attendanceWriter import GroupCommitWriter
+
+PORT = 5006
+
+store = AttendanceStore()
+feed = AsyncAttendanceFeed()
+INGEST_MODE = os.environ.get("F1_INGEST", "flush")
+writer: GroupCommitWriter | None = None
+readers = ThreadPoolExecutor(int(os.environ.get("F1_READ_THREADS", 4)), thread_name_prefix="attendance-read")
+
+
+async def read(fn, *args):
+    """Run a query function with this reader thread's connection as its first argument."""
+    return await asyncio.get_running_loop().run_in_executor(readers, lambda: fn(store.connection(), *args))
+
+
+def error(message: str, status: int = 400) -> JSONResponse:
+    return JSONResponse({"status": "error", "message": message}, status)
+
+
+def etag_matches(request, etag: str) -> bool:
+    """Weak comparison against If-None-Match, as werkzeug's contains_weak does for server.py."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/").strip('"') for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def with_etag(response: Response, etag: str, newest: int) -> Response:
+    response.headers["ETag"] = f'W/"{etag}"'
+    response.headers["X-Last-Id"] = str(newest)
+    return response
+
+
+async def json_body(request):
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+async def store_rows(rows):
+    """Insert (driver_name, timestamp, event_id) rows; returns (rows stored or None if only queued, HTTP status)."""
+    if INGEST_MODE == "enqueue":
+        return writer.submit(rows), 202
+    return await asyncio.wrap_future(writer.submit_future(rows)), 200
+
+
+async def log_attendance(request):
+    data = await json_body(request)
+    if not isinstance(data, dict):
+        return error("expected {driver_name, timestamp}")
+    driver = data.get("driver_name")
+    timestamp = data.get("timestamp") or datetime.now().isoformat()
+    _, status = await store_rows([(driver, timestamp, None)])
+    return JSONResponse({"status": "success"}, status)
+
+
+async def log_attendance_bulk(request):
+    data = await json_body(request)
+    events = data.get("events") if isinstance(data, dict) else data
+    if not isinstance(events, list) or not all(isinstance(e, dict) and e.get("driver_name") for e in events):
+        return error("expected a list of {driver_name, timestamp, event_id}")
+    now = datetime.now().isoformat()
+    rows = [(e["driver_name"], e.get("timestamp") or now, e.get("event_id")) for e in events]
+    stored, status = await store_rows(rows)
+    return JSONResponse({"status": "success", "received": len(rows), "stored": stored}, status)
+
+
+async def ingest_stats(request):
+    return JSONResponse({"mode": INGEST_MODE, **writer.stats()})
+
+
+async def query_attendance(request, days, default_order="DESC"):
+    """GET /attendance and /attendance/range; see server.query_attendance for the parameters."""
+    args = request.query_params
+    try:
+        after_id, limit = (int(args[k]) if k in args else None for k in ("after_id", "limit"))
+    except ValueError:
+        return error("after_id and limit must be integers")
+
+    newest = await read(last_id)
+    key = sorted((k, v) for k, v in args.items() if k != "after_id")
+    query_key = zlib.crc32(repr((request.url.path, days, key)).encode())
+    etag = f"{newest}-{query_key:x}"
+    if etag_matches(request, etag):
+        response = Response(status_code=304)
+    else:
+        result, truncated = await read(select_checkins, days, after_id, limit, args.get("driver"),
+                                       args.get("since"), args.get("until"), default_order)
+        if after_id is not None and truncated:
+            etag = f"{result[-1]['id']}-{query_key:x}"
+        response = JSONResponse(result)
+    response.headers["X-Attendance-Day"] = days[0] if days[0] == days[1] else f"{days[0]}..{days[1]}"
+    return with_etag(response, etag, newest)
+
+
+async def view_attendance(request):
+    day = request.query_params.get("day") or store.today()
+    return await query_attendance(request, (day, day))
+
+
+async def view_attendance_range(request):
+    first, last = request.query_params.get("from"), request.query_params.get("to") or store.today()
+    if not first:
+        return error("'from' (YYYY-MM-DD) is required")
+    return await query_attendance(request, (first, last), default_order="ASC")
+
+
+async def attendance_summary(request):
+    args = request.query_params
+    first = args.get("from") or args.get("day") or store.today()
+    last = args.get("to") or (first if "from" not in args else store.today())
+    newest = await read(last_id)
+    etag = f"{newest}-{zlib.crc32(repr((request.url.path, first, last)).encode()):x}"
+    if etag_matches(request, etag):
+        return with_etag(Response(status_code=304), etag, newest)
+    summary = await read(summarize, first, last)
+    return with_etag(JSONResponse({**summary, "last_id": newest}), etag, newest)
+
+
+async def stream_attendance(request):
+    try:
+        after_id = int(request.headers.get("last-event-id") or request.query_params.get("after_id") or 0)
+    except ValueError:
+        return error("after_id must be an integer")
+    fixed_day = request.query_params.get("day")
+
+    async def events(after_id):
+        day = None
+        version = feed.version
+        while True:
+            today = fixed_day or store.today()
+            if today != day:
+                day = today
+                yield format_event(day, event="day")
+            rows, truncated = await read(select_checkins, (day, day), after_id)
+            if rows:
+                after_id = rows[-1]["id"]
+                yield format_event(rows, event="checkin", event_id=after_id)
+                if truncated:
+                    continue
+            seen, version = version, await feed.wait(version, HEARTBEAT)
+            if version == seen:
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(events(after_id), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global writer
+    loop = asyncio.get_running_loop()
+    writer = GroupCommitWriter(store, max_batch=int(os.environ.get("F1_FLUSH_EVENTS", 256)),
+                               max_delay_ms=float(os.environ.get("F1_FLUSH_MS", 2)), durability=INGEST_MODE,
+                               on_commit=lambda: loop.call_soon_threadsafe(feed.notify))
+    await read(lambda conn: None)  # create the schema before the first request
+    try:
+        yield
+    finally:
+        writer.close()
+
+
+app = Starlette(
+    routes=[
+        Route("/attendance", log_attendance, methods=["POST"]),
+        Route("/attendance", view_attendance, methods=["GET"]),
+        Route("/attendance/bulk", log_attendance_bulk, methods=["POST"]),
+        Route("/attendance/stats", ingest_stats, methods=["GET"]),
+        Route("/attendance/range", view_attendance_range, methods=["GET"]),
+        Route("/attendance/summary", attendance_summary, methods=["GET"]),
+        Route("/attendance/stream", stream_attendance, methods=["GET"]),
+    ],
+    middleware=[Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"],
+                           expose_headers=["ETag", "X-Last-Id", "X-Attendance-Day"])],
+    lifespan=lifespan,
+)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Async attendance API (same endpoints as server.py).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--keep-alive", type=int, default=75, help="seconds an idle keep-alive connection stays open")
+    parser.add_argument("--backlog", type=int, default=4096, help="pending connections the socket queues")
+    parser.add_argument("--access-log", action="store_true", help="log every request (slows high-rate ingest)")
+    args = parser.parse_args()
+    print("ASGI attendance API starting...")
+    uvicorn.run(app, host=args.host, port=args.port, timeout_keep_alive=args.keep_alive,
+                backlog=args.backlog, access_log=args.access_log)
@@ -0,0 +1,177 @@
+# attendanceFeed.py
+"""
+Push channel for new check-ins: Server-Sent Events from server.py to the dashboard.
+
+Server side, every ingest path calls `AttendanceFeed.notify()` right after its
+commit. Each GET /attendance/stream connection waits on the feed, then sends
+only the rows with an id above the last one it sent, as one SSE event:
+
+    id: 1234
+    event: checkin
+    data: [{"id": 1233, "driver_name": "...", "timestamp": "..."}, ...]
+
+An `event: day` message opens the stream and marks each midnight. Comment
+lines keep idle connections alive. A client that reconnects with
+Last-Event-ID (or ?after_id=) resumes without gaps or duplicates.
+
+Client side, `FeedListener` holds one streaming connection in a background
+thread, reconnects with backoff, and keeps the day's count plus its latest
+KEEP rows, which is all the dashboard renders.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import threading
+from collections import deque
+
+HEARTBEAT = 15.0  # seconds between keep-alive comments on an idle stream
+KEEP = 500  # check-ins FeedListener holds; older ones are only counted
+
+
+class AttendanceFeed:
+    """Version counter the stream handlers wait on; bumped after every commit."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.version = 0
+
+    def notify(self) -> None:
+        with self._cond:
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        """Block until the version moves past `seen` or `timeout` passes; returns the current version."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != seen, timeout)
+            return self.version
+
+
+class AsyncAttendanceFeed:
+    """AttendanceFeed for asgiServer.py: same counter, awaited on the event loop instead of a thread."""
+
+    def __init__(self):
+        self._changed = asyncio.Event()
+        self.version = 0
+
+    def notify(self) -> None:
+        """Call on the event loop thread."""
+        self.version += 1
+        self._changed.set()
+        self._changed = asyncio.Event()  # waiters hold the event that was set; later ones get a fresh one
+
+    async def wait(self, seen: int, timeout: float) -> int:
+        if self.version == seen:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.version
+
+
+def format_event(data, event: str | None = None, event_id: int | None = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def parse_events(lines):
+    """Turn an iterable of SSE text lines into {"event", "id", "data"} dicts."""
+    event = {}
+    for line in lines:
+        if line is None:
+            continue
+        if not line:
+            if "data" in event:
+                event["data"] = json.loads(event["data"])
+                yield event
+            event = {}
+        elif line.startswith(":"):
+            continue  # keep-alive comment
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "data":
+                event["data"] = event["data"] + "\n" + value if "data" in event else value
+            elif field in ("event", "id"):
+                event[field] = value
+
+
+class FeedListener:
+    """Background SSE consumer. rows_since(n) returns the check-ins received after the first n."""
+
+    def __init__(self, url: str, params: dict | None = None, session=None, max_backoff: float = 10.0,
+                 keep: int = KEEP):
+        self.url = url
+        self.params = params or {}
+        self.session = session
+        self.max_backoff = max_backoff
+        self.day: str | None = None
+        self.rows: deque[dict] = deque(maxlen=keep)
+        self.total = 0  # the day's check-ins, including those rotated out of `rows`
+        self.last_id = 0
+        self.connected = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="attendance-feed", daemon=True)
+
+    def start(self) -> "FeedListener":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def apply(self, event: dict) -> None:
+        with self._lock:
+            if event.get("event") == "day":
+                if event["data"] != self.day:  # a new day starts with an empty table
+                    self.day, self.total = event["data"], 0
+                    self.rows.clear()
+            elif event.get("event") == "checkin":
+                self.rows.extend(event["data"])
+                self.total += len(event["data"])
+                self.last_id = int(event.get("id") or event["data"][-1]["id"])
+
+    def rows_since(self, seen: int) -> tuple[str | None, list[dict], int]:
+        """(day, that day's rows after the first `seen`, total); start again from 0 when the day changes.
+
+        A negative `seen` slices from the end: rows_since(-10) is the latest ten. Only the
+        last `keep` rows are held, so a reader further behind than that gets just those.
+        """
+        with self._lock:
+            first = self.total - len(self.rows)  # day index of rows[0]
+            start = len(self.rows) + seen if seen < 0 else seen - first
+            return self.day, list(itertools.islice(self.rows, max(start, 0), None)), self.total
+
+    def _run(self) -> None:
+        if self.session is None:
+            import requests
+
+            self.session = requests.Session()
+        backoff = 0.5
+        while not self._stop.is_set():
+            headers = {"Accept": "text/event-stream"}
+            if self.last_id:
+                headers["Last-Event-ID"] = str(self.last_id)
+            try:
+                with self.session.get(self.url, params=self.params, headers=headers, stream=True,
+                                      timeout=(3, HEARTBEAT * 2)) as response:
+                    response.raise_for_status()
+                    self.connected, backoff = True, 0.5
+                    for event in parse_events(response.iter_lines(decode_unicode=True)):
+                        self.apply(event)
+                        if self._stop.is_set():
+                            return
+            except Exception as e:  # server restarting, network blip, read timeout
+                print(f"[feed] stream interrupted, reconnecting: {e}")
+            self.connected = False
+            self._stop.wait(backoff)
+            backoff = min(self.max_backoff, backoff * 2)
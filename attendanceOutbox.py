@@ -0,0 +1,136 @@
+# attendanceOutbox.py
+"""
+Durable, batched delivery of attendance events to server.py.
+
+The recognizer only calls `enqueue()`, which is a single local SQLite insert,
+so a slow or dead server can never stall the video loop. A background sender
+thread drains the spool in batches of up to `batch_size` events per
+POST /attendance/bulk over one pooled `requests.Session`, with connect/read
+timeouts, and backs off exponentially (with jitter) while the server is
+unreachable. Events are deleted from the spool only after the server
+acknowledged them, so they survive crashes and restarts; each carries an
+`event_id` the server uses to ignore re-sent duplicates.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+SPOOL_PATH = ROOT_DIR / "Attendance" / "outbox.db"
+BULK_URL = "http://localhost:5006/attendance/bulk"  # make sure this matches your server.py
+
+
+def _session():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # One keep-alive connection to server.py; retries are handled by the sender loop, not urllib3
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
+    return session
+
+
+class AttendanceOutbox:
+    def __init__(self, spool_path: Path = SPOOL_PATH, url: str = BULK_URL, batch_size: int = 50,
+                 flush_interval: float = 1.0, timeout: tuple[float, float] = (2.0, 5.0),
+                 max_backoff: float = 60.0, session=None):
+        self.url = url
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.session = session
+        self.sent = 0
+        self.failures = 0
+        Path(spool_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(spool_path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT NOT NULL,
+                driver_name TEXT NOT NULL,
+                timestamp TEXT NOT NULL
+            )
+        """)
+        self._lock = threading.Lock()  # one connection shared by the caller and the sender thread
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------ producer
+    def enqueue(self, driver_name: str, timestamp: str | None = None) -> None:
+        """Spool one event; returns immediately."""
+        with self._lock:
+            self._db.execute("INSERT INTO outbox (event_id, driver_name, timestamp) VALUES (?, ?, ?)",
+                             (uuid.uuid4().hex, driver_name, timestamp or datetime.now().isoformat()))
+        self._wake.set()
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    # -------------------------------------------------------------- sender
+    def _next_batch(self) -> list[tuple]:
+        with self._lock:
+            return self._db.execute("SELECT id, event_id, driver_name, timestamp FROM outbox ORDER BY id LIMIT ?",
+                                    (self.batch_size,)).fetchall()
+
+    def _deliver(self, batch: list[tuple]) -> bool:
+        events = [{"event_id": e, "driver_name": n, "timestamp": t} for _, e, n, t in batch]
+        try:
+            response = self.session.post(self.url, json=events, timeout=self.timeout)
+        except Exception as e:  # connection refused, timeout, DNS...
+            print(f"[outbox] delivery of {len(batch)} events failed, will retry: {e}")
+            return False
+        if not 200 <= response.status_code < 300:  # 202: queued by a server in F1_INGEST=enqueue mode
+            print(f"[outbox] server rejected batch: {response.status_code} — {response.text[:200]}")
+            return False
+        with self._lock:
+            self._db.executemany("DELETE FROM outbox WHERE id = ?", [(row[0],) for row in batch])
+        self.sent += len(batch)
+        return True
+
+    def flush(self) -> bool:
+        """Send everything spooled so far; False as soon as one batch fails."""
+        if self.session is None:
+            self.session = _session()
+        while batch := self._next_batch():
+            if not self._deliver(batch):
+                self.failures += 1
+                return False
+        return True
+
+    def _run(self) -> None:
+        backoff = 0.0
+        while not self._stop.is_set():
+            self._wake.clear()  # before flushing, so an enqueue during the flush is not missed
+            if self.flush():
+                backoff = 0.0
+                self._wake.wait(self.flush_interval)
+            else:
+                backoff = min(self.max_backoff, max(0.5, backoff * 2))
+                self._stop.wait(backoff * random.uniform(0.5, 1.0))
+
+    def start(self) -> "AttendanceOutbox":
+        self._thread = threading.Thread(target=self._run, name="attendance-outbox", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the sender after one last delivery attempt; anything unsent stays spooled."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return  # still stuck in a request; the spool keeps the rest
+        if self.session is not None:
+            self.flush()
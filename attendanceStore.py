@@ -0,0 +1,202 @@
+# attendanceStore.py
+"""
+The attendance database and its connection management for server.py.
+
+Every check-in lives in one database, Attendance/attendance.db, instead of a
+new attendance_YYYY-MM-DD.db per day. The `day` column is generated from the
+ISO timestamp and indexed, so "today", one day or a whole season are all a
+single indexed range scan. Old per-day .db files and the recognizer's
+Attendance_YYYY-MM-DD.csv logs are imported with migrateAttendance.py.
+
+Per-driver per-day counts (first and last check-in) and per-hour counts are
+kept in two rollup tables by AFTER INSERT triggers, in the same transaction as
+the check-in itself. GET /attendance/summary reads them, so its cost grows
+with the number of drivers rather than the number of check-ins.
+
+Connections are kept one per thread, opened with WAL journaling and
+synchronous=NORMAL (a commit appends to the WAL without an fsync; the WAL is
+synced at checkpoints). The schema is created once per store.
+
+The attendance directory defaults to ./Attendance and can be moved with the
+F1_ATTENDANCE_DIR environment variable (the tests point it at a temp dir).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+ATTENDANCE_DIR = Path(os.environ.get("F1_ATTENDANCE_DIR", ROOT_DIR / "Attendance"))
+DB_NAME = "attendance.db"
+MAX_PAGE = 5000  # most rows one GET returns
+
+INSERT = "INSERT OR IGNORE INTO attendance (driver_name, timestamp, event_id) VALUES (?, ?, ?)"
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",   # wait for other writers instead of failing with "database is locked"
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",    # 8 MB page cache per connection
+)
+
+
+def init_schema(conn: sqlite3.Connection) -> None:
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS attendance (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            driver_name TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            event_id TEXT,
+            day TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
+        )
+    ''')
+    # event_id lets /attendance/bulk drop events a client re-sends after a lost response
+    conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_attendance_event ON attendance(event_id)')
+    # Day partitions (cursor order within a day), driver history, and time ranges
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_attendance_day ON attendance(day, id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_attendance_driver ON attendance(driver_name, timestamp)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_attendance_timestamp ON attendance(timestamp)')
+    init_rollups(conn)
+    conn.commit()
+
+
+def init_rollups(conn: sqlite3.Connection) -> None:
+    """Rollup tables plus the triggers that keep them current; filled from existing rows on first creation."""
+    created = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'attendance_daily'").fetchone() is None
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS attendance_daily (
+            day TEXT NOT NULL,
+            driver_name TEXT NOT NULL,
+            checkins INTEGER NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            PRIMARY KEY (day, driver_name)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS attendance_hourly (
+            day TEXT NOT NULL,
+            hour INTEGER NOT NULL,
+            checkins INTEGER NOT NULL,
+            PRIMARY KEY (day, hour)
+        ) WITHOUT ROWID
+    ''')
+    # Only rows actually inserted fire these: INSERT OR IGNORE of a re-sent event_id does not
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS attendance_rollup AFTER INSERT ON attendance BEGIN
+            INSERT INTO attendance_daily (day, driver_name, checkins, first_seen, last_seen)
+            VALUES (NEW.day, NEW.driver_name, 1, NEW.timestamp, NEW.timestamp)
+            ON CONFLICT (day, driver_name) DO UPDATE SET
+                checkins = checkins + 1,
+                first_seen = min(first_seen, excluded.first_seen),
+                last_seen = max(last_seen, excluded.last_seen);
+            INSERT INTO attendance_hourly (day, hour, checkins)
+            VALUES (NEW.day, CAST(substr(NEW.timestamp, 12, 2) AS INTEGER), 1)
+            ON CONFLICT (day, hour) DO UPDATE SET checkins = checkins + 1;
+        END
+    ''')
+    if created:
+        rebuild_rollups(conn)
+
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute both rollup tables from the raw check-ins (first start on an existing database, repairs)."""
+    conn.execute('DELETE FROM attendance_daily')
+    conn.execute('DELETE FROM attendance_hourly')
+    conn.execute('''
+        INSERT INTO attendance_daily (day, driver_name, checkins, first_seen, last_seen)
+        SELECT day, driver_name, COUNT(*), MIN(timestamp), MAX(timestamp) FROM attendance GROUP BY day, driver_name
+    ''')
+    conn.execute('''
+        INSERT INTO attendance_hourly (day, hour, checkins)
+        SELECT day, CAST(substr(timestamp, 12, 2) AS INTEGER), COUNT(*) FROM attendance GROUP BY 1, 2
+    ''')
+
+
+def last_id(conn: sqlite3.Connection) -> int:
+    """Newest row id; rows are only ever appended, so this identifies the data version."""
+    return conn.execute('SELECT MAX(id) FROM attendance').fetchone()[0] or 0
+
+
+def select_checkins(conn: sqlite3.Connection, days: tuple[str, str], after_id: int | None = None,
+                    limit: int | None = None, driver: str | None = None, since: str | None = None,
+                    until: str | None = None, default_order: str = 'DESC') -> tuple[list[dict], bool]:
+    """Check-ins of `days` (first, last) as dicts, and whether LIMIT cut the page short.
+
+    With after_id the rows are id > after_id oldest first, capped at MAX_PAGE; driver,
+    since and until (ISO timestamps) are optional filters that use the indexes.
+    """
+    where, params = ['day BETWEEN ? AND ?'], list(days)
+    for clause, value in (('id > ?', after_id), ('driver_name = ?', driver),
+                          ('timestamp >= ?', since), ('timestamp <= ?', until)):
+        if value is not None:
+            where.append(clause)
+            params.append(value)
+    sql = 'SELECT id, driver_name, timestamp FROM attendance WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY id ' + ('ASC' if after_id is not None else default_order)
+    page = None
+    if limit is not None or after_id is not None:
+        page = max(1, min(limit or MAX_PAGE, MAX_PAGE))
+        sql += ' LIMIT ?'
+        params.append(page)
+    rows = conn.execute(sql, params).fetchall()
+    return [{"id": r[0], "driver_name": r[1], "timestamp": r[2]} for r in rows], len(rows) == page
+
+
+def summarize(conn: sqlite3.Connection, first: str, last: str) -> dict:
+    """Per-driver and hourly counts for days first..last, read from the rollup tables only."""
+    drivers = conn.execute('''
+        SELECT driver_name, SUM(checkins), MIN(first_seen), MAX(last_seen) FROM attendance_daily
+        WHERE day BETWEEN ? AND ? GROUP BY driver_name ORDER BY MAX(last_seen) DESC
+    ''', (first, last)).fetchall()
+    hourly = conn.execute('''
+        SELECT hour, SUM(checkins) FROM attendance_hourly WHERE day BETWEEN ? AND ? GROUP BY hour ORDER BY hour
+    ''', (first, last)).fetchall()
+    return {
+        "from": first, "to": last,
+        "checkins": sum(d[1] for d in drivers),
+        "drivers": [{"driver_name": d[0], "checkins": d[1], "first_seen": d[2], "last_seen": d[3]} for d in drivers],
+        "hourly": [{"hour": h[0], "checkins": h[1]} for h in hourly],
+    }
+
+
+class AttendanceStore:
+    def __init__(self, directory: Path = ATTENDANCE_DIR):
+        self.directory = Path(directory)
+        self._initialized = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def today() -> str:
+        return date.today().isoformat()
+
+    def path(self) -> Path:
+        return self.directory / DB_NAME
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection, opened (and the schema created) on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path()))
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            with self._lock:
+                if not self._initialized:
+                    init_schema(conn)
+                    self._initialized = True
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the calling thread's connection (other threads' close when they exit)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
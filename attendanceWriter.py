@@ -0,0 +1,164 @@
+# attendanceWriter.py
+"""
+Group-commit writer for high-rate attendance ingest in server.py.
+
+Request threads hand their rows to `submit()`; one writer thread drains the
+queue and writes many submissions in a single transaction (one
+`executemany` per submission, one commit for all of them). A flush happens
+once `max_batch` events are queued or `max_delay_ms` after the first one,
+whichever comes first, so one commit (and one WAL append) covers many events
+instead of one each.
+
+Durability is chosen per writer:
+
+* "flush"   - submit() blocks until the transaction holding the rows is
+              committed (ack-after-flush; nothing acknowledged is lost);
+* "enqueue" - submit() returns as soon as the rows are queued (ack-on-enqueue;
+              lowest latency, but rows still queued are lost if the process dies).
+
+`stats()` reports queue depth, flush latency and batch sizes for tuning.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from attendanceStore import INSERT
+
+DURABILITY = ("flush", "enqueue")
+
+
+class _Submission:
+    __slots__ = ("rows", "done", "stored", "error", "future")
+
+    def __init__(self, rows, future: Future | None = None):
+        self.rows = rows
+        self.done = threading.Event()
+        self.stored = 0
+        self.error: Exception | None = None
+        self.future = future
+
+
+class GroupCommitWriter:
+    def __init__(self, store, max_batch: int = 256, max_delay_ms: float = 2.0, durability: str = "flush",
+                 on_commit=None):
+        if durability not in DURABILITY:
+            raise ValueError(f"unknown durability {durability!r}, expected one of {DURABILITY}")
+        self.store = store
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.durability = durability
+        self.on_commit = on_commit  # called after every successful commit (e.g. to wake stream clients)
+        self._queue: queue.Queue = queue.Queue()
+        self._flush_ms: deque = deque(maxlen=500)
+        self._batch_sizes: deque = deque(maxlen=500)
+        self.flushes = 0
+        self.events = 0
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="attendance-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, rows: list[tuple], timeout: float = 10.0) -> int | None:
+        """Queue (driver_name, timestamp, event_id) rows.
+
+        Returns the number of rows stored once committed ("flush"), or None right
+        away ("enqueue"). Raises the writer's error if the transaction failed.
+        """
+        item = _Submission(rows)
+        self._queue.put(item)
+        if self.durability == "enqueue":
+            return None
+        if not item.done.wait(timeout):
+            raise TimeoutError(f"attendance write not committed within {timeout}s")
+        if item.error is not None:
+            raise item.error
+        return item.stored
+
+    def submit_future(self, rows: list[tuple]) -> Future:
+        """Queue rows without blocking; the Future resolves to the rows stored once committed.
+
+        For event-loop callers (asgiServer.py wraps it with asyncio.wrap_future).
+        """
+        item = _Submission(rows, Future())
+        self._queue.put(item)
+        return item.future
+
+    # -------------------------------------------------------------- writer
+    def _collect(self) -> list[_Submission]:
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.perf_counter() + self.max_delay
+        events = len(batch[0].rows)
+        while events < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            events += len(item.rows)
+        return batch
+
+    def _flush(self, batch: list[_Submission]) -> None:
+        t0 = time.perf_counter()
+        conn = self.store.connection()
+        try:
+            for item in batch:
+                item.stored = conn.executemany(INSERT, item.rows).rowcount  # excludes the rollup triggers' writes
+            conn.commit()
+            if self.on_commit is not None:
+                self.on_commit()
+        except Exception as e:
+            conn.rollback()
+            self.errors += 1
+            print(f"[writer] flush of {len(batch)} submissions failed: {e}")
+            for item in batch:
+                item.error, item.stored = e, 0
+        self._flush_ms.append((time.perf_counter() - t0) * 1000)
+        self._batch_sizes.append(sum(len(item.rows) for item in batch))
+        self.flushes += 1
+        self.events += self._batch_sizes[-1]
+        for item in batch:
+            item.done.set()
+            if item.future is not None:
+                if item.error is not None:
+                    item.future.set_exception(item.error)
+                else:
+                    item.future.set_result(item.stored)
+
+    def _run(self) -> None:
+        while not (self._stop.is_set() and self._queue.empty()):
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush whatever is queued and stop the writer thread."""
+        self._stop.set()
+        self._thread.join(timeout)
+
+    # --------------------------------------------------------------- stats
+    def stats(self) -> dict:
+        flush_ms = np.asarray(self._flush_ms) if self._flush_ms else np.zeros(1)
+        sizes = np.asarray(self._batch_sizes) if self._batch_sizes else np.zeros(1)
+        return {
+            "durability": self.durability,
+            "queue_depth": self._queue.qsize(),
+            "flushes": self.flushes,
+            "events": self.events,
+            "errors": self.errors,
+            "flush_ms_mean": float(flush_ms.mean()),
+            "flush_ms_p95": float(np.percentile(flush_ms, 95)),
+            "batch_events_mean": float(sizes.mean()),
+            "max_batch": self.max_batch,
+            "max_delay_ms": self.max_delay * 1000,
+        }
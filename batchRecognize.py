@@ -0,0 +1,236 @@
+# batchRecognize.py
+"""
+Headless batch recognition over recorded footage and photo dumps.
+
+    python batchRecognize.py onboard.mp4 paddock_photos/ --out runs/monaco --format parquet
+
+Inputs are split into chunks (a run of video frames, or a group of image
+files) and fanned out over a process pool; each worker loads the face index
+once and runs the same detect + batched predict as recognizeFace.py, without
+a window. Every finished chunk is written as its own part file and recorded in
+<out>/manifest.json, so an interrupted run picks up where it stopped when
+started again with the same arguments. Once all chunks are done the parts are
+merged into one columnar file:
+
+    source, frame, x, y, w, h, name, distance
+
+`frame` is the frame number for videos and 0 for still images; `distance` is
+the embedding distance to the closest gallery sample of the predicted person.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from faceIndex import INDEX_FILE, FaceIndex, crop_rows, load_or_build
+
+ROOT_DIR = Path(__file__).resolve().parent
+DATA_DIR = ROOT_DIR / "data"
+CASCADE = DATA_DIR / "haarcascade_frontalface_default.xml"
+IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".webp", ".avif")
+VIDEO_EXTS = (".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm")
+COLUMNS = ["source", "frame", "x", "y", "w", "h", "name", "distance"]
+FORMATS = ("csv", "parquet", "npz")
+
+
+# ---------------------------------------------------------------- planning
+def plan_chunks(inputs: list[Path], chunk_frames: int, chunk_images: int, stride: int) -> list[dict]:
+    """Split every input into independent work units with a stable id (used for checkpoints)."""
+    chunks = []
+    for path in inputs:
+        if path.is_dir():
+            files = sorted(str(p) for p in path.rglob("*") if p.suffix.lower() in IMAGE_EXTS)
+            for start in range(0, len(files), chunk_images):
+                chunks.append({"kind": "images", "files": files[start:start + chunk_images]})
+        elif path.suffix.lower() in IMAGE_EXTS:
+            chunks.append({"kind": "images", "files": [str(path)]})
+        elif path.suffix.lower() in VIDEO_EXTS:
+            cap = cv2.VideoCapture(str(path))
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            cap.release()
+            if total <= 0:
+                print(f"[batch] skipping {path}: cannot read frame count")
+                continue
+            for start in range(0, total, chunk_frames):
+                chunks.append({"kind": "video", "path": str(path), "start": start,
+                               "stop": min(total, start + chunk_frames), "stride": stride})
+        else:
+            print(f"[batch] skipping {path}: not a video, image or directory")
+    for chunk in chunks:
+        chunk["id"] = hashlib.sha1(json.dumps(chunk, sort_keys=True).encode()).hexdigest()[:16]
+    return chunks
+
+
+# ----------------------------------------------------------------- workers
+_index: FaceIndex | None = None
+_cascade = None
+
+
+def _init_worker(index_path: str) -> None:
+    global _index, _cascade
+    cv2.setNumThreads(1)  # parallelism comes from the pool
+    _index = FaceIndex.load(Path(index_path))
+    _cascade = cv2.CascadeClassifier(str(CASCADE))
+
+
+def _recognize(frame: np.ndarray, source: str, frame_no: int, out: dict) -> None:
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    boxes = [tuple(int(v) for v in b) for b in _cascade.detectMultiScale(gray, 1.3, 5)]
+    if not boxes:
+        return
+    names, dists = _index.predict(crop_rows(frame, boxes), return_distance=True)
+    for (x, y, w, h), name, dist in zip(boxes, names, dists):
+        for col, value in zip(COLUMNS, (source, frame_no, x, y, w, h, str(name), float(dist))):
+            out[col].append(value)
+
+
+def _frames(chunk: dict):
+    if chunk["kind"] == "images":
+        for path in chunk["files"]:
+            frame = cv2.imread(path)
+            if frame is not None:
+                yield path, 0, frame
+        return
+    cap = cv2.VideoCapture(chunk["path"])
+    cap.set(cv2.CAP_PROP_POS_FRAMES, chunk["start"])
+    try:
+        for frame_no in range(chunk["start"], chunk["stop"]):
+            if (frame_no - chunk["start"]) % chunk["stride"]:
+                if not cap.grab():  # skip without decoding
+                    break
+                continue
+            ok, frame = cap.read()
+            if not ok:
+                break
+            yield chunk["path"], frame_no, frame
+    finally:
+        cap.release()
+
+
+def process_chunk(chunk: dict, parts_dir: str) -> dict:
+    """Worker entry point: recognize one chunk and write it to parts_dir/<id>.npz."""
+    t0 = time.perf_counter()
+    out = {col: [] for col in COLUMNS}
+    frames = 0
+    for source, frame_no, frame in _frames(chunk):
+        _recognize(frame, source, frame_no, out)
+        frames += 1
+    part = Path(parts_dir) / f"{chunk['id']}.npz"
+    tmp = part.with_name(part.stem + ".tmp.npz")
+    np.savez(tmp, **{col: np.asarray(out[col], dtype=_dtype(col)) for col in COLUMNS})
+    os.replace(tmp, part)
+    return {"id": chunk["id"], "part": part.name, "frames": frames, "faces": len(out["name"]),
+            "seconds": time.perf_counter() - t0, "pid": os.getpid()}
+
+
+def _dtype(col: str):
+    return {"source": str, "name": str, "distance": np.float32}.get(col, np.int64)
+
+
+# ----------------------------------------------------------------- driver
+def _load_manifest(path: Path) -> dict:
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            print(f"[batch] ignoring unreadable {path}")
+    return {"chunks": {}}
+
+
+def _save_manifest(path: Path, manifest: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1))
+    os.replace(tmp, path)
+
+
+def merge_parts(parts: list[Path], out_path: Path, fmt: str) -> int:
+    """Concatenate part files into one columnar output; returns the number of detections."""
+    columns = {col: [] for col in COLUMNS}
+    for part in parts:
+        with np.load(part, allow_pickle=False) as z:
+            for col in COLUMNS:
+                columns[col].append(z[col])
+    merged = {col: np.concatenate(v) if v else np.asarray([], dtype=_dtype(col)) for col, v in columns.items()}
+    if fmt == "npz":
+        np.savez(out_path, **merged)
+    else:
+        import pandas as pd
+
+        df = pd.DataFrame(merged, columns=COLUMNS)
+        if fmt == "parquet":
+            df.to_parquet(out_path, index=False)  # needs pyarrow or fastparquet
+        else:
+            df.to_csv(out_path, index=False)
+    return len(merged["name"])
+
+
+def run(inputs: list[Path], out_dir: Path, fmt: str = "csv", workers: int | None = None,
+        chunk_frames: int = 300, chunk_images: int = 50, stride: int = 1,
+        index_path: Path | None = None, report_every: float = 10.0) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    parts_dir = out_dir / "parts"
+    parts_dir.mkdir(exist_ok=True)
+    manifest_path = out_dir / "manifest.json"
+    manifest = _load_manifest(manifest_path)
+    if index_path is None:
+        load_or_build(DATA_DIR)  # make sure faceIndex.npz exists and is current before forking
+        index_path = DATA_DIR / INDEX_FILE
+
+    chunks = plan_chunks(inputs, chunk_frames, chunk_images, max(1, stride))
+    done = manifest["chunks"]
+    todo = [c for c in chunks if c["id"] not in done or not (parts_dir / done[c["id"]]["part"]).exists()]
+    print(f"[batch] {len(chunks)} chunks, {len(chunks) - len(todo)} already done, {len(todo)} to run")
+
+    per_worker: dict[int, list[float]] = {}  # pid -> [frames, seconds]
+    t_start = last_report = time.perf_counter()
+    frames_total = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(str(index_path),)) as pool:
+        futures = [pool.submit(process_chunk, c, str(parts_dir)) for c in todo]
+        for future in as_completed(futures):
+            result = future.result()
+            done[result["id"]] = {k: result[k] for k in ("part", "frames", "faces")}
+            _save_manifest(manifest_path, manifest)  # checkpoint after every chunk
+            stats = per_worker.setdefault(result["pid"], [0, 0.0])
+            stats[0] += result["frames"]
+            stats[1] += result["seconds"]
+            frames_total += result["frames"]
+            now = time.perf_counter()
+            if now - last_report >= report_every or len(done) == len(chunks):
+                print(f"[batch] {sum(c['id'] in done for c in chunks)}/{len(chunks)} chunks, "
+                      f"{frames_total / (now - t_start):.1f} frames/s | "
+                      + " ".join(f"pid {pid}: {f / s:.1f} fps" for pid, (f, s) in per_worker.items() if s))
+                last_report = now
+
+    out_path = out_dir / f"detections.{fmt}"
+    count = merge_parts([parts_dir / done[c["id"]]["part"] for c in chunks], out_path, fmt)
+    print(f"[batch] wrote {count} detections to {out_path}")
+    return out_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recognize faces in video files and image folders without a window.")
+    parser.add_argument("inputs", nargs="+", type=Path, help="video files, image files or image directories")
+    parser.add_argument("--out", type=Path, default=Path("batch_output"), help="output / checkpoint directory")
+    parser.add_argument("--format", choices=FORMATS, default="csv")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--chunk-frames", type=int, default=300, help="video frames per work unit")
+    parser.add_argument("--chunk-images", type=int, default=50, help="images per work unit")
+    parser.add_argument("--every", type=int, default=1, help="process every Nth video frame")
+    parser.add_argument("--index", type=Path, default=None, help="face index file (default: data/faceIndex.npz)")
+    args = parser.parse_args(argv)
+    run(args.inputs, args.out, args.format, args.workers, args.chunk_frames, args.chunk_images,
+        args.every, args.index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+POST /attendance throughput: per-request connections (the old server.py) vs.
+AttendanceStore's per-thread WAL connections vs. the group-commit writer in
+both durability modes (F1_INGEST=flush / enqueue).
+
+Both apps are driven in-process through the Flask test client by `--clients`
+threads (stand-ins for recognizer kiosks), each against a fresh temp dir.
+
+    python benchmarks/bench_attendance_ingest.py --requests 2000 --clients 4
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+os.environ["F1_ATTENDANCE_DIR"] = tempfile.mkdtemp(prefix="f1-bench-")  # before server.py is imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from flask import Flask, jsonify, request  # noqa: E402
+
+from attendanceWriter import GroupCommitWriter  # noqa: E402
+
+
+def legacy_app(directory: Path) -> Flask:
+    """The pre-AttendanceStore handler: mkdir, connect, insert, commit, close on every request."""
+    app = Flask("legacy")
+
+    def get_today_db_path():
+        date_str = datetime.now().strftime('%Y-%m-%d')
+        directory.mkdir(parents=True, exist_ok=True)
+        return str(directory / f"attendance_{date_str}.db")
+
+    conn = sqlite3.connect(get_today_db_path())
+    conn.execute('CREATE TABLE IF NOT EXISTS attendance (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+                 'driver_name TEXT NOT NULL, timestamp TEXT NOT NULL)')
+    conn.commit()
+    conn.close()
+
+    @app.route('/attendance', methods=['POST'])
+    def log_attendance():
+        data = request.json
+        conn = sqlite3.connect(get_today_db_path())
+        cursor = conn.cursor()
+        cursor.execute('INSERT INTO attendance (driver_name, timestamp) VALUES (?, ?)',
+                       (data.get("driver_name"), data.get("timestamp") or datetime.now().isoformat()))
+        conn.commit()
+        conn.close()
+        return jsonify({"status": "success"})
+
+    return app
+
+
+def drive(app: Flask, total: int, clients: int) -> float:
+    per_client = total // clients
+    errors = []
+
+    def client_loop(i):
+        client = app.test_client()
+        for n in range(per_client):
+            if client.post("/attendance", json={"driver_name": f"Driver {i}", "timestamp": str(n)}).status_code not in (200, 202):
+                errors.append(n)
+
+    threads = [threading.Thread(target=client_loop, args=(i,)) for i in range(clients)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    if errors:
+        print(f"  {len(errors)} failed requests")
+    return per_client * clients / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--flush-events", type=int, default=256)
+    parser.add_argument("--flush-ms", type=float, default=2.0)
+    parser.add_argument("--synchronous", choices=["NORMAL", "FULL"], default="NORMAL",
+                        help="FULL fsyncs every commit, which is where group commit pays off")
+    args = parser.parse_args()
+
+    import attendanceStore
+    attendanceStore.PRAGMAS = tuple(p for p in attendanceStore.PRAGMAS if "synchronous" not in p) + (
+        f"PRAGMA synchronous={args.synchronous}",)
+    import server  # noqa: E402  (after F1_ATTENDANCE_DIR is set)
+    server.print = lambda *a, **k: None  # the handler's per-request print is not what we measure
+
+    before = drive(legacy_app(Path(tempfile.mkdtemp(prefix="f1-legacy-"))), args.requests, args.clients)
+    after = drive(server.app, args.requests, args.clients)
+    print(f"{args.requests} POST /attendance from {args.clients} clients, synchronous={args.synchronous}")
+    print(f"per-request connect (before): {before:8.0f} inserts/s")
+    print(f"AttendanceStore (after):      {after:8.0f} inserts/s  ({after / before:.1f}x)")
+
+    for durability in ("flush", "enqueue"):
+        server.writer = GroupCommitWriter(server.store, max_batch=args.flush_events,
+                                          max_delay_ms=args.flush_ms, durability=durability)
+        rate = drive(server.app, args.requests, args.clients)
+        server.writer.close()
+        stats = server.writer.stats()
+        print(f"group commit, ack-on-{'flush  ' if durability == 'flush' else 'enqueue'}: {rate:8.0f} inserts/s  "
+              f"({rate / before:.1f}x) | {stats['flushes']} flushes, {stats['batch_events_mean']:.1f} events/flush, "
+              f"flush p95 {stats['flush_ms_p95']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+server.py (Flask dev server) vs asgiServer.py (uvicorn) under many concurrent
+keep-alive clients.
+
+Each server runs in its own process on a fresh temp attendance dir. A local
+asyncio load generator opens `--connections` keep-alive sockets. Every socket
+sends `--requests` requests in a row, drawn from POST /attendance and GET
+/attendance/summary (`--reads` sets the share of GETs). Optionally,
+`--streams` dashboards hold /attendance/stream open the whole time. Reports
+requests/s and p50 / p99 / max latency.
+
+    python benchmarks/bench_attendance_server.py --connections 500 --requests 20 --streams 200
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SERVERS = {
+    "flask": [sys.executable, "-c", "import sys, server; server.app.run(port=int(sys.argv[1]), threaded=True)"],
+    "asgi": [sys.executable, "asgiServer.py", "--port"],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start(name: str, port: int) -> subprocess.Popen:
+    env = {**os.environ, "F1_ATTENDANCE_DIR": tempfile.mkdtemp(prefix=f"f1-{name}-")}
+    proc = subprocess.Popen(SERVERS[name] + [str(port)], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{name} server did not start on port {port}")
+
+
+def request_bytes(port: int, read: bool, n: int) -> bytes:
+    host = f"Host: 127.0.0.1:{port}\r\n"
+    if read:
+        return f"GET /attendance/summary HTTP/1.1\r\n{host}\r\n".encode()
+    body = f'{{"driver_name": "Driver {n % 20}"}}'
+    return (f"POST /attendance HTTP/1.1\r\n{host}Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n{body}").encode()
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, bool]:
+    """(status, server wants the connection closed) after reading one response."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:] if line)}
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    close = headers.get("connection", "").lower() == "close" or lines[0].startswith("HTTP/1.0")
+    if close and "content-length" not in headers:
+        await reader.read()
+    return status, close
+
+
+async def client(port: int, requests: int, reads: float, latencies: list, errors: list, seed: int):
+    rng = random.Random(seed)
+    reader = writer = None
+    for n in range(requests):
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            t0 = time.perf_counter()
+            writer.write(request_bytes(port, rng.random() < reads, seed + n))
+            status, close = await read_response(reader)
+            latencies.append(time.perf_counter() - t0)
+            if status >= 400:
+                errors.append(status)
+            if close:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.IncompleteReadError) as e:
+            errors.append(type(e).__name__)
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def hold_stream(port: int, stop: asyncio.Event, opened: list):
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET /attendance/stream HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode())
+        opened.append(1)
+        while not stop.is_set():
+            if not await reader.read(65536):
+                break
+    except OSError:
+        pass
+
+
+async def load(port: int, args) -> dict:
+    stop, opened = asyncio.Event(), []
+    streams = [asyncio.ensure_future(hold_stream(port, stop, opened)) for _ in range(args.streams)]
+    await asyncio.sleep(1 if args.streams else 0)
+    latencies, errors = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(port, args.requests, args.reads, latencies, errors, i * args.requests)
+                           for i in range(args.connections)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    for s in streams:
+        s.cancel()
+    ms = np.asarray(latencies) * 1000 if latencies else np.zeros(1)
+    return {"rps": len(latencies) / elapsed, "p50": np.percentile(ms, 50), "p99": np.percentile(ms, 99),
+            "max": ms.max(), "errors": len(errors), "streams": len(opened)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=200, help="concurrent keep-alive clients")
+    parser.add_argument("--requests", type=int, default=25, help="requests per connection")
+    parser.add_argument("--reads", type=float, default=0.2, help="share of GET /attendance/summary")
+    parser.add_argument("--streams", type=int, default=0, help="open /attendance/stream dashboards during the run")
+    parser.add_argument("--servers", nargs="+", default=list(SERVERS), choices=list(SERVERS))
+    args = parser.parse_args()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))  # thousands of sockets in this process
+    print(f"{args.connections} keep-alive clients x {args.requests} requests, {args.reads:.0%} reads, "
+          f"{args.streams} open streams")
+    for name in args.servers:
+        port = free_port()
+        proc = start(name, port)
+        try:
+            r = asyncio.run(load(port, args))
+        finally:
+            proc.terminate()
+            proc.wait()
+        print(f"{name:6s} {r['rps']:8.0f} req/s  p50 {r['p50']:7.1f} ms  p99 {r['p99']:7.1f} ms  "
+              f"max {r['max']:7.1f} ms  errors {r['errors']}  streams open {r['streams']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Batched vs per-face recognition for 1, 4 and 16 faces in a 1080p frame.
+
+Per-face is the old path: crop, resize, flatten and predict one 1x7500 row
+per face. Batched crops every face into one stacked N x 7500 matrix and
+calls predict once. Uses the enrolled gallery when data/gallery exists,
+otherwise a synthetic one.
+
+    python benchmarks/bench_batch_recognition.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+from faceGallery import FaceGallery  # noqa: E402
+from faceIndex import FaceIndex, crop_rows, load_training_set  # noqa: E402
+
+
+def gallery():
+    if FaceGallery.exists(ROOT_DIR / "data" / "gallery"):
+        return load_training_set(ROOT_DIR / "data")
+    rng = np.random.default_rng(0)
+    faces = rng.integers(0, 256, size=(1000, 7500), dtype=np.uint8)
+    return faces, [f"person_{i // 100}" for i in range(1000)]
+
+
+def per_face(index, frame, boxes):
+    names = []
+    for (x, y, w, h) in boxes:
+        row = cv2.resize(frame[y:y+h, x:x+w], (50, 50)).flatten().reshape(1, -1)
+        names.append(str(index.predict(row)[0]))
+    return names
+
+
+def batched(index, frame, boxes):
+    return [str(n) for n in index.predict(crop_rows(frame, boxes))]
+
+
+def timed(fn, repeats):
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats * 1000
+
+
+def main():
+    faces, labels = gallery()
+    index = FaceIndex.build(faces, labels)
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, size=(1080, 1920, 3), dtype=np.uint8)
+
+    print(f"Gallery: {len(faces)} rows, {len(index.label_names)} labels")
+    print(f"{'faces':>5} {'per-face ms':>12} {'batched ms':>11} {'speed-up':>9}")
+    for n in (1, 4, 16):
+        boxes = [(int(rng.integers(0, 1700)), int(rng.integers(0, 860)), 180, 180) for _ in range(n)]
+        assert per_face(index, frame, boxes) == batched(index, frame, boxes)
+        a = timed(lambda: per_face(index, frame, boxes), 50)
+        b = timed(lambda: batched(index, frame, boxes), 50)
+        print(f"{n:>5} {a:>12.3f} {b:>11.3f} {a / b:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
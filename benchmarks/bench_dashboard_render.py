@@ -0,0 +1,58 @@
+"""
+Time to render every driver card chart on a dashboard rerun: the first run
+(every figure drawn and rasterized) vs a rerun with the same drivers (served
+from figureCache), plus the number of live matplotlib figures afterwards.
+
+Streamlit runs in bare mode here (no server), so st.* calls are no-ops.
+
+    python benchmarks/bench_dashboard_render.py --reruns 5
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import driverRatioChart  # noqa: E402
+import driverStatisticsChart  # noqa: E402
+from driverInfo import driver_info  # noqa: E402
+from figureCache import figures  # noqa: E402
+
+CHARTS = [getattr(m, name) for m in (driverStatisticsChart, driverRatioChart) for name in dir(m)
+          if name.startswith("render_")]
+
+
+def rerun(df) -> float:
+    t0 = time.perf_counter()
+    for render in CHARTS:
+        render(df, driver_info)
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reruns", type=int, default=5)
+    args = parser.parse_args()
+
+    df = pd.DataFrame({"driver_name": list(driver_info)})
+    cold = rerun(df)
+    warm = [rerun(df) for _ in range(args.reruns)]
+    print(f"{len(CHARTS)} charts, {len(df)} drivers")
+    print(f"first run (draw + rasterize): {cold:8.1f} ms")
+    print(f"rerun, nothing changed:       {min(warm):8.1f} ms  (best of {args.reruns})")
+    print(f"cache: {figures.hits} hits, {figures.misses} misses, {len(figures)} PNGs; "
+          f"open matplotlib figures: {len(plt.get_fignums())}")
+
+
+if __name__ == "__main__":
+    main()
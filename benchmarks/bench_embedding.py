@@ -0,0 +1,100 @@
+"""
+Raw-pixel KNN vs. PCA / Fisherfaces embeddings on data/sample_drivers.
+
+Every sample photo stands in for one enrolment: the detected face is cropped
+with small random shifts and scale changes (as addFaces.py's 100 webcam shots
+would be) to form the gallery. Queries are fresh jittered crops under changed
+lighting (gain, offset and gamma), which is where raw pixels fall apart.
+
+    python benchmarks/bench_embedding.py --per-person 100 --queries 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+from faceIndex import FaceIndex  # noqa: E402
+
+SAMPLES = ROOT / "data" / "sample_drivers"
+CASCADE = ROOT / "data" / "haarcascade_frontalface_default.xml"
+
+
+def jittered_crops(img, box, n, rng, relight=False):
+    x, y, w, h = box
+    rows = np.empty((n, 50 * 50 * 3), dtype=np.uint8)
+    for i in range(n):
+        s = rng.uniform(0.9, 1.1)
+        cw, ch = int(w * s), int(h * s)
+        cx = int(np.clip(x + rng.uniform(-0.08, 0.08) * w + (w - cw) / 2, 0, img.shape[1] - cw))
+        cy = int(np.clip(y + rng.uniform(-0.08, 0.08) * h + (h - ch) / 2, 0, img.shape[0] - ch))
+        crop = cv2.resize(img[cy:cy + ch, cx:cx + cw], (50, 50)).astype(np.float32)
+        if relight:
+            crop = 255 * (crop / 255) ** rng.uniform(0.6, 1.6)
+            crop = crop * rng.uniform(0.6, 1.3) + rng.uniform(-40, 40)
+        else:
+            crop += rng.normal(0, 3, crop.shape)
+        rows[i] = np.clip(crop, 0, 255).reshape(-1)
+    return rows
+
+
+def load_sets(per_person, queries, seed=0):
+    cascade = cv2.CascadeClassifier(str(CASCADE))
+    rng = np.random.default_rng(seed)
+    faces, labels, q_rows, q_labels = [], [], [], []
+    for path in sorted(SAMPLES.iterdir()):
+        img = cv2.imread(str(path))
+        if img is None:
+            continue
+        boxes = cascade.detectMultiScale(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY), 1.3, 5)
+        if not len(boxes):
+            continue
+        box = max(boxes, key=lambda b: b[2] * b[3])
+        name = path.stem.replace("_", " ")
+        faces.append(jittered_crops(img, box, per_person, rng))
+        labels += [name] * per_person
+        q_rows.append(jittered_crops(img, box, queries, rng, relight=True))
+        q_labels += [name] * queries
+    return np.concatenate(faces), labels, np.concatenate(q_rows), np.asarray(q_labels)
+
+
+def evaluate(predict, rows, truth):
+    predict(rows[:1])  # warm-up
+    t0 = time.perf_counter()
+    for row in rows:
+        predict(row[None])
+    per_query = (time.perf_counter() - t0) / len(rows) * 1000
+    accuracy = float((predict(rows) == truth).mean())
+    return accuracy, per_query
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--per-person", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=128)
+    args = parser.parse_args()
+
+    faces, labels, queries, truth = load_sets(args.per_person, args.queries)
+    print(f"Gallery: {len(faces)} crops of {len(set(labels))} drivers, {len(queries)} relit queries")
+
+    knn = KNeighborsClassifier(n_neighbors=5).fit(faces, labels)
+    rows = [("raw pixels, KNN (baseline)", faces.shape[1], *evaluate(knn.predict, queries, truth))]
+    for method, normalize in [("pca", False), ("pca", True), ("lda", True)]:
+        index = FaceIndex.build(faces, labels, dim=args.dim, method=method, normalize=normalize)
+        title = f"{method.upper()}{' + lighting norm' if normalize else ''}, IVF"
+        rows.append((title, index.components.shape[0], *evaluate(index.predict, queries, truth)))
+
+    print(f"{'features':32} {'dims':>5} {'accuracy':>9} {'ms/query':>9}")
+    for title, dims, accuracy, ms in rows:
+        print(f"{title:32} {dims:5d} {accuracy:9.3f} {ms:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
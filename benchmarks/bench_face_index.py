@@ -0,0 +1,83 @@
+"""
+Compare the PCA + IVF face index against the old brute-force KNN.
+
+Uses a synthetic gallery shaped like listFaces.pkl (50x50x3 uint8 rows, 100
+samples per person) so it runs without a webcam enrolment. The default of
+300 people is the "hundreds of enrolled people" roster the index is sized
+for. Also sweeps nprobe around the value build() tuned, to show what each
+extra probed list costs.
+
+    python benchmarks/bench_face_index.py --people 300
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.neighbors import KNeighborsClassifier
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from faceIndex import FaceIndex, recall_at_k  # noqa: E402
+
+
+def synthetic_gallery(people, per_person, seed=0):
+    # Face crops live on a low-dimensional manifold: latent codes mapped to pixels plus sensor noise.
+    rng = np.random.default_rng(seed)
+    basis = rng.normal(0, 1, size=(24, 7500)).astype(np.float32)
+    centers = rng.normal(0, 5, size=(people, 24))
+    latent = np.concatenate([c + rng.normal(0, 1.5, size=(per_person, 24)) for c in centers])
+    faces = np.empty((len(latent), 7500), dtype=np.uint8)
+    for start in range(0, len(latent), 4096):
+        chunk = 128 + latent[start:start + 4096].astype(np.float32) @ basis
+        chunk += rng.normal(0, 4, size=chunk.shape).astype(np.float32)
+        faces[start:start + 4096] = np.clip(chunk, 0, 255)
+    labels = [f"person_{i}" for i in range(people) for _ in range(per_person)]
+    return faces, labels
+
+
+def per_query_ms(fn, rows):
+    t0 = time.perf_counter()
+    for row in rows:
+        fn(row[None])
+    return (time.perf_counter() - t0) / len(rows) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--people", type=int, default=300)
+    parser.add_argument("--per-person", type=int, default=100)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    faces, labels = synthetic_gallery(args.people, args.per_person)
+    rng = np.random.default_rng(1)
+    queries = faces[rng.choice(len(faces), args.queries, replace=False)]
+    print(f"Gallery: {len(faces)} rows x {faces.shape[1]} dims, {args.people} people")
+
+    t0 = time.perf_counter()
+    knn = KNeighborsClassifier(n_neighbors=5).fit(faces, labels)
+    print(f"KNN fit:          {(time.perf_counter() - t0) * 1000:8.1f} ms")
+    t0 = time.perf_counter()
+    index = FaceIndex.build(faces, labels)
+    print(f"Index build:      {(time.perf_counter() - t0) * 1000:8.1f} ms "
+          f"({len(index.centroids)} lists, tuned nprobe {index.nprobe})")
+
+    print(f"KNN predict:      {per_query_ms(knn.predict, queries):8.3f} ms/query")
+    print(f"Index search k=5: {per_query_ms(lambda r: index.search(r, 5), queries):8.3f} ms/query")
+    print(f"Index predict:    {per_query_ms(index.predict, queries):8.3f} ms/query")
+    print(f"Recall@5 vs exact KNN: {recall_at_k(index, faces, queries, k=5):.3f}")
+    agree = np.mean(index.predict(queries) == knn.predict(queries))
+    print(f"Label agreement with KNN: {agree:.3f}")
+
+    tuned = index.nprobe
+    for nprobe in sorted({1, tuned, 2 * tuned, 4 * tuned, 8 * tuned} & set(range(1, len(index.centroids) + 1))):
+        index.nprobe = nprobe
+        print(f"  nprobe {nprobe:3d}: {per_query_ms(index.predict, queries):6.3f} ms/query predict, "
+              f"recall@5 {recall_at_k(index, faces, queries, k=5):.3f}")
+    index.nprobe = tuned
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Startup time and RSS: unpickling listFaces.pkl vs memory-mapping the gallery.
+
+Each measurement runs in a fresh interpreter so RSS reflects only the load.
+
+    python benchmarks/bench_gallery_startup.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import pickle
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+from faceGallery import FaceGallery  # noqa: E402
+
+PROBE = """
+import pickle, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+if {mode!r} == "pickle":
+    with open({path!r} + "/listFaces.pkl", "rb") as f:
+        faces = pickle.load(f)
+    with open({path!r} + "/listNames.pkl", "rb") as f:
+        names = pickle.load(f)
+else:
+    from faceGallery import FaceGallery
+    g = FaceGallery.open({path!r} + "/gallery")
+    faces, ids = g.faces, g.label_ids
+ms = (time.perf_counter() - t0) * 1000
+# VmRSS rather than ru_maxrss: maxrss is inherited from the parent across fork/exec
+rss = next(int(l.split()[1]) for l in open("/proc/self/status") if l.startswith("VmRSS"))
+print(ms, rss / 1024)
+"""
+
+
+def measure(mode, path):
+    out = subprocess.run([sys.executable, "-c", PROBE.format(root=str(ROOT_DIR), mode=mode, path=str(path))],
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'pickle ms':>10} {'pickle MB':>10} {'memmap ms':>10} {'memmap MB':>10}")
+    rng = np.random.default_rng(0)
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            faces = rng.integers(0, 256, size=(n, 7500), dtype=np.uint8)
+            names = [f"person_{i // 100}" for i in range(n)]
+            with open(f"{tmp}/listFaces.pkl", "wb") as f:
+                pickle.dump(faces, f)
+            with open(f"{tmp}/listNames.pkl", "wb") as f:
+                pickle.dump(names, f)
+            gallery = FaceGallery.create(Path(tmp) / "gallery")
+            for start in range(0, n, 100):
+                gallery.append(names[start], faces[start:start + 100])
+            del faces
+
+            p_ms, p_mb = measure("pickle", tmp)
+            m_ms, m_mb = measure("memmap", tmp)
+            print(f"{n:>7} {p_ms:>10.1f} {p_mb:>10.1f} {m_ms:>10.1f} {m_mb:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Cold-start import time of dashboard.py, measured with `python -X importtime`.
+
+By the time `streamlit run` executes dashboard.py it has already imported
+streamlit. Each run therefore starts a fresh interpreter, imports streamlit,
+then runs the dashboard's own import block (read from dashboard.py, so it
+stays in sync), and sums the cumulative time of everything imported after
+streamlit. It also times the first chart draw's lazy loads:
+chartAssets.pyplot() and logo(). Reports the median over `--runs` and the
+slowest top-level imports, and checks the median against `--target-ms`.
+
+    python benchmarks/bench_import_time.py --runs 7 --target-ms 800
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+FIRST_DRAW = """
+import time
+t0 = time.perf_counter()
+from chartAssets import logo, pyplot
+pyplot(), logo()
+print(time.perf_counter() - t0)
+"""
+
+
+def dashboard_imports() -> str:
+    """The import statements at the top of dashboard.py."""
+    tree = ast.parse((ROOT / "dashboard.py").read_text())
+    lines = []
+    for node in tree.body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            break
+        lines.append(ast.unparse(node))
+    return "\n".join(lines)
+
+
+def importtime(code: str) -> tuple[list[tuple[int, str]], str]:
+    """([(cumulative us, module)] for top-level imports after streamlit, stdout) of one fresh interpreter."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import streamlit\n" + code],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    top, after_streamlit = [], False
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = (part for part in line[len("import time:"):].split("|"))
+        if name.startswith("  "):  # imported by another module
+            continue
+        if after_streamlit:
+            top.append((int(cumulative), name.strip()))
+        after_streamlit = after_streamlit or name.strip() == "streamlit"
+    return top, proc.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=800,
+                        help="cold-start budget for the dashboard's imports (pandas alone is ~600 ms)")
+    parser.add_argument("--top", type=int, default=8, help="slowest top-level imports to list")
+    args = parser.parse_args()
+
+    code = dashboard_imports()
+    totals, draws, slowest = [], [], {}
+    for _ in range(args.runs):
+        top, _ = importtime(code)
+        totals.append(sum(us for us, _ in top) / 1000)
+        for us, name in top:
+            slowest.setdefault(name, []).append(us / 1000)
+        _, out = importtime(code + FIRST_DRAW)
+        draws.append(float(out.split()[-1]) * 1000)
+
+    total = statistics.median(totals)
+    print(f"dashboard imports after streamlit: median {total:.0f} ms over {args.runs} runs "
+          f"(min {min(totals):.0f}, max {max(totals):.0f})")
+    for name, ms in sorted(slowest.items(), key=lambda kv: -statistics.median(kv[1]))[:args.top]:
+        print(f"  {statistics.median(ms):7.1f} ms  {name}")
+    print(f"first chart draw (pyplot + logo): median {statistics.median(draws):.0f} ms")
+    print(f"target {args.target_ms:.0f} ms: {'met' if total <= args.target_ms else 'MISSED'}")
+    return 0 if total <= args.target_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
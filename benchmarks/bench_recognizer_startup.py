@@ -0,0 +1,66 @@
+"""
+Time to first recognized frame for recognizeFace.py, from a fresh interpreter.
+
+Each run starts a new Python process. It imports recognizeFace, which loads
+the face index snapshot and the logo / flag bundle. It then takes one sample
+frame through the same detect + recognize + overlay path as the live loop,
+with no camera or window, and reads the [startup] phases the recognizer
+reports. The two setups are:
+
+* cold: data/overlayAssets.npz is deleted first, so this start rebuilds it;
+* warm: the bundle is already in place, the normal case.
+
+Also checks that the optional modules (mediapipe, pyttsx3) were not imported.
+
+    python benchmarks/bench_recognizer_startup.py --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SAMPLE = ROOT / "data" / "sample_drivers" / "Lando_Norris.avif"
+
+PROBE = """
+import json, sys
+import recognizeFace as r
+import cv2
+frame = cv2.resize(cv2.imread({sample!r}), (440, 440))
+faces = r.detect_faces(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+names = r.recognize_faces(frame, faces)
+for i, ((x, y, w, h), name) in enumerate(zip(faces, names)):
+    (r.draw_overlay if i == 0 else r.draw_face_badge)(frame, x, y, w, h, name)
+r.report_first_recognition()
+print(json.dumps({{"names": names, "optional": [m for m in ("mediapipe", "pyttsx3") if m in sys.modules],
+                  **r.startup}}))
+"""
+
+
+def run(sample: Path, cold: bool) -> dict:
+    if cold:
+        (ROOT / "data" / "overlayAssets.npz").unlink(missing_ok=True)
+    proc = subprocess.run([sys.executable, "-c", PROBE.format(sample=str(sample))],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--sample", type=Path, default=SAMPLE, help="image with one driver's face")
+    args = parser.parse_args()
+
+    for label, cold in (("cold", True), ("warm", False)):
+        runs = [run(args.sample, cold) for _ in range(args.runs)]
+        phases = {k: statistics.median(r[k] for r in runs) for k in ("imports", "model", "assets", "first_frame")}
+        print(f"{label}: first recognized frame {phases['first_frame']:7.1f} ms  (imports {phases['imports']:.1f}, "
+              f"model {phases['model']:.1f}, assets {phases['assets']:.1f} ms; median of {args.runs})  "
+              f"recognized {runs[-1]['names']}, optional modules loaded {runs[-1]['optional']}")
+
+
+if __name__ == "__main__":
+    main()
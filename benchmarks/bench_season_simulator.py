@@ -0,0 +1,79 @@
+"""
+Simulated seasons per second: a per-race Python loop scored with
+compute_fantasy_score vs seasonSimulator's vectorized multinomial draws, in
+one process and over a process pool.
+
+    python benchmarks/bench_season_simulator.py --seasons 200000 --workers 1 2 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scoring import compute_fantasy_score  # noqa: E402
+from seasonSimulator import PODIUM_POINTS, WIN_POINTS, driver_rates, simulate  # noqa: E402
+
+
+def loop_seasons(rates, seasons: int, races: int, seed: int) -> np.ndarray:
+    """The straightforward version: draw every race of every driver, score with the scalar function."""
+    rng = np.random.default_rng(seed)
+    scores = np.empty((seasons, len(rates)))
+    rows = list(rates.itertuples(index=False))
+    for s in range(seasons):
+        for d, r in enumerate(rows):
+            wins = podiums = dnfs = fastest_laps = poles = 0
+            points = 0.0
+            for _ in range(races):
+                u = rng.random()
+                if u < r.win:
+                    wins += 1
+                    podiums += 1
+                    points += WIN_POINTS
+                elif u < r.win + r.podium:
+                    podiums += 1
+                    points += PODIUM_POINTS
+                elif u < r.win + r.podium + r.dnf:
+                    dnfs += 1
+                else:
+                    points += r.finish_points
+                fastest_laps += rng.random() < r.fastest_lap
+                poles += rng.random() < r.pole
+            scores[s, d] = compute_fantasy_score(wins=wins, podiums=podiums, races=races, poles=poles,
+                                                 points=points, fastest_laps=fastest_laps, dnfs=dnfs)
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seasons", type=int, default=200_000)
+    parser.add_argument("--loop-seasons", type=int, default=500)
+    parser.add_argument("--races", type=int, default=24)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    rates = driver_rates()
+    print(f"{len(rates)} drivers, {args.races} races per season, {os.cpu_count()} CPUs")
+
+    t0 = time.perf_counter()
+    loop = loop_seasons(rates, args.loop_seasons, args.races, seed=0)
+    base = args.loop_seasons / (time.perf_counter() - t0)
+    print(f"per-race Python loop:   {base:12,.0f} seasons/s")
+
+    fast = simulate(rates, 100_000, args.races, seed=0)
+    print(f"  mean scores loop vs vectorized: {np.round(loop.mean(0)[:3], 1)} vs {np.round(fast.mean(0)[:3], 1)}")
+
+    for workers in args.workers:
+        t0 = time.perf_counter()
+        simulate(rates, args.seasons, args.races, seed=0, workers=workers)
+        rate = args.seasons / (time.perf_counter() - t0)
+        print(f"vectorized, {workers} worker{'s' if workers > 1 else ' '}: {rate:12,.0f} seasons/s  ({rate / base:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# chartAssets.py
+"""
+Drawing resources shared by the chart modules, loaded on first use.
+
+Importing driverStatisticsChart / driverRatioChart used to import matplotlib,
+scipy.ndimage and plotly.express. Each module also decoded the 1024 px
+f1.png logo and ran scipy's spline zoom over it, about 1.8 s apiece, for a
+resized copy nothing used. Now importing them costs nothing heavy.
+`pyplot()` imports matplotlib the first time a chart is actually drawn (a
+figureCache miss). `logo()` decodes and downsizes the logo once per process,
+for every chart that shows it.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent
+LOGO_PATH = ROOT_DIR / "data" / "logos" / "f1.png"
+# The logo inset is at most ~180 px tall at the dpi figureCache saves with; a
+# full-size logo would only be downsampled again on every draw
+LOGO_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def pyplot():
+    """matplotlib.pyplot, imported on first use and set up with the charts' font."""
+    import matplotlib.pyplot as plt
+
+    plt.rcParams["font.family"] = "monospace"
+    return plt
+
+
+@lru_cache(maxsize=None)
+def logo() -> np.ndarray:
+    """The F1 logo as a read-only RGBA float array, at most LOGO_SIZE px a side."""
+    from PIL import Image
+
+    with Image.open(LOGO_PATH) as image:
+        image = image.convert("RGBA")
+        image.thumbnail((LOGO_SIZE, LOGO_SIZE), Image.LANCZOS)
+        array = np.asarray(image, dtype=np.float32) / 255  # what mpimg.imread gives for a PNG
+    array.flags.writeable = False
+    return array
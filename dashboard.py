@@ -1,10 +1,10 @@
 # dashboard.py (upgraded with driver cards and logos)
 import os
-import requests
 import pandas as pd
 import streamlit as st
 from datetime import datetime
 from driverInfo import driver_info
+from attendanceFeed import FeedListener
 from driverRatioChart import render_podium_rate
 from driverStatisticsChart import render_driver_wins
 from driverStatisticsChart import render_driver_DNFs
@@ -33,23 +33,93 @@ if st.button("🔁 Refresh Now"):
 
 st.caption(f"⏳ Last updated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-# API endpoint
-url = "http://localhost:5006/attendance"
-response = requests.get(url)
+# Live check-ins pushed by the API as Server-Sent Events (see attendanceFeed.py); the
+# per-driver table comes from the API's rollups, so it costs O(drivers) however busy the day
+stream_url = "http://localhost:5006/attendance/stream"
+summary_url = "http://localhost:5006/attendance/summary"
+RECENT = 10  # raw check-ins shown under the summary
 
-if response.status_code == 200:
-    data = response.json()
-    if data:
-        df = pd.DataFrame(data)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values("timestamp", ascending=False)
-        df.index = df.index + 1
-       
 
+@st.cache_resource
+def attendance_listener():
+    """One streaming connection per dashboard process, shared by every browser session."""
+    return FeedListener(stream_url).start()
 
-        st.subheader("📝 Check-in Table")
-        st.dataframe(df, use_container_width=True)
-        
+
+@st.cache_resource
+def api_session():
+    import requests  # only needed once the stream has reported a day
+
+    return requests.Session()
+
+
+def checkin_frame(rows):
+    df = pd.DataFrame(rows, columns=["id", "driver_name", "timestamp"]).drop(columns="id")
+    df['timestamp'] = pd.to_datetime(df['timestamp'], format="ISO8601")
+    return df.sort_values("timestamp", ascending=False)
+
+
+def fetch_summary(day, etag=None):
+    """(summary dict or None if unchanged, etag) for one day from GET /attendance/summary."""
+    headers = {"If-None-Match": etag} if etag else {}
+    response = api_session().get(summary_url, params={"day": day}, headers=headers, timeout=5)
+    if response.status_code == 304:
+        return None, etag
+    response.raise_for_status()
+    return response.json(), response.headers.get("ETag")
+
+
+def summary_frame(summary):
+    df = pd.DataFrame(summary["drivers"], columns=["driver_name", "checkins", "first_seen", "last_seen"])
+    for column in ("first_seen", "last_seen"):
+        df[column] = pd.to_datetime(df[column], format="ISO8601")
+    return df
+
+
+@st.fragment(run_every="1s")
+def live_checkins():
+    """Refresh the summary only when the stream has delivered something new; the rest of the page is left alone."""
+    listener = attendance_listener()
+    live = st.session_state.setdefault("live", {"day": None, "seen": None, "etag": None,
+                                                "df": summary_frame({"drivers": []}), "hourly": [], "drivers": set()})
+    day, recent, total = listener.rows_since(-RECENT)  # the last few rows, and the day's count
+    if day is not None and (day, total) != (live["day"], live["seen"]):
+        try:
+            summary, etag = fetch_summary(day, live["etag"] if day == live["day"] else None)
+        except OSError as e:  # requests.RequestException is an OSError
+            st.warning(f"Could not load the attendance summary: {e}")
+            return
+        if summary is not None:
+            live.update(df=summary_frame(summary), hourly=summary["hourly"], etag=etag)
+        live.update(day=day, seen=total)
+
+    if live["day"] is None:
+        st.info("⏳ Waiting for the attendance API...")
+        return
+    df = live["df"]
+    if df.empty:
+        st.info("No attendance records yet.")
+        return
+    st.subheader("📝 Check-ins")
+    st.dataframe(df.set_axis(range(1, len(df) + 1)), use_container_width=True)
+    left, right = st.columns(2)
+    left.caption("Latest check-ins")
+    left.dataframe(checkin_frame(recent), hide_index=True, use_container_width=True)
+    right.caption("Check-ins per hour")
+    right.bar_chart(pd.DataFrame(live["hourly"], columns=["hour", "checkins"]).set_index("hour"))
+
+    # Driver cards only change when someone new checks in: rerun the whole page just then
+    drivers = set(df['driver_name'])
+    if drivers != live["drivers"]:
+        live["drivers"] = drivers
+        st.rerun(scope="app")
+
+
+live_checkins()
+df = st.session_state.get("live", {}).get("df")
+
+if df is not None:
+    if not df.empty:
         st.subheader("🏎️ Driver Cards")
         render_current_season_standings(df, driver_info)
         render_driver_championships(df, driver_info)
@@ -65,8 +135,3 @@ if response.status_code == 200:
         render_finished_conversion_rate(df, driver_info)
         render_points_conversion_rate(df, driver_info)
         render_overall_driver_score(df, driver_info)
-
-    else:
-        st.info("No attendance records yet.")
-else:
-    st.error("❌ Failed to fetch data from API.")
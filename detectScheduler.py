@@ -0,0 +1,109 @@
+# detectScheduler.py
+"""
+Adaptive detection scheduler for the live recognizer.
+
+The Haar cascade cost grows with the number of pixels it scans, and capture
+is typically 1080p. The scheduler runs detection on a downscaled copy of the
+grayscale frame (`working_width` pixels wide) and maps the boxes back to frame
+coordinates, and only detects on every `interval`-th frame; frames in between
+reuse the last result.
+
+Both knobs follow the measured per-frame worker cost. Every `adjust_every`
+frames the mean cost is compared with the budget for the target FPS
+(workers / target_fps):
+
+* over budget: shrink the working width first (down to `min_width`), then
+  detect less often (up to `max_interval`);
+* well under budget: detect more often first, then grow the width back to
+  the configured working width.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+class DetectScheduler:
+    def __init__(self, target_fps: float = 15.0, working_width: int = 640, min_width: int = 320,
+                 min_interval: int = 1, max_interval: int = 8, workers: int = 1, adjust_every: int = 15):
+        self.target_fps = target_fps
+        self.max_width = working_width
+        self.min_width = min(min_width, working_width)
+        self.width = working_width
+        self.min_interval = max(1, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.interval = self.min_interval
+        self.workers = max(1, workers)
+        self.adjust_every = adjust_every
+        self._frame_costs: deque = deque(maxlen=adjust_every)
+        self._detect_costs: deque = deque(maxlen=30)
+        self._render_times: deque = deque(maxlen=30)
+        self._since_detect = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------ decisions
+    def should_detect(self) -> bool:
+        """True when this frame is due for a full detection (counts the frame either way)."""
+        with self._lock:
+            due = self._since_detect % self.interval == 0
+            self._since_detect += 1
+            return due
+
+    def detect(self, gray: np.ndarray, detect) -> list[tuple[int, int, int, int]]:
+        """Run detect(small_gray) at the working resolution and return boxes in frame coordinates."""
+        with self._lock:
+            width = self.width
+        scale = min(1.0, width / gray.shape[1])
+        small = gray if scale == 1.0 else cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        t0 = time.perf_counter()
+        boxes = detect(small)
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            self._detect_costs.append(elapsed)
+        return [tuple(int(round(v / scale)) for v in box) for box in boxes]
+
+    # ------------------------------------------------------------- feedback
+    def record(self, seconds: float) -> None:
+        """Feed one frame's worker cost (detection or not) and adapt every `adjust_every` frames."""
+        with self._lock:
+            self._frame_costs.append(seconds)
+            if len(self._frame_costs) < self.adjust_every:
+                return
+            cost = sum(self._frame_costs) / len(self._frame_costs)
+            self._frame_costs.clear()
+            budget = self.workers / self.target_fps
+            if cost > budget:
+                if self.width > self.min_width:
+                    self.width = max(self.min_width, int(self.width * 0.8))
+                elif self.interval < self.max_interval:
+                    self.interval += 1
+            elif cost < 0.5 * budget:
+                if self.interval > self.min_interval:
+                    self.interval -= 1
+                elif self.width < self.max_width:
+                    self.width = min(self.max_width, int(self.width * 1.25))
+
+    def frame_rendered(self) -> None:
+        with self._lock:
+            self._render_times.append(time.perf_counter())
+
+    # -------------------------------------------------------------- display
+    @property
+    def fps(self) -> float:
+        with self._lock:
+            times = list(self._render_times)
+        return (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 and times[-1] > times[0] else 0.0
+
+    @property
+    def detect_ms(self) -> float:
+        with self._lock:
+            costs = list(self._detect_costs)
+        return sum(costs) / len(costs) * 1000 if costs else 0.0
+
+    def status(self) -> str:
+        return f"FPS {self.fps:4.1f} | detect {self.detect_ms:5.1f} ms @ {self.width}px, every {self.interval}"
@@ -0,0 +1,92 @@
+# driverStats.py
+"""
+driverInfo.driver_info parsed once into a typed table, one row per driver.
+
+driver_info holds a free-text card per driver ("Wins: 9\\nPodiums: 26\\n...").
+The chart functions used to re-split those strings every time they ran, once
+per chart per driver. `stats_table()` parses every card once and caches the
+result by the cards' content, so an edited driverInfo.py is picked up. Charts
+then read columns from it with `stats_for()`.
+
+Counts are nullable integers and points are floats. A stat that is missing
+or not a number is NA, and a chart leaves those drivers out.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pandas as pd
+
+# column -> (line prefix in driver_info, pandas dtype)
+FIELDS = {
+    "races": ("Number of races:", "Int64"),
+    "championships": ("Championships:", "Int64"),
+    "wins": ("Wins:", "Int64"),
+    "wins_from_pole": ("Wins from Pole:", "Int64"),
+    "podiums": ("Podiums:", "Int64"),
+    "season_position": ("Season position {year}:", "Int64"),
+    "season_points": ("Season points {year}:", "Int64"),
+    "poles": ("GP Pole Positions:", "Int64"),
+    "fastest_laps": ("Fastest Laps:", "Int64"),
+    "points": ("Total Points:", "Float64"),
+    "dnfs": ("Retirements (DNFs):", "Int64"),
+}
+_BY_PREFIX = {prefix: column for column, (prefix, _) in FIELDS.items()}
+
+
+def parse_card(info: str) -> dict:
+    """{column: number} for the FIELDS lines of one driver card; the first occurrence of a line wins."""
+    values = {}
+    for line in info.splitlines():
+        prefix, colon, value = line.partition(":")
+        column = _BY_PREFIX.get(prefix + colon)
+        if column is None or column in values:
+            continue
+        try:
+            values[column] = (int if FIELDS[column][1] == "Int64" else float)(value.strip())
+        except ValueError:
+            pass
+    return values
+
+
+@lru_cache(maxsize=4)
+def _parse(cards: tuple[tuple[str, str], ...]) -> pd.DataFrame:
+    rows = {name: parse_card(info) for name, info in cards if isinstance(info, str)}
+    table = pd.DataFrame.from_dict(rows, orient="index", columns=list(FIELDS))
+    table.index.name = "driver_name"
+    return table.astype({column: dtype for column, (_, dtype) in FIELDS.items()})
+
+
+def _cards(driver_info: dict | None) -> tuple[tuple[str, str], ...]:
+    if driver_info is None:
+        from driverInfo import driver_info
+    return tuple(driver_info.items())
+
+
+def stats_table(driver_info: dict | None = None) -> pd.DataFrame:
+    """All drivers' stats, indexed by driver_name. Cached: treat the returned frame as read-only."""
+    return _parse(_cards(driver_info))
+
+
+def stats_version(driver_info: dict | None = None) -> int:
+    """Changes whenever a driver card does (figureCache.py keys rendered charts on it)."""
+    return hash(_cards(driver_info))
+
+
+@lru_cache(maxsize=256)
+def _select(cards: tuple, drivers: tuple[str, ...], columns: tuple[str, ...]) -> pd.DataFrame:
+    table = _parse(cards)
+    rows = table.loc[[d for d in drivers if d in table.index], list(columns)].dropna()
+    rows = rows.astype({c: "int64" if FIELDS[c][1] == "Int64" else "float64" for c in columns})
+    return rows.reset_index()
+
+
+def stats_for(df: pd.DataFrame, driver_info: dict | None, columns: list[str]) -> pd.DataFrame:
+    """driver_name plus `columns` for the drivers in df (first-seen order), skipping drivers missing any of them.
+
+    Columns come back as plain int64 / float64, ready for plotting. The selection is cached
+    too, so a dashboard rerun with the same drivers skips the pandas work: treat it as read-only.
+    """
+    drivers = tuple(dict.fromkeys(df["driver_name"].tolist()))
+    return _select(_cards(driver_info), drivers, tuple(columns))
@@ -0,0 +1,106 @@
+# faceEmbedding.py
+"""
+Feature extraction between the face crop and the classifier.
+
+A crop is a flattened 50x50x3 uint8 row (7,500 values). Before matching it is
+mapped to a short float32 vector by one linear projection:
+
+    emb = (normalize(row) - mean) @ components.T
+
+`normalize` removes per-crop brightness and contrast (zero mean, unit std),
+which is most of what a change of lighting does to a raw-pixel row. The
+projection is either
+
+* "pca": the leading principal axes (eigenfaces), ~100-200 dims, or
+* "lda": Fisherfaces, i.e. PCA followed by linear discriminant analysis,
+  which keeps at most (people - 1) axes that separate identities and
+  suppresses within-person variation such as pose and lighting.
+
+Both collapse to a single (dim, 7500) matrix, so FaceIndex stores the fitted
+projection and the projected gallery vectors in faceIndex.npz and a query
+costs one matmul.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+METHODS = ("pca", "lda")
+FIT_SAMPLE = 4096   # rows used to fit the projection on large galleries
+FISHER_PCA = 256    # PCA width ahead of LDA (Fisherfaces proper uses N - C, far too wide to fit quickly)
+CHUNK = 4096        # rows converted to float32 at a time
+
+
+def normalize_lighting(x: np.ndarray) -> np.ndarray:
+    """Per-row zero mean / unit std, in place on a float32 matrix."""
+    x -= x.mean(axis=1, keepdims=True)
+    x /= np.maximum(x.std(axis=1, keepdims=True), 1e-3)
+    return x
+
+
+def as_float_rows(rows: np.ndarray, normalize: bool) -> np.ndarray:
+    x = np.array(np.asarray(rows).reshape(len(rows), -1), dtype=np.float32)  # always a copy
+    return normalize_lighting(x) if normalize else x
+
+
+def top_components(centered: np.ndarray, dim: int, rng, power_iters: int = 3) -> np.ndarray:
+    """Leading principal axes via randomized SVD (a full SVD of 4096x7500 takes minutes)."""
+    width = min(dim + 10, *centered.shape)
+    y = centered @ rng.standard_normal((centered.shape[1], width)).astype(np.float32)
+    for _ in range(power_iters):
+        y, _ = np.linalg.qr(y)
+        y = centered @ (centered.T @ y)
+    q, _ = np.linalg.qr(y)
+    _, _, vt = np.linalg.svd(q.T @ centered, full_matrices=False)
+    return np.ascontiguousarray(vt[:dim], dtype=np.float32)
+
+
+def _fisher_axes(z: np.ndarray, label_ids: np.ndarray, dim: int, reg: float = 1e-3) -> np.ndarray:
+    """LDA axes (dim, d) in the PCA space `z`: maximize between- over within-class scatter."""
+    classes = np.unique(label_ids)
+    means = np.stack([z[label_ids == c].mean(axis=0) for c in classes])
+    within = z - means[np.searchsorted(classes, label_ids)]
+    sw = within.T @ within / len(z)
+    counts = np.bincount(np.searchsorted(classes, label_ids)).astype(np.float64)
+    between = (means - z.mean(axis=0)) * np.sqrt(counts / len(z))[:, None]
+    sb = between.T @ between
+
+    # Whiten the within-class scatter, then take the leading eigenvectors of the whitened between-class scatter
+    evals, evecs = np.linalg.eigh(sw)
+    whiten = evecs / np.sqrt(np.maximum(evals, 0) + reg * max(evals.max(), 1e-12))
+    _, bvecs = np.linalg.eigh(whiten.T @ sb @ whiten)
+    axes = whiten @ bvecs[:, ::-1][:, :dim]
+    return (axes / np.linalg.norm(axes, axis=0)).T
+
+
+def fit_projection(faces: np.ndarray, labels, dim: int = 128, method: str = "pca",
+                   normalize: bool = True, seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Fit (mean, components) on a sample of the gallery; `faces` may be a uint8 memmap."""
+    if method not in METHODS:
+        raise ValueError(f"unknown projection {method!r}, expected one of {METHODS}")
+    x = np.asarray(faces).reshape(len(faces), -1)
+    rng = np.random.default_rng(seed)
+    pick = np.arange(len(x)) if len(x) <= FIT_SAMPLE else np.sort(rng.choice(len(x), FIT_SAMPLE, replace=False))
+
+    mean = np.zeros(x.shape[1], dtype=np.float64)
+    for start in range(0, len(x), CHUNK):
+        mean += as_float_rows(x[start:start + CHUNK], normalize).sum(axis=0, dtype=np.float64)
+    mean = (mean / len(x)).astype(np.float32)
+    sample = as_float_rows(x[pick], normalize) - mean
+
+    if method == "pca":
+        dim = max(1, min(dim, len(sample), x.shape[1]))
+        return mean, top_components(sample, dim, rng)
+
+    _, label_ids = np.unique(np.asarray(labels, dtype=str)[pick], return_inverse=True)
+    n_classes = label_ids.max() + 1
+    if n_classes < 2:
+        raise ValueError("LDA needs at least two people in the gallery")
+    # Fisherfaces: PCA down to (N - C) so the within-class scatter is invertible, then LDA to <= C - 1
+    pca = top_components(sample, max(1, min(len(sample) - n_classes, x.shape[1], FISHER_PCA)), rng)
+    fisher = _fisher_axes(sample @ pca.T, label_ids, min(dim, n_classes - 1))
+    return mean, np.ascontiguousarray(fisher @ pca, dtype=np.float32)
+
+
+def project(rows: np.ndarray, mean: np.ndarray, components: np.ndarray, normalize: bool) -> np.ndarray:
+    return (as_float_rows(rows, normalize) - mean) @ components.T
@@ -0,0 +1,307 @@
+# faceGallery.py
+"""
+Memory-mappable on-disk face gallery (replaces listFaces.pkl / listNames.pkl).
+
+Layout of data/gallery/:
+
+    faces.bin    64-byte header + contiguous (count, dim) uint8 or float32 rows
+    labels.bin   contiguous int32 label id per row
+    names.json   label table: names[label_id] -> driver name
+    segments/    seg_00000001.npz, ... one delta file per enrolment
+
+The header's `count` is the only source of truth for how many rows are valid.
+append() writes the new rows and label ids past the end first and bumps the
+count last, so a crash mid-enrolment leaves the previous gallery intact.
+Readers np.memmap both files, so startup cost and RSS do not grow with the
+number of enrolled samples.
+
+enrol() never touches the base files: it drops a new numbered segment, which
+a running recognizer picks up and adds to its live index. compact() folds
+segments into the base in one append whose header update also records the
+last segment merged (`through`), so segments at or below it are ignored and
+the merge is safe to retry after a crash.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import pickle
+import struct
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent
+DATA_DIR = ROOT_DIR / "data"
+GALLERY_DIR = DATA_DIR / "gallery"
+
+MAGIC = b"F1GALLRY"
+VERSION = 1
+HEADER = struct.Struct("<8sIIIQQ")  # magic, version, dtype code, dim, count, compacted-through segment
+HEADER_SIZE = 64
+DTYPES = {0: np.uint8, 1: np.float32}
+CODES = {np.dtype(v): k for k, v in DTYPES.items()}
+
+
+class FaceGallery:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._read_header()
+        self.names: list[str] = json.loads((self.path / "names.json").read_text())
+
+    # ---------------------------------------------------------------- header
+    def _read_header(self) -> None:
+        with open(self.path / "faces.bin", "rb") as f:
+            magic, version, code, dim, count, through = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{self.path / 'faces.bin'} is not a face gallery")
+        if version != VERSION:
+            raise ValueError(f"gallery version {version}, expected {VERSION}")
+        self.dtype = np.dtype(DTYPES[code])
+        self.dim = dim
+        self.count = count
+        self.compacted_through = through
+
+    def refresh(self) -> "FaceGallery":
+        """Re-read header and label table (another process may have enrolled or compacted)."""
+        self._read_header()
+        self.names = json.loads((self.path / "names.json").read_text())
+        return self
+
+    @staticmethod
+    def _write_header(f, dtype, dim: int, count: int, through: int = 0) -> None:
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, CODES[np.dtype(dtype)], dim, count, through).ljust(HEADER_SIZE, b"\0"))
+
+    # ----------------------------------------------------------------- open
+    @classmethod
+    def create(cls, path: Path = GALLERY_DIR, dim: int = 7500, dtype=np.uint8) -> "FaceGallery":
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        with open(path / "faces.bin", "wb") as f:
+            cls._write_header(f, dtype, dim, 0)
+        (path / "labels.bin").write_bytes(b"")
+        _write_json(path / "names.json", [])
+        return cls(path)
+
+    @classmethod
+    def open(cls, path: Path = GALLERY_DIR, create: bool = False, dim: int = 7500, dtype=np.uint8) -> "FaceGallery":
+        if not (Path(path) / "faces.bin").exists():
+            if not create:
+                raise FileNotFoundError(f"No face gallery at {path}")
+            return cls.create(path, dim, dtype)
+        return cls(path)
+
+    @staticmethod
+    def exists(path: Path = GALLERY_DIR) -> bool:
+        return (Path(path) / "faces.bin").exists()
+
+    # ----------------------------------------------------------------- read
+    @property
+    def faces(self) -> np.ndarray:
+        """(count, dim) read-only memmap of the gallery rows."""
+        if not self.count:
+            return np.empty((0, self.dim), dtype=self.dtype)
+        return np.memmap(self.path / "faces.bin", dtype=self.dtype, mode="r",
+                         offset=HEADER_SIZE, shape=(self.count, self.dim))
+
+    @property
+    def label_ids(self) -> np.ndarray:
+        if not self.count:
+            return np.empty(0, dtype=np.int32)
+        return np.memmap(self.path / "labels.bin", dtype=np.int32, mode="r", shape=(self.count,))
+
+    @property
+    def labels(self) -> np.ndarray:
+        return np.asarray(self.names, dtype=str)[self.label_ids]
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------- segments
+    @property
+    def segment_dir(self) -> Path:
+        return self.path / "segments"
+
+    def segments(self, after: int | None = None) -> list[tuple[int, Path]]:
+        """Pending segments as (seq, path), oldest first; `after` skips seq <= after."""
+        floor = self.compacted_through if after is None else max(after, self.compacted_through)
+        return [(seq, p) for seq, p in self._segment_files() if seq > floor]
+
+    def _segment_files(self) -> list[tuple[int, Path]]:
+        if not self.segment_dir.exists():
+            return []
+        return sorted((int(p.stem[4:]), p) for p in self.segment_dir.glob("seg_*.npz"))
+
+    @staticmethod
+    def read_segment(path: Path) -> tuple[str, np.ndarray]:
+        with np.load(path, allow_pickle=False) as z:
+            return str(z["name"]), z["rows"]
+
+    @property
+    def through(self) -> int:
+        """Highest segment seq whose rows are part of this gallery (merged or pending)."""
+        pending = self.segments()
+        return pending[-1][0] if pending else self.compacted_through
+
+    def enrol(self, name: str, rows: np.ndarray) -> Path:
+        """Add one person's samples as a new delta segment without rewriting the base files."""
+        rows = np.ascontiguousarray(np.asarray(rows).reshape(len(rows), -1), dtype=self.dtype)
+        if rows.shape[1] != self.dim:
+            raise ValueError(f"rows have {rows.shape[1]} values, gallery expects {self.dim}")
+        self.segment_dir.mkdir(exist_ok=True)
+        tmp = self.segment_dir / f".tmp_{os.getpid()}.npz"
+        np.savez(tmp, name=name, rows=rows)
+        seq = max(self.refresh().through, 0) + 1
+        while True:  # os.link refuses to overwrite, so concurrent enrolments get distinct numbers
+            final = self.segment_dir / f"seg_{seq:08d}.npz"
+            try:
+                os.link(tmp, final)
+                break
+            except FileExistsError:
+                seq += 1
+        tmp.unlink()
+        return final
+
+    def rows_and_labels(self) -> tuple[np.ndarray, list[str]]:
+        """Base rows (memmap) plus pending segments, and the label of every row."""
+        labels = list(self.labels)
+        parts = [self.faces]
+        for _, path in self.segments():
+            name, rows = self.read_segment(path)
+            parts.append(rows)
+            labels += [name] * len(rows)
+        faces = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        return faces, labels
+
+    def compact(self) -> int:
+        """Merge pending segments into the base files; returns the number of segments merged."""
+        self.segment_dir.mkdir(exist_ok=True)
+        with open(self.segment_dir / ".compact.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self.refresh()
+            pending = self.segments()
+            if pending:
+                rows, ids = [], []
+                for _, path in pending:
+                    name, seg_rows = self.read_segment(path)
+                    rows.append(seg_rows)
+                    ids.append(np.full(len(seg_rows), self.label_id(name), dtype=np.int32))
+                self._append_rows(np.concatenate(rows), np.concatenate(ids), through=pending[-1][0])
+            for seq, path in self._segment_files():
+                if seq <= self.compacted_through:  # merged (now or by an interrupted earlier run)
+                    path.unlink(missing_ok=True)
+            return len(pending)
+
+    # ---------------------------------------------------------------- write
+    def label_id(self, name: str) -> int:
+        if name not in self.names:
+            self.names.append(name)
+            _write_json(self.path / "names.json", self.names)
+        return self.names.index(name)
+
+    def append(self, name: str, rows: np.ndarray) -> None:
+        """Append rows for one person in place (no rewrite of existing samples)."""
+        rows = np.ascontiguousarray(np.asarray(rows).reshape(len(rows), -1), dtype=self.dtype)
+        if rows.shape[1] != self.dim:
+            raise ValueError(f"rows have {rows.shape[1]} values, gallery expects {self.dim}")
+        ids = np.full(len(rows), self.label_id(name), dtype=np.int32)
+        self._append_rows(rows, ids)
+
+    def _append_rows(self, rows: np.ndarray, ids: np.ndarray, through: int | None = None) -> None:
+        row_bytes = self.dim * self.dtype.itemsize
+        with open(self.path / "labels.bin", "r+b") as f:
+            f.truncate(self.count * 4)  # drop any tail left by an interrupted append
+            f.seek(self.count * 4)
+            f.write(ids.astype(np.int32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.path / "faces.bin", "r+b") as f:
+            f.truncate(HEADER_SIZE + self.count * row_bytes)
+            f.seek(HEADER_SIZE + self.count * row_bytes)
+            f.write(rows.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+            through = self.compacted_through if through is None else through
+            self._write_header(f, self.dtype, self.dim, self.count + len(rows), through)
+            f.flush()
+            os.fsync(f.fileno())
+        self.count += len(rows)
+        self.compacted_through = through
+
+
+def _write_json(path: Path, value) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(value, indent=1))
+    os.replace(tmp, path)
+
+
+def import_pickles(data_dir: Path = DATA_DIR, path: Path = GALLERY_DIR) -> FaceGallery:
+    """One-off migration of listFaces.pkl / listNames.pkl into the gallery format."""
+    with open(data_dir / "listNames.pkl", "rb") as f:
+        labels = pickle.load(f)
+    with open(data_dir / "listFaces.pkl", "rb") as f:
+        faces = np.asarray(pickle.load(f))
+    n = min(len(faces), len(labels))  # Ensure equal number of samples
+    faces = faces[:n].reshape(n, -1)
+    if faces.dtype not in CODES:
+        faces = faces.astype(np.float32 if np.issubdtype(faces.dtype, np.floating) else np.uint8)
+
+    gallery = FaceGallery.create(path, dim=faces.shape[1], dtype=faces.dtype)
+    names, ids = np.unique(np.asarray(labels[:n], dtype=str), return_inverse=True)
+    gallery.names = [str(x) for x in names]
+    _write_json(path / "names.json", gallery.names)
+    gallery._append_rows(faces, ids.astype(np.int32))
+    return gallery
+
+
+def start_compactor(gallery: FaceGallery, interval: float = 60.0, min_segments: int = 4) -> threading.Thread:
+    """Background thread merging segments once `min_segments` have piled up."""
+    def run():
+        while True:
+            time.sleep(interval)
+            try:
+                if len(gallery.refresh().segments()) >= min_segments:
+                    print(f"[gallery] compacted {gallery.compact()} segments")
+            except OSError as e:
+                print(f"[gallery] compaction failed: {e}")
+
+    thread = threading.Thread(target=run, name="gallery-compactor", daemon=True)
+    thread.start()
+    return thread
+
+
+def load_gallery(data_dir: Path = DATA_DIR, create: bool = False) -> FaceGallery:
+    """Open data/gallery, importing listFaces.pkl / listNames.pkl on first use."""
+    path = data_dir / "gallery"
+    if not FaceGallery.exists(path) and (data_dir / "listFaces.pkl").exists():
+        print(f"Importing {data_dir / 'listFaces.pkl'} into {path}")
+        import_pickles(data_dir, path)
+    return FaceGallery.open(path, create=create)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the on-disk face gallery.")
+    parser.add_argument("command", choices=["import", "info", "compact"])
+    args = parser.parse_args()
+
+    if args.command == "import":
+        g = import_pickles()
+        print(f"Imported {len(g)} samples for {len(g.names)} people into {g.path}")
+    elif args.command == "compact":
+        g = FaceGallery.open()
+        merged = g.compact()
+        print(f"Merged {merged} segments: {g.path} now holds {len(g)} samples")
+    else:
+        g = FaceGallery.open()
+        print(f"Pending segments: {len(g.segments())}")
+        counts = np.bincount(g.label_ids, minlength=len(g.names))
+        print(f"{g.path}: {len(g)} samples x {g.dim} ({g.dtype})")
+        for name, c in zip(g.names, counts):
+            print(f"  {name}: {c}")
@@ -0,0 +1,358 @@
+# faceIndex.py
+"""
+Approximate nearest-neighbour index for the face gallery.
+
+The gallery rows are 50x50x3 uint8 crops flattened to 7,500 values. Instead of
+a brute-force KNN over the raw pixels, the index maps every row to a short
+float32 embedding (lighting-normalized PCA or Fisherfaces, see faceEmbedding.py)
+and buckets the projected vectors into an inverted file (IVF): a handful of
+k-means centroids, each owning a contiguous slice of the gallery. A query only
+scans the `nprobe` closest buckets.
+
+Build once with `python faceIndex.py build`; the result is saved next to the
+gallery as data/faceIndex.npz and reloaded by recognizeFace.py.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from faceEmbedding import fit_projection, project
+from faceGallery import load_gallery
+
+ROOT_DIR = Path(__file__).resolve().parent
+DATA_DIR = ROOT_DIR / "data"
+INDEX_FILE = "faceIndex.npz"
+INDEX_VERSION = 3
+BUILD_CHUNK = 4096  # gallery rows converted to float32 at a time while building
+DEFAULT_DIM = 128
+DEFAULT_NPROBE = 8  # lists probed per query by indexes saved before nprobe was tuned
+TARGET_RECALL = 0.99  # build() picks the smallest nprobe whose leave-one-out recall@5 reaches this
+TUNE_QUERIES = 200
+
+
+def load_training_set(data_dir: Path = DATA_DIR) -> tuple[np.ndarray, list[str]]:
+    """Gallery rows (memory-mapped base plus pending segments) and their labels."""
+    return load_gallery(data_dir).rows_and_labels()
+
+
+def _kmeans(x: np.ndarray, k: int, iters: int = 15, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centroids = x[rng.choice(len(x), size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = _nearest(x, centroids)
+        for c in range(k):
+            members = x[assign == c]
+            if len(members):
+                centroids[c] = members.mean(axis=0)
+            else:  # re-seed empty buckets
+                centroids[c] = x[rng.integers(len(x))]
+    return centroids
+
+
+def _sq_dists(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    d = (a * a).sum(1)[:, None] - 2.0 * (a @ b.T) + (b * b).sum(1)[None, :]
+    return np.maximum(d, 0.0, out=d)
+
+
+def _nearest(x: np.ndarray, centroids: np.ndarray, chunk: int = 8192) -> np.ndarray:
+    out = np.empty(len(x), dtype=np.int32)
+    for start in range(0, len(x), chunk):
+        out[start:start + chunk] = _sq_dists(x[start:start + chunk], centroids).argmin(1)
+    return out
+
+
+class FaceIndex:
+    """Embedding + IVF index answering top-k queries over the face gallery."""
+
+    def __init__(self, mean, components, centroids, offsets, vectors, row_ids,
+                 label_ids, label_names, through: int = 0, method: str = "pca", normalize: bool = True,
+                 nprobe: int = DEFAULT_NPROBE):
+        self.mean = mean                  # (D,) float32, mean of the (normalized) rows
+        self.components = components      # (d, D) float32 projection
+        self.method = method              # "pca" or "lda", how `components` was fitted
+        self.normalize = normalize        # per-row lighting normalization before projecting
+        self.centroids = centroids        # (nlist, d) float32
+        self.offsets = offsets            # (nlist + 1,) int64, CSR bucket boundaries
+        self.vectors = vectors            # (N, d) float32, ordered by bucket
+        self.row_ids = row_ids            # (N,) int64, original gallery row of each vector
+        self.label_ids = label_ids        # (N,) int32, label of each vector (bucket order)
+        self.label_names = label_names    # (L,) str
+        self.through = through            # last gallery segment included (see faceGallery.py)
+        self.bucket_of = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))  # (N,) list of each vector
+        self._lock = threading.Lock()     # add() swaps arrays while worker threads search
+        # Lists probed per query: a constant, tuned on build, so query cost stays ~flat as the gallery grows
+        self.nprobe = max(1, min(len(centroids), nprobe))
+
+    # ------------------------------------------------------------------ build
+    @classmethod
+    def build(cls, faces: np.ndarray, labels, dim: int = DEFAULT_DIM, nlist: int | None = None,
+              through: int = 0, seed: int = 0, method: str = "pca", normalize: bool = True) -> "FaceIndex":
+        x = np.asarray(faces).reshape(len(faces), -1)  # may be a uint8 memmap: convert to float32 chunk by chunk
+        names, label_ids = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+        mean, components = fit_projection(x, labels, dim=dim, method=method, normalize=normalize, seed=seed)
+
+        emb = np.empty((len(x), len(components)), dtype=np.float32)
+        for start in range(0, len(x), BUILD_CHUNK):
+            emb[start:start + BUILD_CHUNK] = project(x[start:start + BUILD_CHUNK], mean, components, normalize)
+        if nlist is None:
+            nlist = int(np.clip(np.sqrt(len(emb)), 1, 256))
+        nlist = max(1, min(nlist, len(emb)))
+        centroids = _kmeans(emb, nlist, seed=seed).astype(np.float32)
+
+        assign = _nearest(emb, centroids)
+        order = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        index = cls(mean, components, centroids, offsets,
+                    np.ascontiguousarray(emb[order], dtype=np.float32),
+                    order.astype(np.int64), label_ids[order].astype(np.int32),
+                    names, through, method, normalize)
+        index.nprobe = tune_nprobe(index, emb, seed=seed)
+        return index
+
+    # ------------------------------------------------------------------ query
+    def project(self, rows: np.ndarray) -> np.ndarray:
+        return project(rows, self.mean, self.components, self.normalize)
+
+    def search(self, rows: np.ndarray, k: int = 5, nprobe: int | None = None):
+        """Return (squared distances, positions) of the k nearest vectors for every row.
+
+        Positions index `self.vectors`/`self.label_ids`; use `self.row_ids` to map
+        them back to gallery rows. Missing neighbours are reported as -1.
+        """
+        return self._search(self._snapshot(), rows, k, nprobe)
+
+    def _snapshot(self):
+        with self._lock:
+            return self.offsets, self.vectors, self.bucket_of, self.label_ids, self.label_names
+
+    def _search(self, state, rows, k, nprobe):
+        return self._search_projected(state, self.project(rows), k, nprobe)
+
+    def _search_projected(self, state, q, k, nprobe):
+        offsets, vectors, bucket_of = state[:3]
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        probes = np.argsort(_sq_dists(q, self.centroids), axis=1)[:, :nprobe]
+
+        # One distance matrix over the union of probed lists, masked per query, so a
+        # batch of faces costs a single matmul instead of one scan per face.
+        buckets = np.unique(probes)
+        cand = np.concatenate([np.arange(offsets[b], offsets[b + 1]) for b in buckets])
+        dists = np.full((len(q), k), np.inf, dtype=np.float32)
+        positions = np.full((len(q), k), -1, dtype=np.int64)
+        if not len(cand):
+            return dists, positions
+
+        d = _sq_dists(q, vectors[cand])
+        probed = np.zeros((len(q), len(self.centroids)), dtype=bool)
+        probed[np.arange(len(q))[:, None], probes] = True
+        d[~probed[:, bucket_of[cand]]] = np.inf
+
+        kk = min(k, len(cand))
+        top = np.argpartition(d, kk - 1, axis=1)[:, :kk]
+        top = np.take_along_axis(top, np.argsort(np.take_along_axis(d, top, 1), axis=1, kind="stable"), 1)
+        top_d = np.take_along_axis(d, top, 1)
+        found = np.isfinite(top_d)
+        dists[:, :kk] = np.where(found, top_d, np.inf)
+        positions[:, :kk] = np.where(found, cand[top], -1)
+        return dists, positions
+
+    def predict(self, rows: np.ndarray, k: int = 5, return_distance: bool = False):
+        """Majority vote over the k nearest neighbours (same rule as KNeighborsClassifier).
+
+        With return_distance, also return the embedding distance to the closest
+        neighbour carrying the winning label.
+        """
+        state = self._snapshot()
+        label_ids, label_names = state[3:]
+        dists, positions = self._search(state, rows, k, None)
+        out, nearest = [], []
+        for d, pos in zip(dists, positions):
+            ids = label_ids[pos[pos >= 0]]
+            winner = np.bincount(ids, minlength=len(label_names)).argmax()
+            out.append(label_names[winner])
+            nearest.append(np.sqrt(d[:len(ids)][ids == winner].min()) if len(ids) else np.inf)
+        if return_distance:
+            return np.asarray(out), np.asarray(nearest, dtype=np.float32)
+        return np.asarray(out)
+
+    # ------------------------------------------------------------ incremental
+    def add(self, rows: np.ndarray, labels, through: int | None = None) -> None:
+        """Insert new gallery rows into their nearest lists, in place and safe against concurrent search.
+
+        The PCA basis and centroids stay fixed; a full rebuild refits them.
+        """
+        emb = self.project(rows).astype(np.float32)
+        assign = _nearest(emb, self.centroids)
+        names = list(self.label_names)
+        new_ids = []
+        for label in labels:
+            if label not in names:
+                names.append(label)
+            new_ids.append(names.index(label))
+
+        bucket = np.concatenate([self.bucket_of, assign])
+        order = np.argsort(bucket, kind="stable")
+        vectors = np.concatenate([self.vectors, emb])[order]
+        row_ids = np.concatenate([self.row_ids, np.arange(len(self.vectors), len(self.vectors) + len(emb))])[order]
+        label_ids = np.concatenate([self.label_ids, np.asarray(new_ids, dtype=np.int32)])[order]
+        counts = np.bincount(bucket, minlength=len(self.centroids))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+        with self._lock:
+            self.vectors, self.row_ids, self.label_ids = vectors, row_ids, label_ids
+            self.offsets, self.bucket_of = offsets, bucket[order]
+            self.label_names = np.asarray(names, dtype=str)
+            if through is not None:
+                self.through = through
+
+    def apply_segments(self, gallery) -> int:
+        """Add every gallery segment newer than `self.through`; returns the number of rows added."""
+        added = 0
+        gallery.refresh()
+        if gallery.compacted_through > self.through:
+            # Segments we had not seen yet were already merged: their rows sit at the end of the base
+            start = len(self.vectors)
+            self.add(gallery.faces[start:], list(gallery.labels[start:]), through=gallery.compacted_through)
+            added += len(gallery) - start
+        for seq, path in gallery.segments(after=self.through):
+            try:
+                name, rows = gallery.read_segment(path)
+            except FileNotFoundError:
+                break  # compacted under us; the next call picks the rows up from the base
+            self.add(rows, [name] * len(rows), through=seq)
+            added += len(rows)
+        return added
+
+    # ------------------------------------------------------------- persistence
+    def save(self, path: Path) -> None:
+        np.savez(path, version=INDEX_VERSION, mean=self.mean, components=self.components,
+                 centroids=self.centroids, offsets=self.offsets, vectors=self.vectors,
+                 row_ids=self.row_ids, label_ids=self.label_ids,
+                 label_names=self.label_names, through=self.through,
+                 method=self.method, normalize=self.normalize, nprobe=self.nprobe)
+
+    @classmethod
+    def load(cls, path: Path) -> "FaceIndex":
+        with np.load(path, allow_pickle=False) as z:
+            if int(z["version"]) != INDEX_VERSION:
+                raise ValueError(f"{path} has index version {int(z['version'])}, expected {INDEX_VERSION}")
+            return cls(z["mean"], z["components"], z["centroids"], z["offsets"], z["vectors"],
+                       z["row_ids"], z["label_ids"], z["label_names"], int(z["through"]),
+                       str(z["method"]), bool(z["normalize"]),
+                       int(z["nprobe"]) if "nprobe" in z.files else DEFAULT_NPROBE)
+
+
+def crop_rows(frame: np.ndarray, boxes, size: tuple[int, int] = (50, 50)) -> np.ndarray:
+    """Crop and resize every box into one stacked (N, 50*50*3) uint8 matrix for a batched predict."""
+    import cv2
+
+    rows = np.empty((len(boxes), size[0] * size[1] * frame.shape[2]), dtype=np.uint8)
+    for i, (x, y, w, h) in enumerate(boxes):
+        rows[i] = cv2.resize(frame[y:y+h, x:x+w], size).reshape(-1)
+    return rows
+
+
+def exact_knn(gallery: np.ndarray, rows: np.ndarray, k: int = 5) -> np.ndarray:
+    """Brute-force k nearest gallery rows (raw pixels, or embeddings if that is what is passed)."""
+    g = np.asarray(gallery, dtype=np.float32).reshape(len(gallery), -1)
+    q = np.asarray(rows, dtype=np.float32).reshape(len(rows), -1)
+    d = _sq_dists(q, g)
+    return np.argsort(d, axis=1, kind="stable")[:, :k]
+
+
+def _recall(index: FaceIndex, exact: np.ndarray, q: np.ndarray, k: int, nprobe: int | None = None,
+            exclude: np.ndarray | None = None) -> float:
+    """Fraction of the `exact` top-k gallery rows the IVF search returns for projected queries `q`.
+
+    With `exclude` (one gallery row per query, e.g. the query itself), `exact` holds k + 1
+    rows and that row is left out of both sides.
+    """
+    _, positions = index._search_projected(index._snapshot(), q, exact.shape[1], nprobe)
+    found = np.where(positions >= 0, index.row_ids[np.maximum(positions, 0)], -1)
+    if exclude is None:
+        hits = sum(len(np.intersect1d(e, f)) for e, f in zip(exact, found))
+        return hits / exact.size
+    hits = sum(min(k, len(np.setdiff1d(np.intersect1d(e, f), [x]))) for e, f, x in zip(exact, found, exclude))
+    return hits / (len(exact) * k)
+
+
+def recall_at_k(index: FaceIndex, gallery: np.ndarray, rows: np.ndarray, k: int = 5) -> float:
+    """Fraction of the exact top-k neighbours in embedding space that the IVF search also returns."""
+    emb = np.concatenate([index.project(gallery[s:s + BUILD_CHUNK]) for s in range(0, len(gallery), BUILD_CHUNK)])
+    q = index.project(rows)
+    return _recall(index, exact_knn(emb, q, k), q, k)
+
+
+def tune_nprobe(index: FaceIndex, emb: np.ndarray, k: int = 5, target: float = TARGET_RECALL,
+                queries: int = TUNE_QUERIES, seed: int = 0) -> int:
+    """Smallest nprobe (1, 2, 4, ...) reaching `target` leave-one-out recall@k on sampled gallery rows.
+
+    `emb` holds the gallery embeddings in gallery row order. Each sampled row is left out of
+    its own results, so it stands in for a new capture of that person rather than finding
+    itself in its own list.
+    """
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(len(emb), min(queries, len(emb)), replace=False)
+    q = emb[sample]
+    exact = exact_knn(emb, q, k + 1)
+    nprobe = 1
+    while nprobe < len(index.centroids) and _recall(index, exact, q, k, nprobe, exclude=sample) < target:
+        nprobe *= 2
+    return min(nprobe, len(index.centroids))
+
+
+def load_or_build(data_dir: Path = DATA_DIR, rebuild: bool = False, dim: int = DEFAULT_DIM,
+                  method: str = "pca") -> FaceIndex:
+    """Load faceIndex.npz and catch it up with newer gallery segments, rebuilding only if that is impossible."""
+    path = data_dir / INDEX_FILE
+    gallery = load_gallery(data_dir)
+    if path.exists() and not rebuild:
+        try:
+            index = FaceIndex.load(path)
+            # Rows the gallery held when it reached index.through (merged base + segments up to it)
+            known = sum(len(gallery.read_segment(p)[1]) for seq, p in gallery.segments() if seq <= index.through)
+            if index.through >= gallery.compacted_through and len(index.vectors) == len(gallery) + known:
+                if index.apply_segments(gallery):
+                    index.save(path)
+                return index
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass
+    faces, labels = gallery.rows_and_labels()
+    print(f"Building face index with {len(faces)} faces and {len(set(labels))} labels")
+    index = FaceIndex.build(faces, labels, dim=dim, through=gallery.through, method=method)
+    index.save(path)
+    return index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or inspect the face ANN index.")
+    parser.add_argument("command", choices=["build", "info"])
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="embedding dimensions (LDA keeps at most people - 1)")
+    parser.add_argument("--method", choices=["pca", "lda"], default="pca", help="projection fitted on build")
+    parser.add_argument("--queries", type=int, default=200, help="rows sampled for the recall check")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    index = load_or_build(rebuild=args.command == "build", dim=args.dim, method=args.method)
+    print(f"Index ready in {(time.perf_counter() - t0) * 1000:.1f} ms: {len(index.vectors)} vectors, "
+          f"{index.components.shape[0]} {index.method} dims, {len(index.centroids)} lists, nprobe {index.nprobe}")
+
+    faces, _ = load_training_set()
+    rng = np.random.default_rng(0)
+    sample = faces[rng.choice(len(faces), min(args.queries, len(faces)), replace=False)]
+    t0 = time.perf_counter()
+    for row in sample:
+        index.search(row[None], k=5)
+    per_query = (time.perf_counter() - t0) / len(sample) * 1000
+    print(f"Query latency: {per_query:.3f} ms/query, recall@5 vs exact search: "
+          f"{recall_at_k(index, faces, sample, k=5):.3f}")
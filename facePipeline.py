@@ -0,0 +1,247 @@
+# facePipeline.py
+"""
+Staged capture -> detect/recognize -> render pipeline for the live recognizer.
+
+A capture thread reads frames into a bounded queue, a pool of worker threads
+runs detection and recognition, and the render loop (run on the caller's
+thread, because cv2.imshow/waitKey must stay on the main thread on macOS)
+draws the results. Queues drop their oldest item when full, so a slow stage
+sheds stale frames instead of building up latency. Every result travels in
+the same FramePacket as the frame it was computed from.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import numpy as np
+
+
+@dataclass
+class FramePacket:
+    seq: int
+    frame: np.ndarray
+    captured_at: float
+    faces: list = field(default_factory=list)   # [(x, y, w, h), ...] in frame coordinates
+    names: list = field(default_factory=list)   # one label per face
+    timings: dict = field(default_factory=dict)  # stage name -> seconds
+
+
+class DropOldestQueue:
+    """Bounded FIFO whose put() never blocks: when full, the oldest item is discarded."""
+
+    def __init__(self, maxsize: int):
+        self._items: deque = deque()
+        self._maxsize = max(1, maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item) -> None:
+        with self._cond:
+            if len(self._items) >= self._maxsize:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self, timeout: float | None = None):
+        """Return the oldest item, or None if nothing arrived within `timeout`."""
+        with self._cond:
+            if not self._items:
+                self._cond.wait(timeout)
+            return self._items.popleft() if self._items else None
+
+    def discard(self) -> None:
+        """Count an item the consumer threw away after get() (e.g. overtaken by a newer frame)."""
+        with self._cond:
+            self.dropped += 1
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+
+class RecentResults:
+    """Faces and names of the last few detected frames, for frames a worker skips detection on.
+
+    Workers finish out of order, so a skipped frame takes the newest result of an
+    *earlier* frame (never one captured after it), and faces and names always come
+    from the same frame.
+    """
+
+    def __init__(self, keep: int = 8):
+        self._results: list[tuple[int, list, list]] = []  # (seq, faces, names), ascending seq
+        self._keep = keep
+        self._lock = threading.Lock()
+
+    def record(self, seq: int, faces: list, names: list) -> None:
+        with self._lock:
+            i = len(self._results)
+            while i and self._results[i - 1][0] > seq:
+                i -= 1
+            self._results.insert(i, (seq, faces, names))
+            del self._results[:-self._keep]
+
+    def before(self, seq: int) -> tuple[list, list]:
+        """(faces, names) of the newest recorded frame older than `seq`, or nothing."""
+        with self._lock:
+            for recorded, faces, names in reversed(self._results):
+                if recorded < seq:
+                    return faces, names
+        return [], []
+
+
+class StageStats:
+    """Rolling per-stage latency samples (seconds) with a thread-safe summary."""
+
+    def __init__(self, window: int = 300):
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._window = window
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._samples.setdefault(stage, deque(maxlen=self._window)).append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            snapshot = {k: np.asarray(v) for k, v in self._samples.items() if v}
+        return {
+            stage: {
+                "mean_ms": float(v.mean() * 1000),
+                "p95_ms": float(np.percentile(v, 95) * 1000),
+                "count": int(len(v)),
+            }
+            for stage, v in snapshot.items()
+        }
+
+    def format(self) -> str:
+        return " | ".join(f"{stage}: {s['mean_ms']:.1f}ms (p95 {s['p95_ms']:.1f})"
+                          for stage, s in self.summary().items())
+
+
+class Pipeline:
+    """
+    read_frame() -> frame or None (None ends capture);
+    process(packet) fills packet.faces / packet.names in place and may run concurrently.
+    """
+
+    def __init__(self, read_frame: Callable[[], Any], process: Callable[[FramePacket], None],
+                 workers: int = 2, queue_size: int = 4):
+        self.read_frame = read_frame
+        self.process = process
+        self.workers = max(1, workers)
+        self.frames = DropOldestQueue(queue_size)
+        self.results = DropOldestQueue(queue_size)
+        self.stats = StageStats()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._capture_done = threading.Event()
+        self._last_seq = -1
+        self.errors = 0
+        self._errors_lock = threading.Lock()
+
+    # ------------------------------------------------------------- threads
+    def _capture_loop(self) -> None:
+        seq = 0
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            frame = self.read_frame()
+            if frame is None:
+                break
+            packet = FramePacket(seq, frame, time.perf_counter())
+            packet.timings["capture"] = packet.captured_at - t0
+            self.stats.record("capture", packet.timings["capture"])
+            self.frames.put(packet)
+            seq += 1
+        self._capture_done.set()
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            packet = self.frames.get(timeout=0.05)
+            if packet is None:
+                if self._capture_done.is_set() and not len(self.frames):
+                    break
+                continue
+            t0 = time.perf_counter()
+            packet.timings["queue"] = t0 - packet.captured_at
+            try:
+                self.process(packet)
+            except Exception:
+                # Keep the worker alive: one bad frame must not take the pool down
+                with self._errors_lock:
+                    self.errors += 1
+                print(f"[pipeline] {threading.current_thread().name} failed on frame {packet.seq}:")
+                traceback.print_exc()
+                continue
+            packet.timings["recognize"] = time.perf_counter() - t0
+            self.stats.record("queue", packet.timings["queue"])
+            self.stats.record("recognize", packet.timings["recognize"])
+            self.results.put(packet)
+
+    # ------------------------------------------------------------- control
+    def start(self) -> "Pipeline":
+        self._threads = [threading.Thread(target=self._capture_loop, name="capture", daemon=True)]
+        self._threads += [threading.Thread(target=self._worker_loop, name=f"recognize-{i}", daemon=True)
+                          for i in range(self.workers)]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout=1.0)
+
+    def finished(self) -> bool:
+        return self._capture_done.is_set() and not any(
+            t.is_alive() for t in self._threads if t.name.startswith("recognize"))
+
+    def next_result(self, timeout: float = 0.1) -> FramePacket | None:
+        """Next processed packet in capture order; packets overtaken by a newer one are dropped."""
+        while True:
+            packet = self.results.get(timeout)
+            if packet is None:
+                return None
+            if packet.seq > self._last_seq:
+                self._last_seq = packet.seq
+                return packet
+            self.results.discard()
+
+    def run(self, render: Callable[[FramePacket], bool], report_every: float = 5.0,
+            idle: Callable[[], bool] | None = None) -> None:
+        """Render loop: call render(packet) until it returns False or capture ends.
+
+        idle() is called whenever no result arrived within the poll interval, so the
+        UI keeps handling input while capture stalls; returning False stops the loop.
+        """
+        self.start()
+        last_report = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                packet = self.next_result()
+                if packet is None:
+                    if self.finished() and not len(self.results):
+                        break
+                    if idle is not None and idle() is False:
+                        break
+                    continue
+                t0 = time.perf_counter()
+                keep_going = render(packet)
+                now = time.perf_counter()
+                packet.timings["render"] = now - t0
+                self.stats.record("render", packet.timings["render"])
+                self.stats.record("end_to_end", now - packet.captured_at)
+                if report_every and now - last_report >= report_every:
+                    print(f"[pipeline] {self.stats.format()} | dropped "
+                          f"capture={self.frames.dropped} results={self.results.dropped} errors={self.errors}")
+                    last_report = now
+                if keep_going is False:
+                    break
+        finally:
+            self.stop()
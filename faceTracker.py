@@ -0,0 +1,87 @@
+# faceTracker.py
+"""
+Detect-once, track-between-detections mode for live recognition.
+
+Full Haar detection plus recognition only runs every `redetect_every` frames,
+or sooner when a track loses confidence. In between, each face is followed by
+normalized template matching inside a small search window around its last
+box, and keeps the identity it was given at the last detection until the
+next re-verification.
+
+The tracker is stateful and expects frames in capture order, so the live
+recognizer runs it with a single worker thread.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class Track:
+    box: tuple[int, int, int, int]  # x, y, w, h
+    name: str
+    template: np.ndarray             # grayscale crop taken at the last detection
+    confidence: float = 1.0
+
+
+class FaceTracker:
+    """
+    detect(gray) -> [(x, y, w, h), ...]
+    recognize(frame, boxes) -> [name, ...]
+    """
+
+    def __init__(self, detect: Callable, recognize: Callable, redetect_every: int = 10,
+                 min_confidence: float = 0.6, search_margin: float = 0.5):
+        self.detect = detect
+        self.recognize = recognize
+        self.redetect_every = max(1, redetect_every)
+        self.min_confidence = min_confidence
+        self.search_margin = search_margin
+        self.tracks: list[Track] = []
+        self._since_detect = 0
+        self.detections = 0  # full detect + recognize passes, for cost reporting
+
+    def _needs_detection(self) -> bool:
+        return (not self.tracks
+                or self._since_detect >= self.redetect_every
+                or min(t.confidence for t in self.tracks) < self.min_confidence)
+
+    def _follow(self, gray: np.ndarray, track: Track) -> None:
+        x, y, w, h = track.box
+        mx, my = int(w * self.search_margin), int(h * self.search_margin)
+        x0, y0 = max(0, x - mx), max(0, y - my)
+        x1, y1 = min(gray.shape[1], x + w + mx), min(gray.shape[0], y + h + my)
+        window = gray[y0:y1, x0:x1]
+        if window.shape[0] < h or window.shape[1] < w:
+            track.confidence = 0.0  # face left the frame
+            return
+        scores = cv2.matchTemplate(window, track.template, cv2.TM_CCOEFF_NORMED)
+        _, best, _, (bx, by) = cv2.minMaxLoc(scores)
+        track.box = (x0 + bx, y0 + by, w, h)
+        track.confidence = float(best)
+
+    def update(self, frame: np.ndarray, gray: np.ndarray | None = None):
+        """Return (boxes, names, detected) for this frame."""
+        if gray is None:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        if self._needs_detection():
+            boxes = [tuple(int(v) for v in b) for b in self.detect(gray)]
+            names = self.recognize(frame, boxes) if boxes else []
+            self.tracks = [Track(b, n, gray[b[1]:b[1] + b[3], b[0]:b[0] + b[2]].copy())
+                           for b, n in zip(boxes, names)]
+            self._since_detect = 1  # frames served since (and including) this detection
+            self.detections += 1
+            detected = True
+        else:
+            for track in self.tracks:
+                self._follow(gray, track)
+            self._since_detect += 1
+            detected = False
+
+        return [t.box for t in self.tracks], [t.name for t in self.tracks], detected
@@ -0,0 +1,92 @@
+# figureCache.py
+"""
+Rendered-chart cache for the Streamlit dashboard.
+
+Every rerun of dashboard.py used to rebuild all of its matplotlib figures,
+hand them to st.pyplot, and never close them. Now each chart passes its
+drawing code to `show_figure()`. The figure is drawn only when no PNG is
+cached for (chart id, drivers present, stats version). Its PNG bytes are
+kept in a process-wide LRU and the figure is closed straight away. A rerun
+where nothing changed only sends cached bytes to st.image.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+
+MAX_FIGURES = 64
+SAVE_KWARGS = {"format": "png", "dpi": 200, "bbox_inches": "tight"}  # what st.pyplot used
+# st.image decodes, downsizes and re-encodes anything wider than this (2 x 730 px) on every
+# call; storing PNGs already at most this wide lets it pass the cached bytes straight through
+MAX_WIDTH = 1460
+
+
+def figure_png(fig) -> bytes:
+    """PNG bytes of `fig`, at most MAX_WIDTH wide; the figure is closed afterwards either way."""
+    import matplotlib.pyplot as plt
+
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVE_KWARGS)
+    finally:
+        plt.close(fig)
+    from PIL import Image
+
+    image = Image.open(buffer)
+    if image.width <= MAX_WIDTH:
+        return buffer.getvalue()
+    image = image.resize((MAX_WIDTH, int(image.height * MAX_WIDTH / image.width)), Image.BILINEAR)
+    resized = io.BytesIO()
+    image.save(resized, format="PNG")
+    return resized.getvalue()
+
+
+class FigureCache:
+    """LRU of rendered PNGs, shared by every browser session of the dashboard process."""
+
+    def __init__(self, maxsize: int = MAX_FIGURES):
+        self.maxsize = maxsize
+        self._png: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, draw) -> bytes | None:
+        """Cached PNG for `key`, or draw() (a figure, or None for nothing to show) rendered and stored."""
+        with self._lock:
+            if key in self._png:
+                self._png.move_to_end(key)
+                self.hits += 1
+                return self._png[key]
+        fig = draw()
+        png = figure_png(fig) if fig is not None else None
+        with self._lock:
+            self.misses += 1
+            self._png[key] = png
+            while len(self._png) > self.maxsize:
+                self._png.popitem(last=False)
+        return png
+
+    def clear(self) -> None:
+        with self._lock:
+            self._png.clear()
+
+    def __len__(self) -> int:
+        return len(self._png)
+
+
+figures = FigureCache()
+
+
+def show_figure(chart_id: str, df, driver_info, draw) -> None:
+    """st.image of chart `chart_id` for the drivers in df, drawn by draw() only on a cache miss."""
+    import streamlit as st
+
+    from driverStats import stats_version
+
+    key = (chart_id, frozenset(df["driver_name"].tolist()), stats_version(driver_info))
+    png = figures.get(key, draw)
+    if png is not None:
+        st.image(png, use_container_width=True)
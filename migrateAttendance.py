@@ -0,0 +1,107 @@
+# migrateAttendance.py
+"""
+Import the old per-day attendance files into the consolidated store.
+
+    python migrateAttendance.py                 # everything in ./Attendance
+    python migrateAttendance.py --dir /backups/Attendance --dry-run
+
+Sources, oldest day first:
+
+* attendance_YYYY-MM-DD.db   - server.py's former one-database-per-day files;
+* Attendance_YYYY-MM-DD.csv  - the NAME,TIME log recognizeFace.py writes next
+                               to posting to the API.
+
+Every imported row gets a deterministic event_id (the original one when the
+row had it), so running the tool again imports nothing twice. A CSV line is
+skipped when the same driver already has a check-in within about a second of
+it, because most CSV lines are the local copy of an event the API also stored.
+The source files are left in place.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from attendanceStore import ATTENDANCE_DIR, DB_NAME, AttendanceStore
+
+DAY_FILE = re.compile(r"^attendance_(\d{4}-\d{2}-\d{2})\.(db|csv)$", re.IGNORECASE)
+
+
+def legacy_files(directory: Path) -> list[tuple[str, str, Path]]:
+    """(day, kind, path) for every per-day file, sorted by day with the .db before the .csv."""
+    found = []
+    for path in directory.iterdir():
+        match = DAY_FILE.match(path.name)
+        if match and path.name != DB_NAME:
+            found.append((match.group(1), match.group(2).lower(), path))
+    return sorted(found, key=lambda f: (f[0], f[1] != "db"))
+
+
+def _db_rows(day: str, path: Path) -> list[tuple]:
+    src = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        columns = [row[1] for row in src.execute("PRAGMA table_info(attendance)")]
+        event = "event_id" if "event_id" in columns else "NULL"
+        rows = src.execute(f"SELECT id, driver_name, timestamp, {event} FROM attendance ORDER BY id").fetchall()
+    finally:
+        src.close()
+    return [(name, ts, event_id or f"legacy-db-{day}-{row_id}") for row_id, name, ts, event_id in rows]
+
+
+def _csv_rows(day: str, path: Path) -> list[tuple]:
+    rows = []
+    with open(path, newline="") as f:
+        for line_no, row in enumerate(csv.reader(f), start=1):
+            if len(row) < 2 or row[0] == "NAME" or not row[0].strip():
+                continue
+            rows.append((row[0], f"{day}T{row[1]}", f"legacy-csv-{day}-{line_no}"))
+    return rows
+
+
+def _already_stored(conn: sqlite3.Connection, name: str, timestamp: str) -> bool:
+    """True when `name` has a check-in within a couple of seconds of `timestamp` (CSV lines have no event_id)."""
+    try:
+        t = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return False
+    lo, hi = (t - timedelta(seconds=1)).isoformat(), (t + timedelta(seconds=2)).isoformat()
+    return conn.execute("SELECT 1 FROM attendance WHERE driver_name = ? AND timestamp >= ? AND timestamp < ? LIMIT 1",
+                        (name, lo, hi)).fetchone() is not None
+
+
+def migrate(directory: Path = ATTENDANCE_DIR, store: AttendanceStore | None = None,
+            dry_run: bool = False) -> dict[str, int]:
+    """Import every per-day file; returns counts of files, rows read, rows imported and rows skipped."""
+    store = store or AttendanceStore(directory)
+    conn = store.connection()
+    counts = {"files": 0, "read": 0, "imported": 0, "skipped": 0}
+    for day, kind, path in legacy_files(Path(directory)):
+        rows = _db_rows(day, path) if kind == "db" else _csv_rows(day, path)
+        new = rows if kind == "db" else [r for r in rows if not _already_stored(conn, r[0], r[1])]
+        imported = conn.executemany("INSERT OR IGNORE INTO attendance (driver_name, timestamp, event_id) "
+                                    "VALUES (?, ?, ?)", new).rowcount
+        if not dry_run:
+            conn.commit()
+        counts["files"] += 1
+        counts["read"] += len(rows)
+        counts["imported"] += imported
+        counts["skipped"] += len(rows) - imported
+        print(f"{path.name}: {imported} of {len(rows)} rows imported")
+    if dry_run:
+        conn.rollback()  # one transaction for the whole dry run, so later files see earlier ones
+    return counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import per-day attendance .db/.csv files into attendance.db.")
+    parser.add_argument("--dir", type=Path, default=ATTENDANCE_DIR, help="folder holding the per-day files")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be imported, change nothing")
+    args = parser.parse_args()
+    totals = migrate(args.dir, dry_run=args.dry_run)
+    print(f"{totals['files']} files, {totals['read']} rows read, {totals['imported']} imported, "
+          f"{totals['skipped']} already present" + (" (dry run)" if args.dry_run else ""))
@@ -0,0 +1,167 @@
+# overlayAssets.py
+"""
+Driver logos and flags for the recognition screen, decoded once into a bundle.
+
+recognizeFace.py used to decode every .png/.jpg/.jpeg in data/logos and
+data/flags on each start (~0.6 s, ~107 MB of pixels). That included team
+logos, the 1024 px f1.png and timestamped copies it never draws. Where
+several files spelled the same driver, whichever os.listdir returned last
+won. Now `load_assets()`:
+
+* uses only files named after a driver the recognizer can show;
+* picks one file per driver: "First_Last" before "First Last", then .png,
+  .jpg, .jpeg. AVIF/WebP variants are still never read;
+* decodes files with identical bytes once;
+* stores each image as BGRA at ASSET_SIZE x ASSET_SIZE, the size of the
+  info panel, in data/overlayAssets.npz.
+
+The bundle records its version, size, the driver names and every source
+file's name, size and mtime. Like faceIndex.npz, it is rebuilt on the next
+start when any of those change, and otherwise loaded in one read.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+ROOT_DIR = Path(__file__).resolve().parent
+DATA_DIR = ROOT_DIR / "data"
+BUNDLE_FILE = "overlayAssets.npz"
+BUNDLE_VERSION = 1
+KINDS = ("logos", "flags")
+EXTENSIONS = (".png", ".jpg", ".jpeg")
+ASSET_SIZE = 200
+
+
+def driver_name(filename: str) -> str:
+    """'Lando_Norris.png' -> 'Lando Norris'."""
+    return os.path.splitext(filename)[0].replace("_", " ")
+
+
+def overlay_names(label_names=()) -> set[str]:
+    """Drivers the recognizer can draw: everyone in driver_info plus every enrolled face label.
+
+    The bundle's manifest includes this set, so recognizeFace.py and the CLI below must both
+    use it, or the recognizer throws away a bundle built by hand.
+    """
+    from driverInfo import driver_info
+
+    return set(driver_info) | {str(name) for name in label_names}
+
+
+def source_files(directory: Path) -> list[tuple[str, int, int]]:
+    """(name, size, mtime_ns) of every readable-format file in `directory`, sorted by name."""
+    if not directory.is_dir():
+        return []
+    return sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns) for e in os.scandir(directory)
+                  if e.is_file() and e.name.lower().endswith(EXTENSIONS))
+
+
+def pick_sources(filenames, names=None) -> dict[str, str]:
+    """{driver: file} choosing one file per driver in `names` (every driver when None)."""
+    def preference(filename):
+        stem, ext = os.path.splitext(filename)
+        return " " in stem, EXTENSIONS.index(ext.lower()), filename
+
+    picked = {}
+    for filename in sorted(filenames, key=preference):
+        name = driver_name(filename)
+        if (names is None or name in names) and name not in picked:
+            picked[name] = filename
+    return picked
+
+
+def to_bgra(img: np.ndarray, size: int = ASSET_SIZE) -> np.ndarray:
+    """Any cv2.imread result (gray, BGR, BGRA) as a size x size BGRA uint8 image."""
+    if img.dtype != np.uint8:  # 16-bit PNGs
+        img = (img >> 8).astype(np.uint8)
+    img = cv2.resize(img, (size, size), interpolation=cv2.INTER_AREA)
+    if img.ndim == 2:
+        return cv2.cvtColor(img, cv2.COLOR_GRAY2BGRA)
+    if img.shape[2] == 3:
+        return cv2.cvtColor(img, cv2.COLOR_BGR2BGRA)
+    return img
+
+
+def build(data_dir: Path = DATA_DIR, names=None, size: int = ASSET_SIZE) -> dict[str, dict[str, np.ndarray]]:
+    """Decode the picked logos and flags: {kind: {driver: BGRA image}}."""
+    assets, decoded = {}, {}
+    for kind in KINDS:
+        directory = data_dir / kind
+        picked = pick_sources([f for f, _, _ in source_files(directory)], names)
+        assets[kind] = {}
+        for name, filename in sorted(picked.items()):
+            data = (directory / filename).read_bytes()
+            digest = hashlib.sha1(data).digest()
+            if digest not in decoded:  # the same image saved under several drivers' names
+                img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_UNCHANGED)
+                decoded[digest] = to_bgra(img, size) if img is not None else None
+            if decoded[digest] is not None:
+                assets[kind][name] = decoded[digest]
+    return assets
+
+
+def _manifest(data_dir: Path, names, size: int) -> str:
+    return json.dumps({"version": BUNDLE_VERSION, "size": size,
+                       "names": sorted(names) if names is not None else None,
+                       "sources": {kind: source_files(data_dir / kind) for kind in KINDS}})
+
+
+def save(path: Path, assets: dict[str, dict[str, np.ndarray]], manifest: str, size: int = ASSET_SIZE) -> None:
+    arrays = {"version": BUNDLE_VERSION, "manifest": manifest}
+    for kind in KINDS:
+        names = list(assets.get(kind, {}))
+        arrays[f"{kind}_names"] = np.array(names, dtype=str)
+        arrays[f"{kind}_images"] = (np.stack([assets[kind][n] for n in names]) if names
+                                    else np.zeros((0, size, size, 4), np.uint8))
+    np.savez(path, **arrays)
+
+
+def load(path: Path) -> tuple[dict[str, dict[str, np.ndarray]], str]:
+    """(assets, manifest) from a bundle written by save()."""
+    with np.load(path, allow_pickle=False) as z:
+        if int(z["version"]) != BUNDLE_VERSION:
+            raise ValueError(f"{path} has bundle version {int(z['version'])}, expected {BUNDLE_VERSION}")
+        assets = {kind: dict(zip(z[f"{kind}_names"].tolist(), z[f"{kind}_images"])) for kind in KINDS}
+        return assets, str(z["manifest"])
+
+
+def load_assets(data_dir: Path = DATA_DIR, names=None, size: int = ASSET_SIZE,
+                rebuild: bool = False) -> dict[str, dict[str, np.ndarray]]:
+    """{kind: {driver: BGRA image}} from overlayAssets.npz, rebuilt first when missing or stale."""
+    path = data_dir / BUNDLE_FILE
+    manifest = _manifest(data_dir, names, size)
+    if path.exists() and not rebuild:
+        try:
+            assets, stored = load(path)
+            if stored == manifest:
+                return assets
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass
+    assets = build(data_dir, names, size)
+    save(path, assets, manifest, size)
+    return assets
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from faceIndex import load_or_build
+
+    parser = argparse.ArgumentParser(description="Build the recognizer's logo / flag bundle.")
+    parser.add_argument("--size", type=int, default=ASSET_SIZE)
+    args = parser.parse_args()
+
+    names = overlay_names(load_or_build(DATA_DIR).label_names)
+    t0 = time.perf_counter()
+    assets = load_assets(names=names, size=args.size, rebuild=True)
+    print(f"Bundle built in {(time.perf_counter() - t0) * 1000:.1f} ms: "
+          + ", ".join(f"{len(assets[kind])} {kind}" for kind in KINDS))
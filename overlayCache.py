@@ -0,0 +1,110 @@
+# overlayCache.py
+"""
+Pre-scaled, premultiplied overlay assets for the recognition screen.
+
+Logos and flags are resized once per (name, size) and kept in an LRU cache as
+premultiplied colour (uint16) plus inverse alpha (uint16), so compositing is
+a single vectorized integer expression over the affected ROI:
+
+    out = premul + (roi * (255 - alpha) + 127) // 255
+
+darken() replaces the full-frame `frame.copy()` + `cv2.addWeighted` used for
+the translucent info box, and touches only the box itself.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class OverlayAsset:
+    premul: np.ndarray              # (h, w, 3) uint16: colour * alpha / 255
+    inv_alpha: np.ndarray | None    # (h, w, 1) uint16: 255 - alpha, None when fully opaque
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self.premul.shape[1], self.premul.shape[0]
+
+
+def prepare_asset(img: np.ndarray, size: tuple[int, int]) -> OverlayAsset:
+    """Resize once and premultiply; BGR, BGRA and grayscale sources are accepted."""
+    img = cv2.resize(img, size, interpolation=cv2.INTER_AREA)
+    if img.ndim == 2:
+        img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+    if img.shape[2] == 4:
+        alpha = img[:, :, 3:4].astype(np.uint16)
+        if (alpha == 255).all():
+            return OverlayAsset(img[:, :, :3].astype(np.uint16), None)
+        premul = (img[:, :, :3].astype(np.uint16) * alpha + 127) // 255
+        return OverlayAsset(premul, 255 - alpha)
+    return OverlayAsset(img[:, :, :3].astype(np.uint16), None)
+
+
+def _clip(frame: np.ndarray, x: int, y: int, w: int, h: int):
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(frame.shape[1], x + w), min(frame.shape[0], y + h)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return x0, y0, x1, y1
+
+
+def blit(frame: np.ndarray, asset: OverlayAsset, x: int, y: int) -> None:
+    """Alpha-composite `asset` onto `frame` in place with its top-left corner at (x, y)."""
+    w, h = asset.size
+    clipped = _clip(frame, x, y, w, h)
+    if clipped is None:
+        return
+    x0, y0, x1, y1 = clipped
+    src = np.s_[y0 - y:y1 - y, x0 - x:x1 - x]
+    roi = frame[y0:y1, x0:x1]
+    if asset.inv_alpha is None:
+        roi[:] = asset.premul[src]
+    else:
+        roi[:] = asset.premul[src] + (roi * asset.inv_alpha[src] + 127) // 255
+
+
+def darken(frame: np.ndarray, start: tuple[int, int], end: tuple[int, int], alpha: float = 0.6) -> None:
+    """Blend a black box over [start, end] in place (same look as addWeighted with a black overlay)."""
+    clipped = _clip(frame, start[0], start[1], end[0] - start[0] + 1, end[1] - start[1] + 1)
+    if clipped is None:
+        return
+    x0, y0, x1, y1 = clipped
+    keep = int(round((1 - alpha) * 256))
+    roi = frame[y0:y1, x0:x1]
+    roi[:] = (roi.astype(np.uint16) * keep + 128) >> 8
+
+
+class OverlayCache:
+    """LRU cache of prepared assets keyed on (name, size); sources are decoded images by name."""
+
+    def __init__(self, sources: dict[str, np.ndarray], max_entries: int = 64):
+        self.sources = sources
+        self.max_entries = max_entries
+        self._assets: OrderedDict[tuple, OverlayAsset] = OrderedDict()
+
+    def get(self, name: str, size: tuple[int, int]) -> OverlayAsset | None:
+        key = (name, size)
+        asset = self._assets.get(key)
+        if asset is not None:
+            self._assets.move_to_end(key)
+            return asset
+        img = self.sources.get(name)
+        if img is None:
+            return None
+        asset = self._assets[key] = prepare_asset(img, size)
+        if len(self._assets) > self.max_entries:
+            self._assets.popitem(last=False)
+        return asset
+
+    def warm(self, size: tuple[int, int]) -> None:
+        """Pre-scale every source at startup so the first recognition costs nothing extra."""
+        for name in self.sources:
+            self.get(name, size)
+
+    def __len__(self) -> int:
+        return len(self._assets)
@@ -1,41 +1,50 @@
+import time
+STARTED = time.perf_counter()  # time-to-first-recognized-frame is measured from here
+
 import os
 from pathlib import Path
 import cv2
 import csv 
-import time
-import pickle
-import pyttsx3
-import requests
 import threading
 import numpy as np
-import mediapipe as mp
 from datetime import datetime
+from attendanceOutbox import AttendanceOutbox
+from detectScheduler import DetectScheduler
 from driverInfo import driver_info
-from sklearn.neighbors import KNeighborsClassifier
+from faceGallery import load_gallery, start_compactor
+from faceIndex import crop_rows, load_or_build
+from facePipeline import Pipeline, RecentResults
+from faceTracker import FaceTracker
+from overlayAssets import load_assets, overlay_names
+from overlayCache import OverlayCache, blit, darken
 
 
 ROOT_DIR = Path(__file__).resolve().parent
 DATA_DIR = ROOT_DIR / "data"
 ATTENDANCE_DIR = ROOT_DIR / "Attendance"
 
-# Load face detection model
-faceDetect = cv2.CascadeClassifier(str(DATA_DIR / "haarcascade_frontalface_default.xml"))
-
-# Load data (FACES and LABELS)
-with open(DATA_DIR / "listNames.pkl", 'rb') as f: 
-    LABELS = pickle.load(f)
-with open(DATA_DIR / "listFaces.pkl", 'rb') as f: 
-    FACES = pickle.load(f)
-
-# ====== FIX: Ensure equal number of samples ======
-min_samples = min(len(FACES), len(LABELS))  # Take the smallest count
-FACES = FACES[:min_samples]  # Trim to match
-LABELS = LABELS[:min_samples]  # Trim to match
-print(f"Training KNN with {len(FACES)} faces and {len(LABELS)} labels")  # Debug check
-
-# Train KNN
-Knn = KNeighborsClassifier(n_neighbors=5)
-Knn.fit(FACES, LABELS)
+# Startup phases in ms, reported with the first recognized frame
+startup = {"imports": (time.perf_counter() - STARTED) * 1000}
+
+# Load the face index (rebuilt from listFaces.pkl / listNames.pkl when stale)
+t0 = time.perf_counter()
+face_index = load_or_build(DATA_DIR)
+startup["model"] = (time.perf_counter() - t0) * 1000
+print(f"Face index loaded with {len(face_index.vectors)} faces and {len(face_index.label_names)} labels")  # Debug check
+gallery = load_gallery(DATA_DIR)
+
+
+def watch_gallery(interval=2.0):
+    """Add people enrolled by addFaces.py to the live index without restarting."""
+    while True:
+        time.sleep(interval)
+        try:
+            added = face_index.apply_segments(gallery)
+        except (OSError, ValueError) as e:
+            print(f"[gallery] could not apply new enrolments: {e}")
+            continue
+        if added:
+            print(f"[gallery] added {added} samples; index now knows {len(face_index.label_names)} people")
 
 COL_NAMES = ['NAME', 'TIME']
 
@@ -49,161 +58,211 @@ def speak(text):
         engine.runAndWait()
     threading.Thread(target=run, daemon=True).start()
 
+# Events are spooled locally and delivered in batches by a background thread (see attendanceOutbox.py)
+outbox = AttendanceOutbox()
+
 def send_attendance_to_api(driver_name):
-    url = "http://localhost:5006/attendance"  # make sure this matches your server.py
-    data = {
-        "driver_name": driver_name,
-        "timestamp": datetime.now().isoformat()
-    }
-    try:
-        response = requests.post(url, json=data)
-        if response.status_code == 200:
-            print(f"API logged: {driver_name}")
-        else:
-            print(f"API error: {response.status_code} — {response.text}")
-    except Exception as e:
-        print(f"API failed for {driver_name}: {e}")
+    outbox.enqueue(driver_name)
+    print(f"Queued for API: {driver_name} ({outbox.pending()} pending)")
 
-cap = cv2.VideoCapture(1)
 mode = "normal"  # Initial mode
 
-# Driver's team logo
-logo_dir = DATA_DIR / "logos"
-logos = {}  
-for file in os.listdir(logo_dir):
-    if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-        name = os.path.splitext(file)[0]  # "Lando Norris"
-        driver_name = name.replace("_", " ")
-        path = logo_dir / file
-        img = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
-        if img is not None:
-            logos[driver_name] = img
-
-# Driver's flag 
-flag_dir = DATA_DIR / "flags"
-flags= {}
-for file in os.listdir(flag_dir):
-    if file.lower().endswith(('.png', '.jpg', '.jpeg')):
-        name = os.path.splitext(file)[0]  # "Lando Norris"
-        driver_name = name.replace("_", " ")
-        path = flag_dir / file
-        img = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
-        if img is not None:
-            flags[driver_name] = img
-while True:
-    ret, frame = cap.read() 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    faces = faceDetect.detectMultiScale(gray, 1.3, 5)
-
-    attendance = None  # Reset for this frame
-    
-    for (x, y, w, h) in faces:
-        cropImage = frame[y:y+h, x:x+w]
-        reSizeImage = cv2.resize(cropImage, (50, 50)).flatten().reshape(1, -1)
-        output = Knn.predict(reSizeImage)
-        name= str(output[0])
-
-        # === Step 1: Draw Transparent Box ===
-        overlay = frame.copy()
-        box_start = (10, 10)
-        box_end = (400, 45)  # Adjust height based on how many info lines
-        cv2.rectangle(overlay, box_start, box_end, (0, 0, 0), -1)  # Solid black box
-
-        alpha = 0.6  # Transparency factor
-        frame = cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0)
-
-        ts = time.time()
-        date = datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
-        timestamp = datetime.fromtimestamp(ts).strftime("%H:%M:%S")
-        ATTENDANCE_DIR.mkdir(parents=True, exist_ok=True)
-        attendance_csv = ATTENDANCE_DIR / f"Attendance_{date}.csv"
-        exist = os.path.isfile(attendance_csv)
-        attendance = [str(output[0]), str(timestamp)]
-
-
-        cv2.putText(frame, str(output[0]), (x+200, y-20), cv2.FONT_HERSHEY_COMPLEX, 1, (255, 255, 255), 2) 
-        cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)  
-
-        
-        info = driver_info.get(name)
-        if info:
-             # Step 1: Draw transparent box
-            lines = info.strip().split('\n')
-    
-            # Step 1: Calculate dynamic box height
-            line_height = 30
-            padding = 20
-            header_height = 35
-            box_top = 10
-            box_bottom = box_top + header_height + len(lines) * line_height + padding
-
-            # Step 2: Draw background box
-            overlay = frame.copy()
-            box_start = (10, box_top)
-            box_end = (400, box_bottom)
-            cv2.rectangle(overlay, box_start, box_end, (0, 0, 0), -1)
-            frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
-
-            # Step 3: Draw logo
-            if name in logos:
-                logo = logos[name]
-                logo_size = 200
-                logo = cv2.resize(logo, (logo_size, logo_size))
-
-                frame_height, frame_width = frame.shape[:2]
-                x_offset = frame_width - logo_size - 10
-                y_offset = 10
-
-                # Before drawing logo, add a white border behind it (optional glow)
-                cv2.rectangle(frame, (x_offset-2, y_offset-2), (x_offset+logo_size+2, y_offset+logo_size+2), (0,0,0), thickness=5)
-                
-                if logo.shape[2] == 4:  # Has alpha channel
-                    alpha = logo[:, :, 3] / 255.0
-                    for c in range(3):
-                        frame[y_offset:y_offset+logo_size, x_offset:x_offset+logo_size, c] = (
-                            alpha * logo[:, :, c] +
-                            (1 - alpha) * frame[y_offset:y_offset+logo_size, x_offset:x_offset+logo_size, c]
-                        )
-                else:
-                    frame[y_offset:y_offset+logo_size, x_offset:x_offset+logo_size] = logo
-
-            # === Draw Flag (below logo)
-            if name in flags:
-                flag = flags[name]
-                flag_size = 200
-                flag = cv2.resize(flag, (flag_size, flag_size))
-
-                x_flag = frame.shape[1] - logo_size - flag_size - 20  # 10px space between them
-                y_flag = 10  # same vertical position as logo
-
-                # Before drawing logo, add a white border behind it (optional glow)
-                cv2.rectangle(frame, (x_flag-2, y_flag-2), (x_flag+flag_size+2, y_flag+flag_size+2), (0,0,0), thickness=5)
-
-                if flag.shape[2] == 4:
-                    alpha = flag[:, :, 3] / 255.0
-                    for c in range(3):
-                        frame[y_flag:y_flag+flag_size, x_flag:x_flag+flag_size, c] = (
-                            alpha * flag[:, :, c] +
-                            (1 - alpha) * frame[y_flag:y_flag+flag_size, x_flag:x_flag+flag_size, c]
-                        )
-                else:
-                    frame[y_flag:y_flag+flag_size, x_flag:x_flag+flag_size] = flag
-
-
-            # Step 2: Draw text
-            cv2.putText(frame, name.upper(), (20, 35), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-            lines = info.strip().split('\n')
-            for i, line in enumerate(info.split('\n')):
-                y = 65 + i * 30
-                cv2.putText(frame, line, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-        break  # Only one face per frame
+# Drivers' team logos and flags, decoded once into data/overlayAssets.npz (see overlayAssets.py),
+# then pre-scaled and stored premultiplied (see overlayCache.py)
+t0 = time.perf_counter()
+assets = load_assets(DATA_DIR, names=overlay_names(face_index.label_names))
+logo_cache = OverlayCache(assets["logos"])
+flag_cache = OverlayCache(assets["flags"])
+logo_cache.warm((200, 200))
+flag_cache.warm((200, 200))
+startup["assets"] = (time.perf_counter() - t0) * 1000
+
+
+# One cascade per worker thread: CascadeClassifier is not safe to share across threads
+_thread_local = threading.local()
+
+def get_face_detector():
+    if not hasattr(_thread_local, "faceDetect"):
+        _thread_local.faceDetect = cv2.CascadeClassifier(str(DATA_DIR / "haarcascade_frontalface_default.xml"))
+    return _thread_local.faceDetect
+
+
+# Set by main(): picks the detection resolution and interval (see detectScheduler.py)
+scheduler = None
+
+
+def _cascade(gray):
+    return get_face_detector().detectMultiScale(gray, 1.3, 5)
+
+
+def detect_faces(gray):
+    """Every face in the frame as (x, y, w, h) tuples, largest first."""
+    faces = scheduler.detect(gray, _cascade) if scheduler is not None else _cascade(gray)
+    return sorted((tuple(int(v) for v in f) for f in faces), key=lambda f: f[2] * f[3], reverse=True)
+
+
+def recognize_faces(frame, boxes):
+    """Recognize every face in one batched predict over a stacked N x 7500 matrix."""
+    if not len(boxes):
+        return []
+    return [str(n) for n in face_index.predict(crop_rows(frame, boxes))]
+
+
+# Faces and names of recently detected frames, reused on frames the scheduler skips
+_recent = RecentResults()
+
+def detect_and_recognize(packet):
+    """Worker stage: fill packet.faces / packet.names for the frame it carries."""
+    t0 = time.perf_counter()
+    if scheduler is None or scheduler.should_detect():
+        gray = cv2.cvtColor(packet.frame, cv2.COLOR_BGR2GRAY)
+        faces = detect_faces(gray)
+        names = recognize_faces(packet.frame, faces)
+        _recent.record(packet.seq, faces, names)
+    else:
+        faces, names = _recent.before(packet.seq)
+    packet.faces.extend(faces)
+    packet.names.extend(names)
+    if scheduler is not None:
+        scheduler.record(time.perf_counter() - t0)
+
+
+# Set by main() when --track is enabled
+tracker = None
+
+def track_and_recognize(packet):
+    """Worker stage in tracking mode: full detection only every N frames or on low confidence."""
+    t0 = time.perf_counter()
+    if scheduler is not None:
+        tracker.redetect_every = scheduler.interval
+    boxes, names, detected = tracker.update(packet.frame)
+    if scheduler is not None:
+        scheduler.record(time.perf_counter() - t0)
+    packet.faces.extend(boxes)
+    packet.names.extend(names)
+    packet.timings["detected"] = detected
+
+
+def draw_overlay(frame, x, y, w, h, name):
+    """Render stage: box, label, info panel, logo and flag for one recognized face."""
+    # === Step 1: Draw Transparent Box ===
+    darken(frame, (10, 10), (400, 45), alpha=0.6)  # Adjust height based on how many info lines
+
+    cv2.putText(frame, name, (x+200, y-20), cv2.FONT_HERSHEY_COMPLEX, 1, (255, 255, 255), 2) 
+    cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)  
 
     
+    info = driver_info.get(name)
+    if info:
+        lines = info.strip().split('\n')
+
+        # Step 1: Calculate dynamic box height
+        line_height = 30
+        padding = 20
+        header_height = 35
+        box_top = 10
+        box_bottom = box_top + header_height + len(lines) * line_height + padding
+
+        # Step 2: Draw background box
+        darken(frame, (10, box_top), (400, box_bottom), alpha=0.6)
+
+        # Step 3: Draw logo
+        logo_size = 200
+        logo = logo_cache.get(name, (logo_size, logo_size))
+        if logo is not None:
+            frame_height, frame_width = frame.shape[:2]
+            x_offset = frame_width - logo_size - 10
+            y_offset = 10
+
+            # Before drawing logo, add a white border behind it (optional glow)
+            cv2.rectangle(frame, (x_offset-2, y_offset-2), (x_offset+logo_size+2, y_offset+logo_size+2), (0,0,0), thickness=5)
+            blit(frame, logo, x_offset, y_offset)
+
+        # === Draw Flag (below logo)
+        flag_size = 200
+        flag = flag_cache.get(name, (flag_size, flag_size))
+        if flag is not None:
+            x_flag = frame.shape[1] - logo_size - flag_size - 20  # 10px space between them
+            y_flag = 10  # same vertical position as logo
+
+            # Before drawing logo, add a white border behind it (optional glow)
+            cv2.rectangle(frame, (x_flag-2, y_flag-2), (x_flag+flag_size+2, y_flag+flag_size+2), (0,0,0), thickness=5)
+            blit(frame, flag, x_flag, y_flag)
+
+
+        # Step 2: Draw text
+        cv2.putText(frame, name.upper(), (20, 35), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+        for i, line in enumerate(info.split('\n')):
+            y = 65 + i * 30
+            cv2.putText(frame, line, (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+    return frame
+
+
+def draw_face_badge(frame, x, y, w, h, name):
+    """Render stage for every face after the first: box, name and a small logo/flag badge."""
+    cv2.rectangle(frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
+    cv2.putText(frame, name, (x, max(20, y-10)), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+
+    badge_size = 64
+    x_badge = x
+    for cache in (logo_cache, flag_cache):
+        badge = cache.get(name, (badge_size, badge_size))
+        if badge is not None:
+            blit(frame, badge, x_badge, y + h + 6)
+            x_badge += badge_size + 6
+    return frame
+
+
+def log_attendance(name):
+    ts = time.time()
+    date = datetime.fromtimestamp(ts).strftime('%Y-%m-%d')
+    timestamp = datetime.fromtimestamp(ts).strftime("%H:%M:%S")
+    ATTENDANCE_DIR.mkdir(parents=True, exist_ok=True)
+    csv_path = ATTENDANCE_DIR / f"Attendance_{date}.csv"
+    write_header = not os.path.isfile(csv_path) or os.path.getsize(csv_path) == 0
+
+    with open(csv_path, 'a', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        if write_header:
+            writer.writerow(COL_NAMES)
+        writer.writerow([name, str(timestamp)])
+
+    # log to API too
+    send_attendance_to_api(name)  # logs driver name to the API
+
+
+def report_first_recognition():
+    """Print time-to-first-recognized-frame once, with the startup phases it includes."""
+    if "first_frame" in startup:
+        return
+    startup["first_frame"] = (time.perf_counter() - STARTED) * 1000
+    print("[startup] first recognized frame after {first_frame:.0f} ms "
+          "(imports {imports:.0f} ms, model {model:.0f} ms, assets {assets:.0f} ms)".format(**startup))
+
+
+# Set by main(): say "<name> present" when attendance is logged (--speak)
+announce = False
+
+
+def render(packet):
+    """Render stage: draw the packet's own recognition results and handle keys."""
+    frame = packet.frame
+    if packet.names:
+        report_first_recognition()
+    # Largest face gets the full info panel; everyone else gets a badge next to their box
+    for i, ((x, y, w, h), name) in enumerate(zip(packet.faces, packet.names)):
+        draw = draw_overlay if i == 0 else draw_face_badge
+        frame = draw(frame, x, y, w, h, name)
+
     #frame = cv2.flip(frame, 1) Flips the Frame 
     output_image = frame
 
-    # Display mode and instructions
-    cv2.putText(output_image, "Press 'a' to send data to API", (1400, 1000), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
+    # Display mode and instructions (anchored to the bottom corners, whatever the capture size)
+    frame_height, frame_width = output_image.shape[:2]
+    cv2.putText(output_image, "Press 'a' to send data to API", (frame_width - 380, frame_height - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
+    if scheduler is not None:
+        scheduler.frame_rendered()
+        cv2.putText(output_image, scheduler.status(), (20, frame_height - 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
 
     # Maintain list of already marked names (at top of script):
     marked_names = set()
@@ -217,35 +276,81 @@ while True:
     cv2.imshow("frame", output_image)  
     
     key = cv2.waitKey(1)
-    if key == ord('a'):
+    if key == ord('a') and packet.names:
 
         #phrase= driver_info.get(attendance[0], f"{attendance[0]} is present")
-        #speak("Present")
-
-        csv_path = ATTENDANCE_DIR / f"Attendance_{date}.csv"
-        write_header = not os.path.isfile(csv_path) or os.path.getsize(csv_path) == 0
-
-        if exist:
-            with open(csv_path, 'a', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(attendance)
-                
-        else:
-            with open(csv_path, 'a', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                if write_header:
-                    writer.writerow(COL_NAMES)
-                    writer.writerow(attendance)
-                
-
-        # log to API too
-        send_attendance_to_api(attendance[0])  # logs driver name to the API
+        for name in dict.fromkeys(packet.names):  # everyone in frame, once each
+            log_attendance(name)
+            if announce:
+                speak(f"{name} present")
 
     elif key == ord('q'):
-        break
-
-cap.release()
-cv2.destroyAllWindows()
+        return False
+    return True
+
+
+def idle():
+    """No new result yet (e.g. capture stalled): keep the window responsive to 'q'."""
+    return cv2.waitKey(1) != ord('q')
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Live F1 driver recognition.")
+    parser.add_argument("--camera", type=int, default=1, help="cv2.VideoCapture device index")
+    parser.add_argument("--workers", type=int, default=2, help="detection/recognition threads")
+    parser.add_argument("--queue-size", type=int, default=4, help="frames buffered per stage before dropping the oldest")
+    parser.add_argument("--track", type=int, default=0, metavar="N",
+                        help="detect/recognize every N frames and track faces in between (0 = off)")
+    parser.add_argument("--min-track-confidence", type=float, default=0.6,
+                        help="re-run detection early when a track's match score drops below this")
+    parser.add_argument("--target-fps", type=float, default=15.0,
+                        help="detection resolution and interval adapt to hold this frame rate")
+    parser.add_argument("--detect-width", type=int, default=640,
+                        help="width the frame is downscaled to for face detection (upper bound when adapting)")
+    parser.add_argument("--max-detect-interval", type=int, default=8,
+                        help="detect at least every N frames, however slow detection gets")
+    parser.add_argument("--speak", action="store_true",
+                        help="announce each driver logged with 'a' (text-to-speech; loads pyttsx3 only then)")
+    args = parser.parse_args()
+
+    global announce
+    announce = args.speak
+    cap = cv2.VideoCapture(args.camera)
+    threading.Thread(target=watch_gallery, name="gallery-watcher", daemon=True).start()
+    start_compactor(gallery)
+    outbox.start()
+
+    def read_frame():
+        ret, frame = cap.read()
+        return frame if ret else None
+
+    global tracker, scheduler
+    process, workers = detect_and_recognize, args.workers
+    scheduler = DetectScheduler(target_fps=args.target_fps, working_width=args.detect_width,
+                                min_interval=max(1, args.track), max_interval=max(args.track, args.max_detect_interval),
+                                workers=1 if args.track else workers)
+    if args.track:
+        # Tracking needs frames in order, so it runs on a single worker
+        tracker = FaceTracker(detect_faces, recognize_faces, redetect_every=args.track, min_confidence=args.min_track_confidence)
+        process, workers = track_and_recognize, 1
+
+    pipeline = Pipeline(read_frame, process, workers=workers, queue_size=args.queue_size)
+    try:
+        pipeline.run(render, idle=idle)
+    finally:
+        print(f"[pipeline] final: {pipeline.stats.format()}")
+        if tracker is not None:
+            print(f"[tracker] full detections: {tracker.detections}")
+        print(f"[scheduler] {scheduler.status()}")
+        cap.release()
+        cv2.destroyAllWindows()
+        outbox.stop()
+
+
+if __name__ == "__main__":
+    main()
 
 
 
@@ -2,10 +2,15 @@
 """
 Pure (testable) fantasy scoring functions.
 Keep this file free of Streamlit / plotting side-effects.
+
+compute_fantasy_score scores one driver; fantasy_scores / score_drivers do the
+same for whole columns of drivers (or historical seasons) with NumPy.
 """
 
 from __future__ import annotations
 
+import numpy as np
+
 
 def safe_div(n: float, d: float) -> float:
     return (n / d) if d else 0.0
@@ -53,3 +58,114 @@ def compute_fantasy_score(
 
     return float(score)
 
+
+
+# --------------------------------------------------------------------------
+# Batch scoring: whole driver tables (or seasons) as NumPy columns at once.
+# --------------------------------------------------------------------------
+
+def _column(values, integer: bool = True) -> np.ndarray:
+    """float64 array clamped at zero; counts are truncated like int() first."""
+    arr = np.asarray(values, dtype=np.float64)
+    if integer:
+        arr = np.trunc(arr)
+    return np.maximum(arr, 0.0)
+
+
+def safe_divide(n, d) -> np.ndarray:
+    """n / d, and 0.0 where d is 0 (safe_div, element-wise)."""
+    n, d = np.broadcast_arrays(np.asarray(n, dtype=np.float64), np.asarray(d, dtype=np.float64))
+    return np.divide(n, d, out=np.zeros(n.shape), where=d != 0)
+
+
+def fantasy_scores(*, wins=0, podiums=0, races=0, poles=0, points=0.0, fastest_laps=0, dnfs=0) -> np.ndarray:
+    """compute_fantasy_score over arrays; element i equals the scalar score of row i exactly."""
+    wins, podiums, races, poles = _column(wins), _column(podiums), _column(races), _column(poles)
+    points, fastest_laps, dnfs = _column(points, integer=False), _column(fastest_laps), _column(dnfs)
+
+    # Same terms in the same order as compute_fantasy_score, so the float sums are identical
+    score = np.zeros(np.broadcast(wins, podiums, races, poles, points, fastest_laps, dnfs).shape)
+    score = score + wins * 10
+    score = score + podiums * 6
+    score = score + safe_divide(points, races) * 2.5
+    score = score + safe_divide(wins, races) * 40
+    score = score + safe_divide(podiums, races) * 25
+    score = score + safe_divide(wins, poles) * 10
+    score = score + safe_divide(fastest_laps, races) * 15
+    score = score - safe_divide(dnfs, races) * 30
+    return score
+
+
+def overall_scores(*, wins, poles, podiums, points, dnfs, races, wins_from_pole, fastest_laps) -> dict:
+    """The dashboard's overall performance score and the ratios it shows, per driver.
+
+    Rows with races == 0 get ratios of 0 (the dashboard leaves those drivers out).
+    """
+    wins, poles, podiums, points, dnfs, races, wins_from_pole, fastest_laps = (
+        np.asarray(c, dtype=np.float64) for c in (wins, poles, podiums, points, dnfs, races, wins_from_pole, fastest_laps))
+    win_rate = safe_divide(wins, races)
+    points_per_race = safe_divide(points, races)
+    win_conversion = safe_divide(wins, podiums)
+    pole_win_conversion = safe_divide(wins_from_pole, poles)
+    finish_rate = safe_divide(races - dnfs, races)
+    podium_rate = safe_divide(podiums, races)
+    fastest_lap_rate = safe_divide(fastest_laps, races)
+
+    score = (
+        (wins * 2.0) +
+        (poles * 1.2) +
+        (podiums * 0.7) +
+        (points_per_race * 2.5) +
+        (podium_rate * 1.5) +
+        (win_conversion * 2.0) +
+        (finish_rate * 10.0) +
+        (pole_win_conversion * 1.5) +
+        (fastest_lap_rate * 5.0) +
+        (win_rate * 30.0) -
+        (dnfs * 0.7)
+    )
+    score = score * np.minimum(1.0, 1 + np.log1p(races / 50))  # career length factor
+    return {
+        "raw_score": score,
+        "points_per_race": points_per_race,
+        "win_conversion": win_conversion,
+        "pole_win_conversion": pole_win_conversion,
+        "finish_rate": finish_rate,
+        "fastest_lap_rate": fastest_lap_rate,
+    }
+
+
+def iqr_normalize(scores) -> np.ndarray:
+    """Map scores onto 0-100: the median-ish middle half spans 50 +/- 25 points, rounded to 0.1.
+
+    Every score is 50.0 when the interquartile range is 0.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return scores
+    q1, q3 = np.percentile(scores, [25, 75])
+    iqr = q3 - q1
+    if not iqr > 0:
+        return np.full(scores.shape, 50.0)
+    return np.round(np.clip((scores - q1) / iqr * 25 + 50, 0, 100), 1)
+
+
+def tie_break_ranks(scores, tiebreak) -> np.ndarray:
+    """1-based rank by score (highest first), equal scores ordered by tiebreak (highest first)."""
+    order = np.lexsort((-np.asarray(tiebreak, dtype=np.float64), -np.asarray(scores, dtype=np.float64)))
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(1, len(order) + 1)
+    return ranks
+
+
+def score_drivers(*, wins, podiums, races, poles=0, points=0.0, fastest_laps=0, dnfs=0, tiebreak=None):
+    """(scores, IQR-normalized scores, ranks) for many drivers in one pass.
+
+    Ties in the normalized score are broken by `tiebreak`, by default the win rate.
+    """
+    scores = fantasy_scores(wins=wins, podiums=podiums, races=races, poles=poles, points=points,
+                            fastest_laps=fastest_laps, dnfs=dnfs)
+    normalized = iqr_normalize(scores)
+    if tiebreak is None:
+        tiebreak = safe_divide(_column(wins), _column(races))
+    return scores, normalized, tie_break_ranks(normalized, np.broadcast_to(tiebreak, normalized.shape))
@@ -0,0 +1,180 @@
+# seasonSimulator.py
+"""
+Monte Carlo projection of end-of-season fantasy scores.
+
+    python seasonSimulator.py --seasons 100000 --races 24
+    python seasonSimulator.py --seasons 200000 --workers 4 --what-if "Kimi Antonelli:win=0.15,dnf=0.05"
+
+Each driver's per-race outcome rates come from their career numbers in
+driver_info (via driverStats): win, other podium, DNF or another finish, plus
+independent fastest-lap and pole chances. A season is `races` independent
+races per driver. Drawing those races one by one is equivalent to one
+multinomial draw of the outcome counts, plus binomial draws for fastest laps
+and poles, so a whole block of seasons for every driver is a few NumPy calls.
+Season points are 25 per win and 16.5 per other podium (the mean of 18 and
+15). Other finishes score a per-driver amount, calibrated so the expected
+points per race match the driver's career average. Each simulated season
+is then scored with scoring.fantasy_scores, the exact array form of
+compute_fantasy_score.
+
+The result is a (seasons x drivers) score matrix. `summarize()` turns it into
+percentiles, mean finishing rank and title odds per driver, and
+`percentile_rank()` places any score within a driver's distribution.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from driverStats import stats_table
+from scoring import fantasy_scores
+
+RACES = 24
+WIN_POINTS, PODIUM_POINTS = 25.0, 16.5
+BLOCK = 20_000  # seasons simulated per NumPy pass (bounds memory at ~drivers x BLOCK x 4 counts)
+RATES = ["win", "podium", "dnf", "fastest_lap", "pole", "finish_points"]
+
+
+def driver_rates(driver_info: dict | None = None) -> pd.DataFrame:
+    """Per-race rates for every driver with a full record (one row per driver, RATES columns)."""
+    stats = stats_table(driver_info)[["races", "wins", "podiums", "dnfs", "fastest_laps", "poles", "points"]]
+    stats = stats.dropna()
+    stats = stats[stats["races"] > 0].astype("float64")
+    races = stats["races"]
+    rates = pd.DataFrame({
+        "win": stats["wins"] / races,
+        "podium": (stats["podiums"] - stats["wins"]).clip(lower=0) / races,  # podiums other than wins
+        "dnf": stats["dnfs"] / races,
+        "fastest_lap": stats["fastest_laps"] / races,
+        "pole": stats["poles"] / races,
+    })
+    return with_finish_points(rates, stats["points"] / races)
+
+
+def with_finish_points(rates: pd.DataFrame, points_per_race) -> pd.DataFrame:
+    """Fill `finish_points` so a driver's expected points per race equal `points_per_race`."""
+    rates = rates.copy()
+    finish = (1 - rates["win"] - rates["podium"] - rates["dnf"]).clip(lower=0)
+    podium_points = WIN_POINTS * rates["win"] + PODIUM_POINTS * rates["podium"]
+    rates["finish_points"] = ((points_per_race - podium_points) / finish.where(finish > 0)).fillna(0).clip(lower=0)
+    return rates
+
+
+def what_if(rates: pd.DataFrame, overrides: dict[str, dict[str, float]]) -> pd.DataFrame:
+    """Copy of `rates` with some drivers' rates replaced, e.g. {"Lando Norris": {"win": 0.4}}."""
+    rates = rates.copy()
+    for driver, values in overrides.items():
+        if driver not in rates.index:
+            raise KeyError(f"unknown driver {driver!r}")
+        for column, value in values.items():
+            if column not in RATES:
+                raise KeyError(f"unknown rate {column!r}, expected one of {RATES}")
+            rates.loc[driver, column] = float(value)
+    return rates
+
+
+def _outcome_probabilities(rates: pd.DataFrame) -> np.ndarray:
+    """(drivers, 4) probabilities of win / other podium / DNF / other finish, scaled down if they exceed 1."""
+    p = rates[["win", "podium", "dnf"]].to_numpy(dtype=np.float64).clip(0, 1)
+    total = p.sum(axis=1, keepdims=True)
+    p = np.where(total > 1, p / np.maximum(total, 1e-12), p)
+    return np.hstack([p, 1 - p.sum(axis=1, keepdims=True).clip(max=1)]).clip(0, 1)
+
+
+def simulate_block(rates: pd.DataFrame, seasons: int, races: int = RACES, seed=None) -> np.ndarray:
+    """Fantasy scores of `seasons` simulated seasons, shape (seasons, drivers), in one process."""
+    rng = np.random.default_rng(seed)
+    probs = _outcome_probabilities(rates)
+    fastest_lap = rates["fastest_lap"].to_numpy(dtype=np.float64).clip(0, 1)
+    pole = rates["pole"].to_numpy(dtype=np.float64).clip(0, 1)
+    finish_points = rates["finish_points"].to_numpy(dtype=np.float64)
+
+    scores = np.empty((seasons, len(rates)))
+    for start in range(0, seasons, BLOCK):
+        n = min(BLOCK, seasons - start)
+        counts = rng.multinomial(races, probs, size=(n, len(rates)))
+        wins, other_podiums, dnfs, finishes = (counts[..., i] for i in range(4))
+        scores[start:start + n] = fantasy_scores(
+            wins=wins,
+            podiums=wins + other_podiums,
+            races=races,
+            poles=rng.binomial(races, pole, size=(n, len(rates))),
+            points=WIN_POINTS * wins + PODIUM_POINTS * other_podiums + finish_points * finishes,
+            fastest_laps=rng.binomial(races, fastest_lap, size=(n, len(rates))),
+            dnfs=dnfs,
+        )
+    return scores
+
+
+def _simulate_part(args) -> np.ndarray:
+    return simulate_block(*args)
+
+
+def simulate(rates: pd.DataFrame | None = None, seasons: int = 100_000, races: int = RACES,
+             seed: int | None = None, workers: int = 1) -> np.ndarray:
+    """Scores of `seasons` seasons for every driver in `rates` (columns in rates.index order).
+
+    With workers > 1 the seasons are split over a process pool; each part gets its own
+    child seed, so a given (seed, workers) pair always gives the same result.
+    """
+    rates = driver_rates() if rates is None else rates
+    if workers <= 1:
+        return simulate_block(rates, seasons, races, seed)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    sizes = [seasons // workers + (i < seasons % workers) for i in range(workers)]
+    with ProcessPoolExecutor(workers) as pool:
+        parts = pool.map(_simulate_part, [(rates, n, races, s) for n, s in zip(sizes, seeds) if n])
+        return np.concatenate(list(parts))
+
+
+def summarize(scores: np.ndarray, drivers) -> pd.DataFrame:
+    """Per driver: mean / p5 / p50 / p95 score, mean finishing rank and how often they top the league."""
+    p5, p50, p95 = np.percentile(scores, [5, 50, 95], axis=0)
+    ranks = (-scores).argsort(axis=1).argsort(axis=1) + 1  # 1 = best score that season
+    summary = pd.DataFrame({
+        "mean": scores.mean(axis=0),
+        "p5": p5,
+        "p50": p50,
+        "p95": p95,
+        "mean_rank": ranks.mean(axis=0),
+        "title_odds": (ranks == 1).mean(axis=0),
+    }, index=pd.Index(list(drivers), name="driver_name"))
+    return summary.sort_values("mean", ascending=False)
+
+
+def percentile_rank(scores: np.ndarray, drivers, driver: str, score: float) -> float:
+    """Percent of `driver`'s simulated seasons scoring at or below `score`."""
+    column = scores[:, list(drivers).index(driver)]
+    return float((column <= score).mean() * 100)
+
+
+def _parse_what_if(specs: list[str]) -> dict[str, dict[str, float]]:
+    overrides = {}
+    for spec in specs:
+        driver, _, values = spec.partition(":")
+        overrides[driver.strip()] = {k.strip(): float(v) for k, v in (kv.split("=") for kv in values.split(","))}
+    return overrides
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project end-of-season fantasy scores by Monte Carlo simulation.")
+    parser.add_argument("--seasons", type=int, default=100_000)
+    parser.add_argument("--races", type=int, default=RACES)
+    parser.add_argument("--workers", type=int, default=1, help="processes to spread the seasons over")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--what-if", action="append", default=[], metavar="DRIVER:rate=value,...",
+                        help=f"override a driver's rates ({', '.join(RATES)}); repeatable")
+    args = parser.parse_args()
+
+    rates = what_if(driver_rates(), _parse_what_if(args.what_if))
+    t0 = time.perf_counter()
+    scores = simulate(rates, args.seasons, args.races, args.seed, args.workers)
+    elapsed = time.perf_counter() - t0
+    pd.set_option("display.width", 120)
+    print(summarize(scores, rates.index).round(3))
+    print(f"{args.seasons} seasons x {len(rates)} drivers in {elapsed:.2f}s ({args.seasons / elapsed:,.0f} seasons/s)")
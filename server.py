@@ -1,34 +1,46 @@
-import sqlite3
-from pathlib import Path
+import os
+import zlib
 from flask_cors import CORS
 from datetime import datetime
 from flask import Flask, request, jsonify
+from attendanceFeed import HEARTBEAT, AttendanceFeed, format_event
+from attendanceStore import INSERT, AttendanceStore, last_id, select_checkins, summarize
+from attendanceWriter import GroupCommitWriter
 
 app = Flask(__name__)
 CORS(app)
 portID= 5006
 
-# SQLite database path
-def get_today_db_path():
-    date_str = datetime.now().strftime('%Y-%m-%d')
-    attendance_dir = Path(__file__).resolve().parent / "Attendance"
-    attendance_dir.mkdir(parents=True, exist_ok=True)
-    return str(attendance_dir / f"attendance_{date_str}.db")
+# One WAL-mode connection per request thread, today's path cached (see attendanceStore.py)
+store = AttendanceStore()
+
+# Wakes /attendance/stream connections after every commit (see attendanceFeed.py)
+feed = AttendanceFeed()
+
+# Ingest mode: "direct" commits every request itself; "flush" / "enqueue" hand rows to a
+# group-commit writer and acknowledge after the batch is committed / as soon as it is queued
+INGEST_MODE = os.environ.get("F1_INGEST", "direct")
+writer = None
+if INGEST_MODE != "direct":
+    writer = GroupCommitWriter(store, max_batch=int(os.environ.get("F1_FLUSH_EVENTS", 256)),
+                               max_delay_ms=float(os.environ.get("F1_FLUSH_MS", 2)), durability=INGEST_MODE,
+                               on_commit=feed.notify)
+
+def store_rows(rows):
+    """Insert (driver_name, timestamp, event_id) rows; returns (rows stored or None if only queued, HTTP status)."""
+    if writer is not None:
+        stored = writer.submit(rows)
+        return stored, 202 if stored is None else 200
+    conn = store.connection()
+    # rowcount, not total_changes: the rollup triggers' writes are counted in the latter
+    stored = conn.executemany(INSERT, rows).rowcount
+    conn.commit()
+    feed.notify()
+    return stored, 200
 
 # Initialize the SQLite database
 def init_db():
-    db_path= get_today_db_path();
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS attendance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            driver_name TEXT NOT NULL,
-            timestamp TEXT NOT NULL
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    store.connection()
 
 init_db()
 
@@ -39,30 +51,132 @@ def log_attendance():
     driver = data.get("driver_name")
     timestamp = data.get("timestamp") or datetime.now().isoformat()
 
-    db_path= get_today_db_path();
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('INSERT INTO attendance (driver_name, timestamp) VALUES (?, ?)', (driver, timestamp))
-    conn.commit()
-    conn.close()
+    _, status = store_rows([(driver, timestamp, None)])
 
     print(f"Stored: {driver} at {timestamp}")
-    return jsonify({"status": "success"})
+    return jsonify({"status": "success"}), status
+
+# Log a batch of attendance events (from attendanceOutbox.py) in one transaction
+@app.route('/attendance/bulk', methods=['POST'])
+def log_attendance_bulk():
+    data = request.get_json(silent=True)
+    events = data.get("events") if isinstance(data, dict) else data
+    if not isinstance(events, list) or not all(isinstance(e, dict) and e.get("driver_name") for e in events):
+        return jsonify({"status": "error", "message": "expected a list of {driver_name, timestamp, event_id}"}), 400
+
+    now = datetime.now().isoformat()
+    rows = [(e["driver_name"], e.get("timestamp") or now, e.get("event_id")) for e in events]
+
+    stored, status = store_rows(rows)
 
-# View all attendance entries
+    print(f"Queued {len(rows)} events" if stored is None else f"Stored {stored} of {len(rows)} events")
+    return jsonify({"status": "success", "received": len(rows), "stored": stored}), status
+
+# Ingest tuning: group-commit queue depth, flush latency and batch sizes
+@app.route('/attendance/stats', methods=['GET'])
+def ingest_stats():
+    if writer is None:
+        return jsonify({"mode": INGEST_MODE})
+    return jsonify({"mode": INGEST_MODE, **writer.stats()})
+
+def query_attendance(days, default_order='DESC'):
+    """Shared GET handler: rows of `days` (first, last) with cursor, limit, driver and time filters.
+
+    ?after_id=N returns rows with id > N oldest first, so pollers fetch only what is new;
+    ?limit= caps the page, ?driver= / ?since= / ?until= (ISO timestamps) filter via indexes.
+    """
+    try:
+        after_id, limit = (int(request.args[k]) if k in request.args else None for k in ('after_id', 'limit'))
+    except ValueError:
+        return jsonify({"status": "error", "message": "after_id and limit must be integers"}), 400
+    driver = request.args.get('driver')
+    since, until = request.args.get('since'), request.args.get('until')
+
+    conn = store.connection()
+    # Rows are only ever appended, so the newest id identifies the data version. after_id is
+    # left out of the tag: a poller that already has everything up to last_id gets a 304.
+    newest = last_id(conn)
+    args = sorted((k, v) for k, v in request.args.items() if k != 'after_id')
+    query_key = zlib.crc32(repr((request.path, days, args)).encode())
+    def make_etag(version):
+        return f'{version}-{query_key:x}'
+    etag = make_etag(newest)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        result, truncated = select_checkins(conn, days, after_id, limit, driver, since, until, default_order)
+        if after_id is not None and truncated:
+            etag = make_etag(result[-1]["id"])  # truncated page: only current up to its last row
+        response = jsonify(result)
+    response.set_etag(etag, weak=True)
+    response.headers['X-Attendance-Day'] = days[0] if days[0] == days[1] else f"{days[0]}..{days[1]}"
+    response.headers['X-Last-Id'] = str(newest)
+    return response
+
+# View one day's attendance (?day=YYYY-MM-DD, default today), newest first as before
 @app.route('/attendance', methods=['GET'])
 def view_attendance():
+    day = request.args.get('day') or store.today()
+    return query_attendance((day, day))
+
+# Check-ins over a range of days (?from=YYYY-MM-DD&to=YYYY-MM-DD), e.g. a whole season, oldest first
+@app.route('/attendance/range', methods=['GET'])
+def view_attendance_range():
+    first, last = request.args.get('from'), request.args.get('to') or store.today()
+    if not first:
+        return jsonify({"status": "error", "message": "'from' (YYYY-MM-DD) is required"}), 400
+    return query_attendance((first, last), default_order='ASC')
+
+# Per-driver counts, first/last check-in and hourly counts from the rollup tables (see attendanceStore.py).
+# ?day=YYYY-MM-DD (default today) or ?from=&to= for a range; cost grows with drivers, not check-ins.
+@app.route('/attendance/summary', methods=['GET'])
+def attendance_summary():
+    first = request.args.get('from') or request.args.get('day') or store.today()
+    last = request.args.get('to') or (first if 'from' not in request.args else store.today())
+
+    conn = store.connection()
+    newest = last_id(conn)
+    etag = f'{newest}-{zlib.crc32(repr((request.path, first, last)).encode()):x}'
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify({**summarize(conn, first, last), "last_id": newest})
+    response.set_etag(etag, weak=True)
+    response.headers['X-Last-Id'] = str(newest)
+    return response
+
+# Push new check-ins as Server-Sent Events (?day=, default today; resumes from Last-Event-ID / ?after_id=)
+@app.route('/attendance/stream', methods=['GET'])
+def stream_attendance():
+    try:
+        after_id = int(request.headers.get('Last-Event-ID') or request.args.get('after_id') or 0)
+    except ValueError:
+        return jsonify({"status": "error", "message": "after_id must be an integer"}), 400
+    fixed_day = request.args.get('day')
 
-    db_path= get_today_db_path();
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute('SELECT driver_name, timestamp FROM attendance ORDER BY id DESC')
-    rows = cursor.fetchall()
-    conn.close()
+    def events(after_id):
+        conn = store.connection()
+        day = None
+        version = feed.version
+        while True:
+            today = fixed_day or store.today()
+            if today != day:
+                day = today
+                yield format_event(day, event='day')
+            rows, truncated = select_checkins(conn, (day, day), after_id=after_id)
+            if rows:
+                after_id = rows[-1]["id"]
+                yield format_event(rows, event='checkin', event_id=after_id)
+                if truncated:
+                    continue
+            seen, version = version, feed.wait(version, HEARTBEAT)
+            if version == seen:
+                yield ': keep-alive\n\n'
 
-    # Convert to list of dicts
-    result = [{"driver_name": r[0], "timestamp": r[1]} for r in rows]
-    return jsonify(result)
+    response = app.response_class(events(after_id), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 if __name__ == '__main__':
     print("Flask with SQLite starting...")
@@ -1,9 +1,13 @@
 import os
+import tempfile
 from pathlib import Path
 import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
+# Keep server.py's attendance databases out of the working tree (read when attendanceStore is imported)
+os.environ.setdefault("F1_ATTENDANCE_DIR", tempfile.mkdtemp(prefix="f1-attendance-"))
+
 
 @pytest.fixture(scope="session")
 def project_root() -> Path:
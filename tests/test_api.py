@@ -16,3 +16,87 @@ def test_attendance_endpoint_works():
     assert resp.status_code in (200, 201)
     assert resp.is_json
     assert resp.get_json().get("status") == "success"
+
+
+def test_bulk_endpoint_stores_batch_and_ignores_resent_events():
+    server = importlib.import_module("server")
+    client = server.app.test_client()
+
+    events = [{"driver_name": "Oscar Piastri", "event_id": f"test-bulk-{i}-{id(client)}"} for i in range(3)]
+    resp = client.post("/attendance/bulk", json=events)
+    assert resp.status_code == 200
+    assert resp.get_json()["stored"] == 3
+
+    resp = client.post("/attendance/bulk", json={"events": events})
+    assert resp.get_json() == {"status": "success", "received": 3, "stored": 0}
+
+    assert client.post("/attendance/bulk", json=[{"timestamp": "x"}]).status_code == 400
+
+
+def test_stats_endpoint_reports_ingest_mode():
+    server = importlib.import_module("server")
+    resp = server.app.test_client().get("/attendance/stats")
+    assert resp.status_code == 200
+    assert resp.get_json()["mode"] == server.INGEST_MODE
+
+
+def test_get_attendance_pages_filters_and_answers_304_when_up_to_date():
+    server = importlib.import_module("server")
+    client = server.app.test_client()
+    driver = f"Pager {id(client)}"
+    client.post("/attendance/bulk", json=[{"driver_name": driver, "timestamp": f"2025-03-0{i}T10:00:00"}
+                                           for i in range(1, 6)])
+
+    season = {"from": "2025-03-01", "to": "2025-03-31", "driver": driver}
+    assert client.get("/attendance", query_string={"driver": driver}).get_json() == []  # not today
+    rows = client.get("/attendance/range", query_string={**season, "after_id": 0}).get_json()
+    assert [r["timestamp"][:10] for r in rows] == [f"2025-03-0{i}" for i in range(1, 6)]
+    page = client.get("/attendance/range", query_string={**season, "after_id": rows[1]["id"], "limit": 2}).get_json()
+    assert [r["id"] for r in page] == [rows[2]["id"], rows[3]["id"]]
+    ranged = client.get("/attendance/range", query_string={**season, "since": "2025-03-02", "until": "2025-03-04"})
+    assert len(ranged.get_json()) == 2
+    one_day = client.get("/attendance", query_string={"day": "2025-03-03", "driver": driver}).get_json()
+    assert [r["id"] for r in one_day] == [rows[2]["id"]]
+    assert client.get("/attendance/range").status_code == 400
+
+    # A poller that has everything gets a 304 with no body until something new arrives
+    first = client.get("/attendance", query_string={"after_id": 0, "limit": 5000})
+    last_id = first.headers["X-Last-Id"]
+    again = client.get("/attendance", query_string={"after_id": last_id, "limit": 5000},
+                       headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304 and again.data == b""
+    client.post("/attendance", json={"driver_name": driver})
+    fresh = client.get("/attendance", query_string={"after_id": last_id, "limit": 5000},
+                       headers={"If-None-Match": first.headers["ETag"]})
+    assert fresh.status_code == 200 and [r["driver_name"] for r in fresh.get_json()] == [driver]
+
+    assert client.get("/attendance", query_string={"after_id": "x"}).status_code == 400
+
+
+def test_driver_filter_uses_an_index():
+    server = importlib.import_module("server")
+    plan = server.store.connection().execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM attendance WHERE driver_name = ? AND timestamp >= ?", ("x", "y")).fetchall()
+    assert "idx_attendance_driver" in str(plan)
+
+
+def test_summary_serves_per_driver_rollups():
+    server = importlib.import_module("server")
+    client = server.app.test_client()
+    day = "2024-07-0" + str(id(client) % 9 + 1)
+    client.post("/attendance/bulk", json=[{"driver_name": name, "timestamp": f"{day}T{hour}:15:00"}
+                                           for name, hour in (("Max", 10), ("Lando", 10), ("Max", 14))])
+
+    summary = client.get("/attendance/summary", query_string={"day": day})
+    body = summary.get_json()
+    assert body["checkins"] == 3 and body["from"] == body["to"] == day
+    assert body["drivers"] == [
+        {"driver_name": "Max", "checkins": 2, "first_seen": f"{day}T10:15:00", "last_seen": f"{day}T14:15:00"},
+        {"driver_name": "Lando", "checkins": 1, "first_seen": f"{day}T10:15:00", "last_seen": f"{day}T10:15:00"}]
+    assert body["hourly"] == [{"hour": 10, "checkins": 2}, {"hour": 14, "checkins": 1}]
+
+    unchanged = client.get("/attendance/summary", query_string={"day": day},
+                           headers={"If-None-Match": summary.headers["ETag"]})
+    assert unchanged.status_code == 304
+    season = client.get("/attendance/summary", query_string={"from": "2024-07-01", "to": "2024-07-31"}).get_json()
+    assert season["checkins"] >= 3
@@ -0,0 +1,58 @@
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+uvicorn = pytest.importorskip("uvicorn")
+asgiServer = pytest.importorskip("asgiServer")
+
+from attendanceFeed import parse_events  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(asgiServer.app, log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    server.should_exit = True
+    thread.join(5)
+
+
+def test_same_contract_as_the_flask_server(base_url):
+    api = requests.Session()
+    driver = f"Async {time.time_ns()}"
+    assert api.post(f"{base_url}/attendance", json={"driver_name": driver}).json() == {"status": "success"}
+    events = [{"driver_name": driver, "timestamp": "2024-08-01T10:00:00", "event_id": f"{driver}-{i}"} for i in range(3)]
+    assert api.post(f"{base_url}/attendance/bulk", json=events).json()["stored"] == 3
+    assert api.post(f"{base_url}/attendance/bulk", json={"events": events}).json()["stored"] == 0
+    assert api.post(f"{base_url}/attendance/bulk", json=[{"timestamp": "x"}]).status_code == 400
+
+    today = api.get(f"{base_url}/attendance", params={"driver": driver})
+    assert [r["driver_name"] for r in today.json()] == [driver]
+    unchanged = api.get(f"{base_url}/attendance", params={"driver": driver}, headers={"If-None-Match": today.headers["ETag"]})
+    assert unchanged.status_code == 304 and unchanged.headers["X-Last-Id"] == today.headers["X-Last-Id"]
+    season = api.get(f"{base_url}/attendance/range", params={"from": "2024-08-01", "to": "2024-08-01", "driver": driver})
+    assert len(season.json()) == 3 and season.headers["X-Attendance-Day"] == "2024-08-01"
+    assert api.get(f"{base_url}/attendance", params={"after_id": "x"}).status_code == 400
+
+    summary = api.get(f"{base_url}/attendance/summary", params={"day": "2024-08-01"}).json()
+    assert {"driver_name": driver, "checkins": 3, "first_seen": "2024-08-01T10:00:00",
+            "last_seen": "2024-08-01T10:00:00"} in summary["drivers"]
+    assert api.get(f"{base_url}/attendance/stats").json()["mode"] == asgiServer.INGEST_MODE
+
+
+def test_stream_pushes_new_checkins(base_url):
+    last = int(requests.get(f"{base_url}/attendance", params={"limit": 1}).headers["X-Last-Id"])
+    with requests.get(f"{base_url}/attendance/stream", headers={"Last-Event-ID": str(last)}, stream=True, timeout=5) as r:
+        events = parse_events(r.iter_lines(decode_unicode=True))
+        assert next(events)["event"] == "day"
+        threading.Timer(0.1, requests.post, (f"{base_url}/attendance",), {"json": {"driver_name": "Pushed"}}).start()
+        pushed = next(events)
+    assert pushed["event"] == "checkin" and [row["driver_name"] for row in pushed["data"]] == ["Pushed"]
@@ -0,0 +1,63 @@
+import importlib
+import threading
+import time
+
+from attendanceFeed import AttendanceFeed, FeedListener, format_event, parse_events
+
+
+def test_events_round_trip_through_the_sse_wire_format():
+    wire = format_event("2025-03-01", event="day") + ": keep-alive\n\n" + \
+        format_event([{"id": 7, "driver_name": "Lando Norris"}], event="checkin", event_id=7)
+    events = list(parse_events(wire.split("\n")))
+    assert events == [{"event": "day", "data": "2025-03-01"},
+                      {"id": "7", "event": "checkin", "data": [{"id": 7, "driver_name": "Lando Norris"}]}]
+
+
+def test_listener_accumulates_deltas_and_resets_on_a_new_day():
+    listener = FeedListener("http://unused")
+    listener.apply({"event": "day", "data": "2025-03-01"})
+    listener.apply({"event": "checkin", "id": "2", "data": [{"id": 1}, {"id": 2}]})
+    assert listener.rows_since(1) == ("2025-03-01", [{"id": 2}], 2)
+    listener.apply({"event": "day", "data": "2025-03-02"})
+    assert listener.rows_since(0) == ("2025-03-02", [], 0) and listener.last_id == 2
+
+
+def test_listener_keeps_only_the_latest_rows_but_counts_them_all():
+    listener = FeedListener("http://unused", keep=3)
+    listener.apply({"event": "day", "data": "2025-03-01"})
+    for i in range(1, 11):
+        listener.apply({"event": "checkin", "id": str(i), "data": [{"id": i}]})
+    assert listener.rows_since(-2) == ("2025-03-01", [{"id": 9}, {"id": 10}], 10)
+    assert listener.rows_since(8)[1] == [{"id": 9}, {"id": 10}]
+    assert listener.rows_since(0)[1] == [{"id": 8}, {"id": 9}, {"id": 10}]  # older rows rotated out
+    assert len(listener.rows) == 3
+
+
+def test_feed_wait_wakes_on_notify():
+    feed = AttendanceFeed()
+    threading.Timer(0.05, feed.notify).start()
+    t0 = time.perf_counter()
+    assert feed.wait(0, timeout=5) == 1
+    assert time.perf_counter() - t0 < 1
+
+
+def test_stream_pushes_existing_and_new_checkins():
+    server = importlib.import_module("server")
+    client = server.app.test_client()
+    driver = f"Streamer {id(client)}"
+    client.post("/attendance", json={"driver_name": driver})
+    last = int(client.get("/attendance", query_string={"limit": 1}).headers["X-Last-Id"])
+
+    response = client.get("/attendance/stream", query_string={"after_id": last - 1}, buffered=False)
+    assert response.mimetype == "text/event-stream"
+    chunks = response.response  # the generator; each SSE event is one chunk
+    events = lambda: list(parse_events(next(chunks).decode().split("\n")))  # noqa: E731
+    assert events()[0]["event"] == "day"
+    assert [r["driver_name"] for r in events()[0]["data"]] == [driver]
+
+    threading.Timer(0.1, lambda: server.app.test_client().post("/attendance", json={"driver_name": driver + "!"})).start()
+    t0 = time.perf_counter()
+    pushed = events()[0]
+    assert pushed["data"][0]["driver_name"] == driver + "!" and int(pushed["id"]) == last + 1
+    assert time.perf_counter() - t0 < 1  # pushed on commit, not on the heartbeat
+    response.close()
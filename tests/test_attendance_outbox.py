@@ -0,0 +1,92 @@
+import time
+
+from attendanceOutbox import AttendanceOutbox
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ""
+
+
+class FakeSession:
+    """Records every POST; fails the first `fail` calls like a server that is down."""
+
+    def __init__(self, fail=0):
+        self.fail = fail
+        self.batches = []
+
+    def post(self, url, json, timeout):
+        if self.fail:
+            self.fail -= 1
+            raise ConnectionError("server down")
+        self.batches.append(json)
+        return FakeResponse(200)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_events_are_sent_in_batches_and_removed_from_the_spool(tmp_path):
+    session = FakeSession()
+    outbox = AttendanceOutbox(tmp_path / "outbox.db", batch_size=4, session=session)
+    for i in range(10):
+        outbox.enqueue(f"Driver {i}")
+    outbox.start()
+    assert _wait_for(lambda: outbox.pending() == 0)
+    outbox.stop()
+
+    assert [len(b) for b in session.batches] == [4, 4, 2]
+    events = [e for b in session.batches for e in b]
+    assert [e["driver_name"] for e in events] == [f"Driver {i}" for i in range(10)]
+    assert len({e["event_id"] for e in events}) == 10
+
+
+def test_spool_survives_a_dead_server_and_a_restart(tmp_path):
+    outbox = AttendanceOutbox(tmp_path / "outbox.db", session=FakeSession(fail=100))
+    outbox.enqueue("Lando Norris")
+    assert outbox.flush() is False
+    assert outbox.pending() == 1 and outbox.failures == 1
+
+    session = FakeSession(fail=1)
+    restarted = AttendanceOutbox(tmp_path / "outbox.db", session=session, max_backoff=0.1)
+    restarted.start()
+    assert _wait_for(lambda: restarted.pending() == 0)
+    restarted.stop()
+    assert session.batches[0][0]["driver_name"] == "Lando Norris"
+
+
+class FlaskSession:
+    """Posts through a Flask test client, like requests.Session against the running API."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def post(self, url, json, timeout):
+        return self.client.post("/attendance/bulk", json=json)
+
+    def close(self):
+        pass
+
+
+def test_spool_drains_against_a_server_that_only_queues(tmp_path, monkeypatch):
+    import server
+    from attendanceStore import AttendanceStore
+    from attendanceWriter import GroupCommitWriter
+
+    store = AttendanceStore(tmp_path / "api")
+    writer = GroupCommitWriter(store, durability="enqueue")
+    monkeypatch.setattr(server, "writer", writer)
+    outbox = AttendanceOutbox(tmp_path / "outbox.db", batch_size=4, session=FlaskSession(server.app.test_client()))
+    for i in range(10):
+        outbox.enqueue(f"Driver {i}")
+    try:
+        assert outbox.flush()
+        assert outbox.pending() == 0 and outbox.sent == 10 and outbox.failures == 0
+    finally:
+        writer.close()
+    assert len(store.connection().execute("SELECT * FROM attendance").fetchall()) == 10
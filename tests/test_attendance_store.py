@@ -0,0 +1,53 @@
+import sqlite3
+import threading
+
+from attendanceStore import AttendanceStore
+
+
+def test_connection_is_per_thread_wal_and_schema_is_created(tmp_path):
+    store = AttendanceStore(tmp_path)
+    conn = store.connection()
+    assert store.connection() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert "event_id" in [r[1] for r in conn.execute("PRAGMA table_info(attendance)")]
+
+    other = []
+    t = threading.Thread(target=lambda: other.append(store.connection()))
+    t.start()
+    t.join()
+    assert other[0] is not conn
+
+
+def test_all_days_share_one_database_partitioned_by_day(tmp_path):
+    store = AttendanceStore(tmp_path / "att")
+    conn = store.connection()
+    conn.executemany("INSERT INTO attendance (driver_name, timestamp) VALUES (?, ?)",
+                     [("A", "2025-03-01T10:00:00"), ("B", "2025-03-02T09:00:00"), ("A", "2025-03-02T11:00:00")])
+    conn.commit()
+    assert [p.name for p in (tmp_path / "att").glob("*.db")] == ["attendance.db"]
+
+    query = "SELECT driver_name FROM attendance WHERE day = ? ORDER BY id"
+    assert [r[0] for r in conn.execute(query, ("2025-03-02",))] == ["B", "A"]
+    assert "idx_attendance_day" in str(conn.execute("EXPLAIN QUERY PLAN " + query, ("x",)).fetchall())
+
+
+def test_rollups_follow_inserts_and_are_built_for_existing_rows(tmp_path):
+    conn = sqlite3.connect(tmp_path / "attendance.db")  # a database from before the rollup tables
+    conn.execute("CREATE TABLE attendance (id INTEGER PRIMARY KEY AUTOINCREMENT, driver_name TEXT NOT NULL, "
+                 "timestamp TEXT NOT NULL, event_id TEXT, day TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL)")
+    conn.execute("INSERT INTO attendance (driver_name, timestamp) VALUES ('A', '2025-03-01T10:00:00')")
+    conn.commit()
+    conn.close()
+
+    conn = AttendanceStore(tmp_path).connection()
+    conn.executemany("INSERT OR IGNORE INTO attendance (driver_name, timestamp, event_id) VALUES (?, ?, ?)",
+                     [("A", "2025-03-01T09:30:00", "e1"), ("A", "2025-03-01T11:00:00", "e1"),  # re-sent event
+                      ("B", "2025-03-01T10:05:00", None), ("A", "2025-03-02T08:00:00", None)])
+    conn.commit()
+    assert conn.execute("SELECT * FROM attendance_daily ORDER BY day, driver_name").fetchall() == [
+        ("2025-03-01", "A", 2, "2025-03-01T09:30:00", "2025-03-01T10:00:00"),
+        ("2025-03-01", "B", 1, "2025-03-01T10:05:00", "2025-03-01T10:05:00"),
+        ("2025-03-02", "A", 1, "2025-03-02T08:00:00", "2025-03-02T08:00:00")]
+    assert conn.execute("SELECT hour, checkins FROM attendance_hourly WHERE day = '2025-03-01'").fetchall() == [
+        (9, 1), (10, 2)]
@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from attendanceStore import AttendanceStore
+from attendanceWriter import GroupCommitWriter
+
+
+def _count(store):
+    return store.connection().execute("SELECT COUNT(*) FROM attendance").fetchone()[0]
+
+
+def test_ack_after_flush_groups_concurrent_writers_into_few_commits(tmp_path):
+    store = AttendanceStore(tmp_path)
+    writer = GroupCommitWriter(store, max_batch=64, max_delay_ms=20)
+    results = []
+
+    def kiosk(i):
+        for n in range(25):
+            results.append(writer.submit([(f"Driver {i}", str(n), f"{i}-{n}")]))
+
+    threads = [threading.Thread(target=kiosk, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    writer.close()
+
+    assert results == [1] * 200 and _count(store) == 200  # acknowledged means committed
+    stats = writer.stats()
+    assert stats["events"] == 200 and stats["flushes"] < 200 and stats["queue_depth"] == 0
+
+
+def test_ack_on_enqueue_returns_immediately_and_close_flushes(tmp_path):
+    store = AttendanceStore(tmp_path)
+    writer = GroupCommitWriter(store, durability="enqueue")
+    assert writer.submit([("Lando Norris", "t", "a"), ("Lando Norris", "t", "a")]) is None
+    writer.close()
+    assert _count(store) == 1  # duplicate event_id ignored
+
+
+def test_unknown_durability_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        GroupCommitWriter(AttendanceStore(tmp_path), durability="eventually")
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pandas as pd
+
+import batchRecognize
+from faceIndex import FaceIndex
+
+SAMPLES = Path(__file__).resolve().parents[1] / "data" / "sample_drivers"
+
+
+def _index(tmp_path):
+    rng = np.random.default_rng(0)
+    faces = rng.integers(0, 255, size=(40, 50 * 50 * 3), dtype=np.uint8)
+    labels = [f"Driver {i % 4}" for i in range(40)]
+    path = tmp_path / "index.npz"
+    FaceIndex.build(faces, labels, dim=8).save(path)
+    return path
+
+
+def _inputs(tmp_path):
+    photos = tmp_path / "photos"
+    photos.mkdir()
+    frames = []
+    for src in sorted(SAMPLES.glob("*.avif"))[:2]:
+        img = cv2.resize(cv2.imread(str(src)), (440, 440))
+        cv2.imwrite(str(photos / f"{src.stem}.jpg"), img)
+        frames.append(img)
+    video = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(video), cv2.VideoWriter_fourcc(*"MJPG"), 5, (440, 440))
+    for img in frames * 3:
+        writer.write(img)
+    writer.release()
+    return [video, photos]
+
+
+def test_batch_run_writes_detections_and_resumes(tmp_path, capsys):
+    index, inputs, out = _index(tmp_path), _inputs(tmp_path), tmp_path / "out"
+
+    path = batchRecognize.run(inputs, out, fmt="csv", workers=2, chunk_frames=4, chunk_images=1, index_path=index)
+    df = pd.read_csv(path)
+    assert list(df.columns) == batchRecognize.COLUMNS
+    assert set(df[df.source.str.endswith("clip.avi")].frame) == set(range(6))
+    assert df.source.str.endswith(".jpg").sum() >= 2
+    assert (df.distance >= 0).all() and df.name.str.startswith("Driver").all()
+
+    # A second run only merges: every chunk is in the manifest
+    capsys.readouterr()
+    batchRecognize.run(inputs, out, fmt="npz", workers=1, chunk_frames=4, chunk_images=1, index_path=index)
+    assert "0 to run" in capsys.readouterr().out
+    with np.load(out / "detections.npz") as z:
+        assert len(z["name"]) == len(df)
+
+
+def test_stride_skips_frames(tmp_path):
+    chunks = batchRecognize.plan_chunks(_inputs(tmp_path)[:1], chunk_frames=4, chunk_images=1, stride=2)
+    assert [(c["start"], c["stop"]) for c in chunks] == [(0, 4), (4, 6)]
+    batchRecognize._init_worker(str(_index(tmp_path)))
+    assert [f for _, f, _ in batchRecognize._frames(chunks[0])] == [0, 2]
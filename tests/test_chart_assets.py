@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import numpy as np
+
+from chartAssets import LOGO_SIZE, logo, pyplot
+
+
+def test_chart_modules_import_without_heavy_dependencies():
+    code = ("import sys, driverRatioChart, driverStatisticsChart, figureCache\n"
+            "print([m for m in ('matplotlib', 'scipy', 'plotly.express', 'requests') if m in sys.modules])")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == "[]"
+
+
+def test_rendering_from_the_figure_cache_never_imports_matplotlib():
+    code = ("import sys, pandas as pd, driverRatioChart, driverStatisticsChart\n"
+            "from driverInfo import driver_info\n"
+            "df = pd.DataFrame({'driver_name': list(driver_info)})\n"
+            "for m in (driverRatioChart, driverStatisticsChart):\n"
+            "    m.show_figure = lambda *args: None  # every chart a cache hit: draw() never runs\n"
+            "    for name in dir(m):\n"
+            "        if name.startswith('render_'):\n"
+            "            getattr(m, name)(df, driver_info)\n"
+            "print('matplotlib' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.strip().splitlines()[-1] == "False"
+
+
+def test_logo_is_decoded_once_and_downsized():
+    image = logo()
+    assert image is logo()
+    assert image.dtype == np.float32 and image.shape[2] == 4
+    assert max(image.shape[:2]) <= LOGO_SIZE and 0 <= image.min() <= image.max() <= 1
+    assert not image.flags.writeable
+    assert pyplot().rcParams["font.family"] == ["monospace"]
@@ -0,0 +1,33 @@
+import numpy as np
+
+from detectScheduler import DetectScheduler
+
+
+def test_detects_on_downscaled_frame_and_maps_boxes_back():
+    scheduler = DetectScheduler(working_width=480)
+    seen = []
+
+    def detect(small):
+        seen.append(small.shape)
+        return [(40, 20, 30, 30)]
+
+    boxes = scheduler.detect(np.zeros((1080, 1920), dtype=np.uint8), detect)
+    assert seen == [(270, 480)]
+    assert boxes == [(160, 80, 120, 120)]
+    assert scheduler.detect_ms > 0
+
+
+def test_interval_skips_frames():
+    scheduler = DetectScheduler(min_interval=3)
+    assert [scheduler.should_detect() for _ in range(7)] == [True, False, False, True, False, False, True]
+
+
+def test_adapts_width_then_interval_and_back():
+    scheduler = DetectScheduler(target_fps=10, working_width=640, min_width=400, max_interval=3, adjust_every=2)
+    for _ in range(20):
+        scheduler.record(0.5)  # 5x over the 100 ms budget
+    assert (scheduler.width, scheduler.interval) == (400, 3)
+
+    for _ in range(20):
+        scheduler.record(0.01)
+    assert (scheduler.width, scheduler.interval) == (640, 1)
@@ -0,0 +1,27 @@
+from driverInfo import driver_info
+import pandas as pd
+
+from driverStats import parse_card, stats_for, stats_table
+
+
+def test_card_is_parsed_into_typed_columns():
+    card = "Wins: 9\nWins from Pole: 4\nSprint Wins: 3\nTotal Points: 1336.5\nPodiums: n/a\nWins: 99\n"
+    assert parse_card(card) == {"wins": 9, "wins_from_pole": 4, "points": 1336.5}
+
+    table = stats_table({"A": card, "B": "Number of races: 12\n"})
+    assert str(table["wins"].dtype) == "Int64" and str(table["points"].dtype) == "Float64"
+    assert table.loc["A", "wins"] == 9 and pd.isna(table.loc["A", "podiums"]) and table.loc["B", "races"] == 12
+
+
+def test_table_is_cached_by_content():
+    assert stats_table(driver_info) is stats_table(dict(driver_info))
+    edited = {**driver_info, "Max Verstappen": driver_info["Max Verstappen"].replace("Wins: ", "Wins: 1")}
+    assert stats_table(edited) is not stats_table(driver_info)
+
+
+def test_stats_for_keeps_checked_in_drivers_with_every_column():
+    info = {"A": "Wins: 3\nPodiums: 5\n", "B": "Wins: 1\n", "C": "Wins: 7\nPodiums: 9\n"}
+    df = pd.DataFrame({"driver_name": ["C", "Unknown", "A", "B", "C"]})
+    rows = stats_for(df, info, ["wins", "podiums"])
+    assert rows.to_dict("list") == {"driver_name": ["C", "A"], "wins": [7, 3], "podiums": [9, 5]}
+    assert rows["wins"].dtype == "int64"
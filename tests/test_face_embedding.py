@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from faceEmbedding import fit_projection, project
+from faceIndex import FaceIndex
+from test_face_index import _synthetic_gallery
+
+
+def test_lighting_normalization_ignores_gain_and_offset():
+    faces, labels = _synthetic_gallery()
+    mean, components = fit_projection(faces, labels, dim=16)
+    rows = faces[:5].astype(np.float32)
+    relit = rows * 0.7 + 20
+    assert np.allclose(project(rows, mean, components, True), project(relit, mean, components, True), atol=1e-3)
+
+
+def test_lda_keeps_at_most_people_minus_one_axes_and_round_trips(tmp_path):
+    faces, labels = _synthetic_gallery(people=5)
+    index = FaceIndex.build(faces, labels, dim=64, method="lda")
+    assert index.components.shape == (4, faces.shape[1])
+    assert (index.predict(faces[::9]) == np.asarray(labels)[::9]).all()
+
+    index.save(tmp_path / "index.npz")
+    loaded = FaceIndex.load(tmp_path / "index.npz")
+    assert loaded.method == "lda" and loaded.normalize
+    assert np.allclose(loaded.project(faces[:3]), index.project(faces[:3]))
+
+
+def test_unknown_method_is_rejected():
+    faces, labels = _synthetic_gallery()
+    with pytest.raises(ValueError):
+        fit_projection(faces, labels, method="ica")
@@ -0,0 +1,64 @@
+import pickle
+
+import numpy as np
+
+from faceGallery import FaceGallery, load_gallery
+
+
+def test_append_in_place_and_memmap_round_trip(tmp_path):
+    gallery = FaceGallery.create(tmp_path / "gallery", dim=12)
+    a = np.arange(24, dtype=np.uint8).reshape(2, 12)
+    b = np.full((3, 12), 7, dtype=np.uint8)
+    gallery.append("Lando Norris", a)
+    gallery.append("Oscar Piastri", b)
+    gallery.append("Lando Norris", a[:1])
+
+    reopened = FaceGallery.open(tmp_path / "gallery")
+    assert isinstance(reopened.faces, np.memmap)
+    assert len(reopened) == 6
+    assert (reopened.faces[:2] == a).all() and (reopened.faces[2:5] == 7).all()
+    assert list(reopened.label_ids) == [0, 0, 1, 1, 1, 0]
+    assert list(reopened.labels) == ["Lando Norris"] * 2 + ["Oscar Piastri"] * 3 + ["Lando Norris"]
+
+
+def test_interrupted_append_is_ignored_until_header_count_moves(tmp_path):
+    gallery = FaceGallery.create(tmp_path / "gallery", dim=4)
+    gallery.append("Max Verstappen", np.ones((2, 4), dtype=np.uint8))
+    with open(tmp_path / "gallery" / "faces.bin", "ab") as f:
+        f.write(b"\xff" * 6)  # torn write past the committed rows
+
+    reopened = FaceGallery.open(tmp_path / "gallery")
+    assert len(reopened) == 2
+    reopened.append("Max Verstappen", np.zeros((1, 4), dtype=np.uint8))
+    assert FaceGallery.open(tmp_path / "gallery").faces.tolist() == [[1] * 4, [1] * 4, [0] * 4]
+
+
+def test_pickles_are_imported_on_first_load(tmp_path):
+    faces = np.random.default_rng(0).integers(0, 255, size=(4, 6), dtype=np.uint8)
+    with open(tmp_path / "listFaces.pkl", "wb") as f:
+        pickle.dump(faces, f)
+    with open(tmp_path / "listNames.pkl", "wb") as f:
+        pickle.dump(["B", "A", "B", "A", "extra label"], f)
+
+    gallery = load_gallery(tmp_path)
+    assert (gallery.faces == faces).all()
+    assert list(gallery.labels) == ["B", "A", "B", "A"]
+
+
+def test_enrol_writes_segments_and_compaction_merges_them(tmp_path):
+    gallery = FaceGallery.create(tmp_path / "gallery", dim=4)
+    gallery.append("A", np.zeros((2, 4), dtype=np.uint8))
+    gallery.enrol("B", np.ones((3, 4), dtype=np.uint8))
+    gallery.enrol("A", np.full((1, 4), 2, dtype=np.uint8))
+
+    assert len(gallery) == 2 and [seq for seq, _ in gallery.segments()] == [1, 2]
+    faces, labels = gallery.rows_and_labels()
+    assert labels == ["A", "A", "B", "B", "B", "A"]
+
+    assert gallery.compact() == 2
+    assert gallery.segments() == [] and not list((tmp_path / "gallery" / "segments").glob("seg_*"))
+    merged_faces, merged_labels = FaceGallery.open(tmp_path / "gallery").rows_and_labels()
+    assert (merged_faces == faces).all() and merged_labels == labels
+
+    # numbering continues after compaction
+    assert gallery.enrol("C", np.ones((1, 4), dtype=np.uint8)).name == "seg_00000003.npz"
@@ -0,0 +1,105 @@
+import numpy as np
+
+from faceIndex import FaceIndex, exact_knn, recall_at_k
+
+
+def _synthetic_gallery(people=6, per_person=40, dim=300, seed=0):
+    # Faces live on a low-dimensional manifold: per-person latent codes mapped to pixels.
+    rng = np.random.default_rng(seed)
+    basis = rng.normal(0, 1, size=(8, dim))
+    centers = rng.normal(0, 6, size=(people, 8))
+    latent = np.concatenate([c + rng.normal(0, 1, size=(per_person, 8)) for c in centers])
+    faces = np.clip(128 + latent @ basis + rng.normal(0, 1, size=(len(latent), dim)), 0, 255)
+    faces = faces.astype(np.uint8)
+    labels = [f"Driver {i}" for i in range(people) for _ in range(per_person)]
+    return faces, labels
+
+
+def test_predict_matches_enrolled_labels():
+    faces, labels = _synthetic_gallery()
+    index = FaceIndex.build(faces, labels, dim=16)
+    pred = index.predict(faces[::10])
+    assert list(pred) == labels[::10]
+
+
+def test_recall_against_exact_knn_is_high():
+    faces, labels = _synthetic_gallery()
+    index = FaceIndex.build(faces, labels, dim=32)
+    assert recall_at_k(index, faces, faces[::7], k=5) >= 0.9
+
+
+def test_nprobe_is_tuned_to_the_recall_target_not_a_share_of_the_lists():
+    faces, labels = _synthetic_gallery(people=40, per_person=40)
+    index = FaceIndex.build(faces, labels, dim=32, nlist=64)
+    assert index.nprobe < 64 // 4
+    assert recall_at_k(index, faces, faces[::13], k=5) >= 0.95
+
+
+def test_full_probe_with_full_rank_matches_exact_search():
+    faces, labels = _synthetic_gallery(people=3, per_person=10, dim=20)
+    index = FaceIndex.build(faces, labels, dim=20, nlist=2)
+    _, positions = index.search(faces[:5], k=3, nprobe=2)
+    assert (index.row_ids[positions][:, 0] == exact_knn(faces, faces[:5], k=3)[:, 0]).all()
+
+
+def test_save_and_load_round_trip(tmp_path):
+    faces, labels = _synthetic_gallery(people=3, per_person=10)
+    index = FaceIndex.build(faces, labels, dim=8, through=3)
+    index.save(tmp_path / "faceIndex.npz")
+    loaded = FaceIndex.load(tmp_path / "faceIndex.npz")
+    assert loaded.through == 3 and loaded.nprobe == index.nprobe
+    assert list(loaded.predict(faces[:3])) == list(index.predict(faces[:3]))
+
+
+def test_corrupt_index_file_is_rebuilt(tmp_path):
+    import pickle
+
+    from faceIndex import load_or_build
+
+    faces, labels = _synthetic_gallery(people=3, per_person=10)
+    with open(tmp_path / "listFaces.pkl", "wb") as f:
+        pickle.dump(faces, f)
+    with open(tmp_path / "listNames.pkl", "wb") as f:
+        pickle.dump(labels, f)
+    (tmp_path / "faceIndex.npz").write_bytes(b"PK\x03\x04truncated")
+
+    index = load_or_build(tmp_path, dim=8)
+    assert len(index.vectors) == len(faces)
+
+
+def test_batched_search_matches_one_query_at_a_time():
+    faces, labels = _synthetic_gallery()
+    index = FaceIndex.build(faces, labels, dim=16)
+    queries = faces[::13]
+    _, batch = index.search(queries, k=5)
+    single = np.vstack([index.search(q[None], k=5)[1] for q in queries])
+    assert (batch == single).all()
+
+
+def test_crop_rows_stacks_one_row_per_box():
+    from faceIndex import crop_rows
+
+    frame = np.random.default_rng(0).integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+    rows = crop_rows(frame, [(0, 0, 60, 60), (50, 40, 100, 80)])
+    assert rows.shape == (2, 7500) and rows.dtype == np.uint8
+
+
+def test_enrolled_segments_reach_a_live_index_before_and_after_compaction(tmp_path):
+    from faceGallery import FaceGallery
+
+    faces, labels = _synthetic_gallery(people=4, per_person=20)
+    gallery = FaceGallery.create(tmp_path / "gallery", dim=faces.shape[1])
+    for start in range(0, 60, 20):
+        gallery.append(labels[start], faces[start:start + 20])
+    index = FaceIndex.build(*gallery.rows_and_labels(), dim=16, through=gallery.through)
+    assert "Driver 3" not in index.label_names
+
+    gallery.enrol("Driver 3", faces[60:70])
+    assert index.apply_segments(gallery) == 10
+    assert index.predict(faces[60:61])[0] == "Driver 3"
+
+    gallery.enrol("Driver 3", faces[70:80])
+    gallery.compact()  # merged before the index saw the second segment
+    assert index.apply_segments(gallery) == 10
+    assert len(index.vectors) == 80 and index.through == 2
+    assert (index.row_ids[np.argsort(index.row_ids)] == np.arange(80)).all()
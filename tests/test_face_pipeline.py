@@ -0,0 +1,100 @@
+import threading
+import time
+
+import numpy as np
+
+from facePipeline import DropOldestQueue, Pipeline, RecentResults
+
+
+def test_drop_oldest_queue_discards_oldest_when_full():
+    q = DropOldestQueue(2)
+    for i in range(5):
+        q.put(i)
+    assert q.dropped == 3
+    assert [q.get(0), q.get(0), q.get(0)] == [3, 4, None]
+
+
+def test_results_stay_attached_to_their_frame_and_in_order():
+    frames = iter([np.full((4, 4), i, dtype=np.uint8) for i in range(20)])
+
+    def process(packet):
+        time.sleep(0.001 * (packet.seq % 3))  # workers finish out of order
+        packet.names.append(int(packet.frame[0, 0]))
+
+    seen = []
+
+    def render(packet):
+        seen.append((packet.seq, packet.names[0]))
+        return True
+
+    pipeline = Pipeline(lambda: next(frames, None), process, workers=3, queue_size=32)
+    pipeline.run(render, report_every=0)
+
+    assert seen, "render stage never ran"
+    assert all(seq == name for seq, name in seen)
+    assert [seq for seq, _ in seen] == sorted(seq for seq, _ in seen)
+    assert {"capture", "queue", "recognize", "render", "end_to_end"} <= set(pipeline.stats.summary())
+
+
+def test_render_returning_false_stops_pipeline():
+    pipeline = Pipeline(lambda: np.zeros((2, 2)), lambda p: None, workers=1)
+    calls = []
+
+    def render(packet):
+        calls.append(packet.seq)
+        return False
+
+    pipeline.run(render, report_every=0)
+    assert len(calls) == 1
+
+
+def test_worker_survives_processing_errors():
+    frames = iter([np.zeros((2, 2)) for _ in range(6)])
+
+    def process(packet):
+        if packet.seq % 2:
+            raise RuntimeError("bad frame")
+
+    seen = []
+
+    def render(packet):
+        seen.append(packet.seq)
+        return True
+
+    pipeline = Pipeline(lambda: next(frames, None), process, workers=1, queue_size=16)
+    pipeline.run(render, report_every=0)
+    assert pipeline.errors == 3
+    assert seen == [0, 2, 4]
+
+
+def test_idle_callback_can_stop_a_stalled_pipeline():
+    stalled = threading.Event()
+
+    def read_frame():
+        stalled.wait(5)  # capture never delivers a frame
+        return None
+
+    ticks = []
+
+    def idle():
+        ticks.append(1)
+        return len(ticks) < 3
+
+    pipeline = Pipeline(read_frame, lambda p: None, workers=1)
+    pipeline.run(lambda p: True, report_every=0, idle=idle)
+    stalled.set()
+    assert len(ticks) == 3
+
+
+def test_recent_results_only_hand_out_whole_results_of_earlier_frames():
+    recent = RecentResults(keep=3)
+    assert recent.before(5) == ([], [])
+    recent.record(4, ["box4"], ["Lando Norris"])
+    recent.record(2, ["box2"], ["Max Verstappen"])  # a slower worker finishing later
+    assert recent.before(3) == (["box2"], ["Max Verstappen"])
+    assert recent.before(5) == (["box4"], ["Lando Norris"])
+    assert recent.before(2) == ([], [])  # never a result from a newer frame
+    recent.record(6, [], [])
+    recent.record(7, ["box7"], ["Oscar Piastri"])
+    assert recent.before(3) == ([], [])  # frame 2 aged out
+    assert recent.before(8) == (["box7"], ["Oscar Piastri"])
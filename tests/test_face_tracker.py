@@ -0,0 +1,46 @@
+import numpy as np
+
+from faceTracker import FaceTracker
+
+
+def _frame(x, y, patch):
+    frame = np.zeros((240, 320, 3), dtype=np.uint8)
+    frame[y:y + patch.shape[0], x:x + patch.shape[1]] = patch[..., None]
+    return frame
+
+
+def _patch(seed=0):
+    return np.random.default_rng(seed).integers(0, 255, size=(40, 40), dtype=np.uint8)
+
+
+def test_tracks_between_detections_and_reuses_identity():
+    patch = _patch()
+    calls = {"detect": 0, "recognize": 0}
+
+    def detect(gray):
+        calls["detect"] += 1
+        return [(100, 80, 40, 40)]
+
+    def recognize(frame, boxes):
+        calls["recognize"] += 1
+        return ["Lando Norris"] * len(boxes)
+
+    tracker = FaceTracker(detect, recognize, redetect_every=5)
+    for i in range(5):
+        boxes, names, _ = tracker.update(_frame(100 + 3 * i, 80 + i, patch))
+        assert names == ["Lando Norris"]
+    assert boxes == [(112, 84, 40, 40)]
+    assert calls == {"detect": 1, "recognize": 1}
+
+    tracker.update(_frame(115, 85, patch))  # interval reached: re-verify
+    assert calls == {"detect": 2, "recognize": 2}
+
+
+def test_low_confidence_triggers_early_redetection():
+    calls = []
+    tracker = FaceTracker(lambda gray: calls.append(1) or [(100, 80, 40, 40)],
+                          lambda frame, boxes: ["Max Verstappen"], redetect_every=100)
+    tracker.update(_frame(100, 80, _patch(0)))
+    tracker.update(_frame(100, 80, _patch(1)))  # a different face appears: match fails
+    tracker.update(_frame(100, 80, _patch(1)))
+    assert len(calls) == 2
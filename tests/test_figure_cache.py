@@ -0,0 +1,41 @@
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from figureCache import MAX_WIDTH, FigureCache  # noqa: E402
+
+
+def bar_chart(width_in=4):
+    fig, ax = plt.subplots(figsize=(width_in, 2))
+    ax.barh(["A", "B"], [1, 2])
+    return fig
+
+
+def test_hits_skip_drawing_and_figures_are_closed():
+    cache, calls = FigureCache(maxsize=2), []
+
+    def draw():
+        calls.append(1)
+        return bar_chart()
+
+    png = cache.get(("wins", frozenset("AB"), 1), draw)
+    assert png.startswith(b"\x89PNG") and plt.get_fignums() == []
+    assert cache.get(("wins", frozenset("BA"), 1), draw) is png
+    assert len(calls) == 1 and (cache.hits, cache.misses) == (1, 1)
+    assert cache.get(("empty", frozenset(), 1), lambda: None) is None
+
+
+def test_least_recently_used_chart_is_evicted():
+    cache = FigureCache(maxsize=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get(key, bar_chart)
+    assert list(cache._png) == ["a", "c"]
+
+
+def test_wide_figures_are_stored_no_wider_than_streamlit_displays():
+    png = FigureCache().get("wide", lambda: bar_chart(width_in=12))
+    assert Image.open(io.BytesIO(png)).width == MAX_WIDTH
@@ -0,0 +1,33 @@
+import sqlite3
+
+from attendanceStore import AttendanceStore
+from migrateAttendance import migrate
+
+
+def _legacy_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE attendance (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                 "driver_name TEXT NOT NULL, timestamp TEXT NOT NULL)")
+    conn.executemany("INSERT INTO attendance (driver_name, timestamp) VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def test_per_day_files_are_imported_once(tmp_path):
+    _legacy_db(tmp_path / "attendance_2025-03-01.db", [("Lando Norris", "2025-03-01T10:00:00.250000"),
+                                                       ("Oscar Piastri", "2025-03-01T10:05:00")])
+    _legacy_db(tmp_path / "attendance_2025-03-02.db", [("Lando Norris", "2025-03-02T09:00:00")])
+    # Line 2 mirrors an API event (same driver, same second); line 3 never reached the API
+    (tmp_path / "Attendance_2025-03-01.csv").write_text("NAME,TIME\nLando Norris,10:00:00\nMax Verstappen,11:30:00\n")
+
+    store = AttendanceStore(tmp_path)
+    assert migrate(tmp_path, store, dry_run=True)["imported"] == 4
+    assert store.connection().execute("SELECT COUNT(*) FROM attendance").fetchone()[0] == 0
+
+    counts = migrate(tmp_path, store)
+    assert counts == {"files": 3, "read": 5, "imported": 4, "skipped": 1}
+    rows = store.connection().execute("SELECT day, driver_name FROM attendance ORDER BY timestamp").fetchall()
+    assert rows == [("2025-03-01", "Lando Norris"), ("2025-03-01", "Oscar Piastri"),
+                    ("2025-03-01", "Max Verstappen"), ("2025-03-02", "Lando Norris")]
+
+    assert migrate(tmp_path, store)["imported"] == 0
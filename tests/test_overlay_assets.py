@@ -0,0 +1,63 @@
+import os
+
+import cv2
+import numpy as np
+
+from overlayAssets import BUNDLE_FILE, build, load_assets, overlay_names, pick_sources, to_bgra
+
+
+def _write(path, colour, alpha=None):
+    img = np.full((40, 60, 3), colour, np.uint8)
+    if alpha is not None:
+        img = np.dstack([img, np.full((40, 60), alpha, np.uint8)])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cv2.imwrite(str(path), img)
+
+
+def test_one_file_per_wanted_driver_preferring_canonical_names():
+    files = ["Charles Leclerc.png", "Charles_Leclerc.jpg", "Charles_Leclerc.png", "Max Verstappen.png",
+             "Max_Verstappen.jpg", "George_Russell.jpg 19-14-50-718.jpg", "f1.png"]
+    assert pick_sources(files, {"Charles Leclerc", "Max Verstappen", "George Russell"}) == {
+        "Charles Leclerc": "Charles_Leclerc.png", "Max Verstappen": "Max_Verstappen.jpg"}
+
+
+def test_images_become_square_bgra_and_shared_bytes_decode_once(tmp_path):
+    _write(tmp_path / "flags" / "Carlos_Sainz.png", (0, 0, 255))
+    _write(tmp_path / "flags" / "Fernando_Alonso.png", (0, 0, 255))  # same flag, same bytes
+    _write(tmp_path / "logos" / "Lando_Norris.png", (0, 128, 255), alpha=128)
+    (tmp_path / "logos" / "Lando_Norris.avif").write_bytes(b"not decoded")
+
+    assets = build(tmp_path, size=32)
+    assert assets["flags"]["Carlos Sainz"] is assets["flags"]["Fernando Alonso"]
+    assert assets["flags"]["Carlos Sainz"].shape == (32, 32, 4)
+    assert (assets["flags"]["Carlos Sainz"][..., 3] == 255).all()
+    assert assets["logos"]["Lando Norris"][0, 0].tolist() == [0, 128, 255, 128]
+    assert to_bgra(np.zeros((5, 5), np.uint16), 8).shape == (8, 8, 4)
+
+
+def test_bundle_is_reused_until_a_source_or_the_driver_list_changes(tmp_path):
+    _write(tmp_path / "logos" / "Lando_Norris.png", (10, 20, 30))
+    names = {"Lando Norris"}
+    first = load_assets(tmp_path, names, size=16)
+    bundle = tmp_path / BUNDLE_FILE
+    mtime = bundle.stat().st_mtime_ns
+    again = load_assets(tmp_path, names, size=16)
+    assert bundle.stat().st_mtime_ns == mtime  # loaded, not rebuilt
+    assert np.array_equal(again["logos"]["Lando Norris"], first["logos"]["Lando Norris"])
+    assert again["flags"] == {}
+
+    _write(tmp_path / "logos" / "Lando_Norris.png", (200, 200, 200))
+    os.utime(tmp_path / "logos" / "Lando_Norris.png", ns=(1, 1))
+    assert load_assets(tmp_path, names, size=16)["logos"]["Lando Norris"][0, 0].tolist() == [200, 200, 200, 255]
+    assert load_assets(tmp_path, {"Oscar Piastri"}, size=16)["logos"] == {}
+
+    bundle.write_bytes(b"corrupt")
+    assert "Lando Norris" in load_assets(tmp_path, names, size=16)["logos"]
+
+
+def test_enrolled_people_outside_driver_info_are_part_of_the_shared_name_set():
+    from driverInfo import driver_info
+
+    names = overlay_names(np.array(["Lando Norris", "Guest Driver"]))
+    assert names == set(driver_info) | {"Guest Driver"}
+    assert overlay_names() == set(driver_info)
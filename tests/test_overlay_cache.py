@@ -0,0 +1,42 @@
+import numpy as np
+
+from overlayCache import OverlayCache, blit, darken, prepare_asset
+
+
+def test_blit_matches_float_alpha_blend_within_rounding():
+    rng = np.random.default_rng(0)
+    logo = rng.integers(0, 256, size=(20, 20, 4), dtype=np.uint8)
+    frame = rng.integers(0, 256, size=(60, 80, 3), dtype=np.uint8)
+
+    alpha = logo[:, :, 3:4] / 255.0
+    expected = frame.copy()
+    expected[5:25, 30:50] = alpha * logo[:, :, :3] + (1 - alpha) * frame[5:25, 30:50]
+
+    blit(frame, prepare_asset(logo, (20, 20)), 30, 5)
+    assert np.abs(frame.astype(int) - expected.astype(int)).max() <= 1
+
+
+def test_blit_clips_at_frame_edges_and_only_touches_roi():
+    frame = np.zeros((30, 30, 3), dtype=np.uint8)
+    asset = prepare_asset(np.full((10, 10, 3), 200, dtype=np.uint8), (10, 10))
+    blit(frame, asset, 25, -5)
+    assert (frame[:5, 25:] == 200).all()
+    assert frame[5:].sum() == 0 and frame[:, :25].sum() == 0
+
+
+def test_darken_only_changes_the_box():
+    frame = np.full((50, 50, 3), 100, dtype=np.uint8)
+    darken(frame, (10, 10), (19, 19), alpha=0.6)
+    assert (frame[10:20, 10:20] == 40).all()
+    assert frame[:10].min() == 100 and frame[20:].min() == 100
+
+
+def test_cache_scales_once_and_evicts_least_recently_used():
+    sources = {n: np.zeros((40, 40, 3), dtype=np.uint8) for n in "abc"}
+    cache = OverlayCache(sources, max_entries=2)
+    first = cache.get("a", (10, 10))
+    assert cache.get("a", (10, 10)) is first
+    cache.get("b", (10, 10))
+    cache.get("c", (10, 10))
+    assert len(cache) == 2 and cache.get("a", (10, 10)) is not first
+    assert cache.get("missing", (10, 10)) is None
@@ -21,3 +21,38 @@ def test_handles_zero_races_without_crashing():
 def test_negative_inputs_are_clamped():
     s = compute_fantasy_score(wins=-1, podiums=-2, races=-3, points=-100, dnfs=-1)
     assert s == compute_fantasy_score()  # all clamped to zero
+
+
+def test_batch_scores_match_the_scalar_function_exactly():
+    import numpy as np
+
+    from scoring import fantasy_scores
+
+    rng = np.random.default_rng(0)
+    n = 2000
+    columns = {
+        "wins": rng.integers(-3, 120, n), "podiums": rng.integers(-3, 200, n), "races": rng.integers(-2, 400, n),
+        "poles": rng.integers(-1, 100, n), "points": rng.uniform(-50, 5000, n).round(1),
+        "fastest_laps": rng.integers(0, 70, n), "dnfs": rng.integers(-1, 80, n),
+    }
+    columns["races"][:50] = 0
+    columns["wins"] = columns["wins"] + rng.choice([0, 0.6], n)  # int() truncation of float counts
+    batch = fantasy_scores(**columns)
+    scalar = [compute_fantasy_score(**{k: v[i] for k, v in columns.items()}) for i in range(n)]
+    assert batch.tolist() == scalar
+
+
+def test_normalization_and_tie_break_ranks():
+    import pandas as pd
+
+    from scoring import iqr_normalize, score_drivers, tie_break_ranks
+
+    raw = pd.Series([3.0, 10.0, 10.0, 55.0, -20.0, 7.5])
+    q1, q3 = raw.quantile(0.25), raw.quantile(0.75)
+    expected = raw.apply(lambda x: min(100, max(0, (x - q1) / (q3 - q1) * 25 + 50))).round(1)
+    assert iqr_normalize(raw).tolist() == expected.tolist()
+    assert iqr_normalize([4.0, 4.0]).tolist() == [50.0, 50.0]
+
+    assert tie_break_ranks([50.0, 75.0, 50.0], [0.2, 0.1, 0.4]).tolist() == [3, 1, 2]
+    scores, normalized, ranks = score_drivers(wins=[0, 10, 5], podiums=[1, 20, 5], races=[10, 20, 20])
+    assert ranks.tolist() == [3, 1, 2] and normalized.shape == scores.shape == (3,)
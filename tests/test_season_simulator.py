@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoring import compute_fantasy_score
+from seasonSimulator import driver_rates, percentile_rank, simulate, summarize, what_if, with_finish_points
+
+INFO = {
+    "Fast": "Number of races: 100\nWins: 40\nPodiums: 70\nRetirements (DNFs): 5\nFastest Laps: 20\n"
+            "GP Pole Positions: 30\nTotal Points: 1800\n",
+    "Slow": "Number of races: 50\nWins: 0\nPodiums: 0\nRetirements (DNFs): 10\nFastest Laps: 0\n"
+            "GP Pole Positions: 0\nTotal Points: 25\n",
+    "Rookie": "Number of races: 0\nWins: 0\n",
+}
+
+
+def test_rates_come_from_career_numbers_and_match_points_per_race():
+    rates = driver_rates(INFO)
+    assert list(rates.index) == ["Fast", "Slow"]  # no races, no rates
+    assert rates.loc["Fast", ["win", "podium", "dnf", "pole"]].tolist() == [0.4, 0.3, 0.05, 0.3]
+    finish = 1 - rates["win"] - rates["podium"] - rates["dnf"]
+    expected = 25 * rates["win"] + 16.5 * rates["podium"] + rates["finish_points"] * finish
+    assert expected.round(9).tolist() == [18.0, 0.5]
+
+
+def test_simulation_is_reproducible_and_scores_like_the_scalar_function():
+    rates = driver_rates(INFO)
+    scores = simulate(rates, seasons=5000, races=10, seed=7)
+    assert scores.shape == (5000, 2)
+    assert np.array_equal(scores, simulate(rates, seasons=5000, races=10, seed=7))
+
+    # A driver who never wins, podiums, poles or sets fastest laps only varies with DNFs and finishes
+    never = what_if(rates, {"Slow": {"dnf": 0.0, "finish_points": 1.0}})
+    slow = simulate(never, seasons=100, races=10, seed=1)[:, 1]
+    assert set(slow) == {compute_fantasy_score(races=10, points=10.0)}
+
+
+def test_summary_percentiles_and_title_odds():
+    rates = driver_rates(INFO)
+    scores = simulate(rates, seasons=20000, races=24, seed=3)
+    summary = summarize(scores, rates.index)
+    assert list(summary.index) == ["Fast", "Slow"]
+    assert summary.loc["Fast", "title_odds"] == 1.0 and summary.loc["Slow", "mean_rank"] == 2.0
+    assert summary.loc["Fast", "p5"] < summary.loc["Fast", "p50"] < summary.loc["Fast", "p95"]
+    median = summary.loc["Fast", "p50"]
+    assert 45 <= percentile_rank(scores, rates.index, "Fast", median) <= 55
+
+
+def test_process_pool_splits_seasons():
+    rates = driver_rates(INFO)
+    scores = simulate(rates, seasons=1001, races=5, seed=2, workers=2)
+    assert scores.shape == (1001, 2)
+    assert np.array_equal(scores, simulate(rates, seasons=1001, races=5, seed=2, workers=2))
+
+
+def test_what_if_rejects_unknown_names():
+    rates = driver_rates(INFO)
+    with pytest.raises(KeyError):
+        what_if(rates, {"Nobody": {"win": 0.5}})
+    with pytest.raises(KeyError):
+        what_if(rates, {"Fast": {"speed": 1.0}})
+    assert isinstance(with_finish_points(rates, pd.Series([0.0, 0.0], index=rates.index)), pd.DataFrame)
@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pytest
+from scipy.stats import rankdata
+
+from driverStats import stats_table
+from scoring import fantasy_scores, overall_scores
+from weightOptimizer import FORMULAS, features, save, search, spearman
+
+INFO = {
+    f"Driver {i}": (f"Number of races: {20 + 10 * i}\nWins: {i * i}\nPodiums: {3 * i}\nGP Pole Positions: {i}\n"
+                    f"Fastest Laps: {i // 2}\nTotal Points: {40.0 * i + 5}\nRetirements (DNFs): {9 - i}\n"
+                    f"Wins from Pole: {i // 3}\nChampionships: {i // 4}\nSeason position {{year}}: {10 - i}\n")
+    for i in range(9)
+}
+
+
+def _stats(drivers):
+    return stats_table(INFO).loc[drivers].astype("float64")
+
+
+def test_baseline_weights_reproduce_the_scoring_formulas():
+    drivers, X, _ = features("fantasy", INFO)
+    s = _stats(drivers)
+    expected = fantasy_scores(wins=s["wins"], podiums=s["podiums"], races=s["races"], poles=s["poles"],
+                              points=s["points"], fastest_laps=s["fastest_laps"], dnfs=s["dnfs"])
+    assert np.allclose(X @ np.asarray(FORMULAS["fantasy"][1]), expected)
+
+    drivers, X, _ = features("overall", INFO)
+    s = _stats(drivers)
+    expected = overall_scores(**{c: s[c] for c in ["wins", "poles", "podiums", "points", "dnfs", "races",
+                                                   "wins_from_pole", "fastest_laps"]})["raw_score"]
+    assert np.allclose(X @ np.asarray(FORMULAS["overall"][1]), expected)
+
+
+def test_spearman_scores_every_candidate_in_one_pass():
+    X = np.array([[1.0, 0.0], [2.0, 1.0], [3.0, -1.0]])
+    target_rank = np.array([0.0, 1.0, 2.0])
+    rho = spearman(np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]]), X, target_rank)
+    assert rho.tolist() == pytest.approx([1.0, -0.5, -1.0])
+
+
+def test_search_is_reproducible_and_independent_of_workers(tmp_path):
+    kwargs = dict(formula="fantasy", target="season_position", population=256, generations=30, seed=3,
+                  driver_info=INFO)
+    first = search(**kwargs)
+    assert first["best"]["spearman"] >= first["baseline"]["spearman"]
+    assert first["generations"] < 30  # stopped early once the best stopped improving
+    assert save(first, tmp_path / "a.json").read_text() == save(search(**kwargs), tmp_path / "b.json").read_text()
+    assert search(**kwargs, workers=2)["best"] == first["best"]
+
+
+def test_save_writes_the_results_record(tmp_path):
+    result = search("overall", "championships", population=64, generations=3, seed=1, driver_info=INFO)
+    record = json.loads(save(result, tmp_path / "run.json").read_text())
+    assert record["seed"] == 1 and record["formula"] == "overall"
+    assert set(record["best"]["weights"]) == set(FORMULAS["overall"][0])
+    assert len(record["history"]) == record["generations"] == 3
+    assert "candidates_per_second" not in record
+    with pytest.raises(ValueError):
+        features("nope", INFO)
+
+
+def test_tied_targets_share_a_rank_whatever_the_driver_order():
+    from scipy.stats import spearmanr
+
+    X = np.array([[3.0], [1.0], [2.0], [5.0], [4.0]])
+    titles = np.array([0.0, 0.0, 0.0, 2.0, 1.0])
+    rho = spearman(np.array([1.0]), X, rankdata(titles))[0]
+    assert rho == pytest.approx(spearmanr(X[:, 0], titles).statistic)
+
+    # championships: most drivers have none, so the fit must not depend on dictionary order
+    reordered = dict(reversed(list(INFO.items())))
+    forward = search("fantasy", "championships", population=64, generations=3, seed=0, driver_info=INFO)
+    backward = search("fantasy", "championships", population=64, generations=3, seed=0, driver_info=reordered)
+    assert forward["baseline"]["spearman"] == pytest.approx(backward["baseline"]["spearman"])
@@ -0,0 +1,209 @@
+# weightOptimizer.py
+"""
+Search fantasy scoring weights that reproduce a target ranking.
+
+    python weightOptimizer.py                                   # fantasy formula vs season standings
+    python weightOptimizer.py --formula overall --target championships --workers 4 --seed 1
+
+Both formulas score a driver as a weighted sum of features:
+
+* "fantasy" is scoring.compute_fantasy_score: wins, podiums, points/race,
+  win rate, podium rate, pole-to-win, fastest-lap rate and DNF rate;
+* "overall" is the dashboard's overall score (render_overall_driver_score).
+
+Features are built once into a (drivers x features) matrix. A generation
+of candidate weight vectors is a (candidates x features) matrix, so scoring
+every candidate for every driver is a single matrix product. Candidates are
+compared by Spearman rank correlation with the target order. The search is
+a cross-entropy method: sample non-negative weights around the current
+mean, keep the elite, move the mean towards it, and stop once the best
+correlation has not improved for `patience` generations. With workers > 1
+each generation is evaluated in chunks on a process pool. Sampling stays in
+the parent, so a seed gives the same result for any number of workers.
+
+Every run writes a JSON file with the config, seed, baseline and best
+weights, their correlations, the resulting order and the per-generation
+history.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from driverStats import stats_table
+from scoring import safe_divide
+
+ROOT_DIR = Path(__file__).resolve().parent
+OUT_DIR = ROOT_DIR / "weight_search"
+
+# name -> (feature names, hand-tuned weights); every weight multiplies a feature that helps,
+# so penalties (DNFs) enter as negative features and all weights stay >= 0
+FORMULAS = {
+    "fantasy": (["wins", "podiums", "points_per_race", "win_rate", "podium_rate", "pole_to_win",
+                 "fastest_lap_rate", "neg_dnf_rate"],
+                [10, 6, 2.5, 40, 25, 10, 15, 30]),
+    "overall": (["wins", "poles", "podiums", "points_per_race", "podium_rate", "win_conversion",
+                 "finish_rate", "pole_win_conversion", "fastest_lap_rate", "win_rate", "neg_dnfs"],
+                [2.0, 1.2, 0.7, 2.5, 1.5, 2.0, 10.0, 1.5, 5.0, 30.0, 0.7]),
+}
+# target -> (driver_info column, True when a higher value ranks first)
+TARGETS = {
+    "season_position": ("season_position", False),
+    "season_points": ("season_points", True),
+    "championships": ("championships", True),
+    "points": ("points", True),
+}
+COLUMNS = ["wins", "podiums", "races", "poles", "points", "fastest_laps", "dnfs", "wins_from_pole"]
+
+
+def features(formula: str, driver_info: dict | None = None, target: str | None = None):
+    """(drivers, feature matrix, target values) for drivers with every stat (and the target) known."""
+    table = stats_table(driver_info)
+    columns = COLUMNS + ([TARGETS[target][0]] if target else [])
+    stats = table[columns].dropna()
+    stats = stats[stats["races"] > 0].astype("float64")
+    if len(stats) < 2:
+        raise ValueError(f"need at least two drivers with {columns} to rank, found {len(stats)}")
+    wins, podiums, races, poles, points, fastest_laps, dnfs, wins_from_pole = (
+        stats[c].to_numpy() for c in COLUMNS)
+    if formula == "fantasy":
+        X = [wins, podiums, points / races, wins / races, podiums / races, safe_divide(wins, poles),
+             fastest_laps / races, -dnfs / races]
+    elif formula == "overall":
+        X = [wins, poles, podiums, points / races, podiums / races, safe_divide(wins, podiums),
+             (races - dnfs) / races, safe_divide(wins_from_pole, poles), fastest_laps / races, wins / races, -dnfs]
+    else:
+        raise ValueError(f"unknown formula {formula!r}, expected one of {list(FORMULAS)}")
+    y = stats[TARGETS[target][0]].to_numpy() if target else None
+    return list(stats.index), np.column_stack(X), y
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    """Ranks along the last axis (1 = smallest); ties share their average rank (scipy's rankdata).
+
+    Ordinal ranks would break ties (most drivers have 0 titles) by driver_info order,
+    and the search would then fit that arbitrary order.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    order = values.argsort(axis=-1, kind="stable")
+    ordered = np.take_along_axis(values, order, axis=-1)
+    n = values.shape[-1]
+    position = np.broadcast_to(np.arange(n), values.shape)
+    edge = np.ones(values.shape[:-1] + (1,), dtype=bool)
+    changed = ordered[..., 1:] != ordered[..., :-1]
+    # first / last sorted position of the tie group each value belongs to
+    first = np.maximum.accumulate(np.where(np.concatenate([edge, changed], -1), position, 0), axis=-1)
+    last = np.where(np.concatenate([changed, edge], -1), position, n - 1)
+    last = np.flip(np.minimum.accumulate(np.flip(last, -1), axis=-1), -1)
+    ranks = np.empty_like(values)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=-1)
+    return ranks
+
+
+def spearman(weights: np.ndarray, X: np.ndarray, target_rank: np.ndarray) -> np.ndarray:
+    """Rank correlation with the target for every row of `weights` (candidates x features)."""
+    ranks = _ranks(np.atleast_2d(weights) @ X.T)  # candidates x drivers
+    ranks -= ranks.mean(axis=1, keepdims=True)
+    target = target_rank - target_rank.mean()
+    denom = np.sqrt((ranks ** 2).sum(axis=1) * (target ** 2).sum())
+    return np.divide(ranks @ target, denom, out=np.zeros(len(ranks)), where=denom > 0)
+
+
+def _evaluate(args) -> np.ndarray:
+    return spearman(*args)
+
+
+def search(formula: str = "fantasy", target: str = "season_position", population: int = 4096,
+           generations: int = 100, elite: float = 0.05, patience: int = 8, tol: float = 1e-9,
+           seed: int = 0, workers: int = 1, driver_info: dict | None = None) -> dict:
+    """Cross-entropy search; returns the results record written by save()."""
+    drivers, X, y = features(formula, driver_info, target)
+    names, baseline = FORMULAS[formula]
+    baseline = np.asarray(baseline, dtype=np.float64)
+    target_rank = _ranks(y if TARGETS[target][1] else -y)  # higher rank = better placed
+    # Features differ by orders of magnitude (wins vs rates): search in units of the baseline weights
+    scale = np.where(baseline > 0, baseline, 1.0)
+
+    rng = np.random.default_rng(seed)
+    mean, std = np.ones(len(names)), np.ones(len(names))
+    n_elite = max(2, int(population * elite))
+    best_w, best_rho = baseline.copy(), float(spearman(baseline, X, target_rank)[0])
+    history, stale = [], 0
+    t0 = time.perf_counter()
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        for generation in range(generations):
+            candidates = np.abs(rng.normal(mean, std, size=(population, len(names)))) * scale
+            if pool is None:
+                rho = spearman(candidates, X, target_rank)
+            else:
+                chunks = np.array_split(candidates, workers)
+                rho = np.concatenate(list(pool.map(_evaluate, [(c, X, target_rank) for c in chunks])))
+            order = np.argsort(-rho, kind="stable")
+            elites = candidates[order[:n_elite]] / scale
+            mean, std = elites.mean(axis=0), elites.std(axis=0) + 1e-3
+            improved = rho[order[0]] > best_rho + tol
+            if improved:
+                best_w, best_rho = candidates[order[0]], float(rho[order[0]])
+            history.append({"generation": generation, "best": best_rho, "elite_mean": float(rho[order[:n_elite]].mean())})
+            stale = 0 if improved else stale + 1
+            if stale >= patience:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    elapsed = time.perf_counter() - t0
+
+    best_w = best_w * (np.abs(baseline).sum() / np.abs(best_w).sum())  # same overall scale as the baseline
+    evaluated = len(history) * population
+    return {
+        "formula": formula, "target": target, "seed": seed, "population": population, "generations": len(history),
+        "elite": elite, "patience": patience, "workers": workers,
+        "drivers": drivers,
+        "target_order": [drivers[i] for i in np.argsort(-target_rank, kind="stable")],
+        "baseline": {"weights": dict(zip(names, baseline.tolist())),
+                     "spearman": float(spearman(baseline, X, target_rank)[0]),
+                     "order": [drivers[i] for i in np.argsort(-(X @ baseline), kind="stable")]},
+        "best": {"weights": dict(zip(names, np.round(best_w, 6).tolist())), "spearman": best_rho,
+                 "order": [drivers[i] for i in np.argsort(-(X @ best_w), kind="stable")]},
+        "candidates_evaluated": evaluated,
+        "candidates_per_second": evaluated / elapsed if elapsed > 0 else None,
+        "history": history,
+    }
+
+
+def save(result: dict, path: Path | None = None) -> Path:
+    """Write the results record as JSON (default weight_search/<formula>-<target>-seed<seed>.json)."""
+    path = Path(path or OUT_DIR / f"{result['formula']}-{result['target']}-seed{result['seed']}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    record = {k: v for k, v in result.items() if k != "candidates_per_second"}  # timing is not reproducible
+    path.write_text(json.dumps(record, indent=2) + "\n")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit fantasy scoring weights to a target ranking.")
+    parser.add_argument("--formula", choices=list(FORMULAS), default="fantasy")
+    parser.add_argument("--target", choices=list(TARGETS), default="season_position")
+    parser.add_argument("--population", type=int, default=4096, help="candidate weight vectors per generation")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--patience", type=int, default=8, help="stop after this many generations without improvement")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    result = search(args.formula, args.target, args.population, args.generations, patience=args.patience,
+                    seed=args.seed, workers=args.workers)
+    path = save(result, args.out)
+    print(f"baseline spearman {result['baseline']['spearman']:+.3f} -> best {result['best']['spearman']:+.3f} "
+          f"after {result['generations']} generations ({result['candidates_per_second']:,.0f} candidates/s)")
+    for name, weight in result["best"]["weights"].items():
+        print(f"  {name:20s} {result['baseline']['weights'][name]:8.2f} -> {weight:8.2f}")
+    print(f"results written to {path}")